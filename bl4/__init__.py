@@ -0,0 +1,48 @@
+"""
+Headless BL4 save toolkit: save crypto, item serial codec, YAML helpers and
+unlock/progression edits. Importing this package never touches tkinter, so
+scripts and worker processes can use it without the GUI.
+"""
+
+from .crypto import (
+    COMPRESSION_PRESETS, EncryptWriter, compression_level, decrypt_auto, decrypt_stream, detect_platform,
+    encrypt_from_yaml, rekey, validate_user_id,
+)
+from .index import SaveIndex
+from .paths import ItemPath, path_str, set_by, tokens, walk_paths, walk_serials, walk_ug
+from .progression import SDU_GRAPH_NAME, SDU_GROUP_DEF, SDU_NODES, ensure_sdu_graph, sum_points_in_graphs
+from .save import (
+    DecryptedSave, OriginalSave, decrypt_save_file, dump_encrypted, encrypt_yaml_text, load_yaml_text, open_save_file,
+    unchanged_payload, write_backup, write_encrypted_save, write_save_bytes, yaml_text_to_plaintext,
+    yaml_text_to_save_obj,
+)
+from .serials import (
+    SERIAL_CACHE, DecodedItem, ItemColumns, ItemStats, RawFields, SerialCache, SerialRecord, bit_pack_decode,
+    bit_pack_encode, decode_item_serial, decode_item_serials, encode_item_serial, extract_and_encode_serials_from_yaml,
+    find_and_decode_serials_in_yaml, forget_serial, insert_decoded_items_in_yaml, serial_record,
+)
+from .unlocks import (
+    EMBEDDED_PROFILE_UNLOCKS, EMBEDDED_REWARD_PACKAGES, add_reward_packages, apply_profile_unlocks,
+    migrate_unlockables_to_domains, mirror_echo_skins, set_character_class, unlock_all_map_areas,
+)
+from .yamlio import LazyMapping, dump_yaml, get_yaml_loader, load_yaml_lazy, yaml_engine
+from .yamlview import LineIndex
+
+__all__ = [
+    "COMPRESSION_PRESETS", "EncryptWriter", "compression_level", "decrypt_auto", "decrypt_stream", "detect_platform",
+    "encrypt_from_yaml", "rekey", "validate_user_id",
+    "SaveIndex",
+    "ItemPath", "path_str", "set_by", "tokens", "walk_paths", "walk_serials", "walk_ug",
+    "SDU_GRAPH_NAME", "SDU_GROUP_DEF", "SDU_NODES", "ensure_sdu_graph", "sum_points_in_graphs",
+    "DecryptedSave", "OriginalSave", "decrypt_save_file", "dump_encrypted", "encrypt_yaml_text", "load_yaml_text",
+    "open_save_file", "unchanged_payload", "write_backup", "write_encrypted_save", "write_save_bytes",
+    "yaml_text_to_plaintext", "yaml_text_to_save_obj",
+    "SERIAL_CACHE", "DecodedItem", "ItemColumns", "ItemStats", "RawFields", "SerialCache", "SerialRecord",
+    "bit_pack_decode", "bit_pack_encode", "decode_item_serial", "decode_item_serials", "encode_item_serial",
+    "extract_and_encode_serials_from_yaml", "find_and_decode_serials_in_yaml", "forget_serial",
+    "insert_decoded_items_in_yaml", "serial_record",
+    "EMBEDDED_PROFILE_UNLOCKS", "EMBEDDED_REWARD_PACKAGES", "add_reward_packages", "apply_profile_unlocks",
+    "migrate_unlockables_to_domains", "mirror_echo_skins", "set_character_class", "unlock_all_map_areas",
+    "LazyMapping", "dump_yaml", "get_yaml_loader", "load_yaml_lazy", "yaml_engine",
+    "LineIndex",
+]
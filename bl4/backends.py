@@ -0,0 +1,240 @@
+"""
+Pluggable AES-ECB and zlib implementations for the save codec.
+
+Every backend produces the same bytes (AES is AES; any valid zlib stream inflates
+the same), so the choice is purely about speed. Available backends are
+microbenchmarked once per process on first use and the winner is cached.
+BL4_AES_BACKEND / BL4_ZLIB_BACKEND force a specific backend by name.
+"""
+
+import functools
+import os
+import struct
+import time
+import warnings
+import zlib
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+# ── Pure-Python AES (last resort) ─────────────────────────────────────────────
+def _aes_tables():
+    sbox = [0] * 256
+    p = q = 1
+    while True:   # walk GF(2^8) by multiplying p by 3 and q by 1/3
+        p ^= ((p << 1) ^ (0x1B if p & 0x80 else 0)) & 0xFF
+        q ^= q << 1; q ^= q << 2; q ^= q << 4; q &= 0xFF
+        if q & 0x80: q ^= 0x09
+        x = q ^ ((q << 1 | q >> 7) & 0xFF) ^ ((q << 2 | q >> 6) & 0xFF) ^ ((q << 3 | q >> 5) & 0xFF) ^ ((q << 4 | q >> 4) & 0xFF)
+        sbox[p] = x ^ 0x63
+        if p == 1: break
+    sbox[0] = 0x63
+    inv = [0] * 256
+    for i, s in enumerate(sbox): inv[s] = i
+
+    def mul(a, b):
+        r = 0
+        while b:
+            if b & 1: r ^= a
+            a = ((a << 1) ^ 0x1B) & 0xFF if a & 0x80 else a << 1
+            b >>= 1
+        return r
+
+    def rots(t0):
+        t1 = [(w >> 8) | ((w & 0xFF) << 24) for w in t0]
+        t2 = [(w >> 8) | ((w & 0xFF) << 24) for w in t1]
+        t3 = [(w >> 8) | ((w & 0xFF) << 24) for w in t2]
+        return t0, t1, t2, t3
+
+    te = rots([(mul(s, 2) << 24) | (s << 16) | (s << 8) | mul(s, 3) for s in sbox])
+    td = rots([(mul(s, 14) << 24) | (mul(s, 9) << 16) | (mul(s, 13) << 8) | mul(s, 11) for s in inv])
+    return sbox, inv, te, td
+
+
+class PurePythonAES:
+    """AES-ECB with 32-bit T-tables. Correct but ~1000x slower than a C library."""
+    _tables = None
+
+    def __init__(self, key: bytes):
+        if PurePythonAES._tables is None:
+            PurePythonAES._tables = _aes_tables()
+        sbox, _, _, (td0, td1, td2, td3) = self._tables
+        nk = len(key) // 4
+        if len(key) not in (16, 24, 32):
+            raise ValueError(f"Incorrect AES key length ({len(key)} bytes)")
+        self._rounds = nr = nk + 6
+        w = list(struct.unpack(f">{nk}I", key)); rcon = 1
+        for i in range(nk, 4 * (nr + 1)):
+            t = w[-1]
+            if i % nk == 0:
+                t = ((t << 8) & 0xFFFFFFFF) | (t >> 24)
+                t = (sbox[t >> 24] << 24 | sbox[(t >> 16) & 255] << 16 | sbox[(t >> 8) & 255] << 8 | sbox[t & 255]) ^ (rcon << 24)
+                rcon = ((rcon << 1) ^ 0x1B) & 0xFF if rcon & 0x80 else rcon << 1
+            elif nk > 6 and i % nk == 4:
+                t = sbox[t >> 24] << 24 | sbox[(t >> 16) & 255] << 16 | sbox[(t >> 8) & 255] << 8 | sbox[t & 255]
+            w.append(w[i - nk] ^ t)
+        self._ek = w
+        # equivalent inverse cipher: reversed round keys, InvMixColumns on the inner ones
+        dk = []
+        for r in range(nr, -1, -1):
+            for c in w[4 * r:4 * r + 4]:
+                if 0 < r < nr:
+                    c = td0[sbox[c >> 24]] ^ td1[sbox[(c >> 16) & 255]] ^ td2[sbox[(c >> 8) & 255]] ^ td3[sbox[c & 255]]
+                dk.append(c)
+        self._dk = dk
+
+    def _run(self, data, decrypt: bool) -> bytes:
+        if len(data) % 16:
+            raise ValueError("Data must be aligned to block boundary in ECB mode")
+        sbox, inv, te, td = self._tables
+        t0_, t1_, t2_, t3_ = td if decrypt else te
+        box = inv if decrypt else sbox
+        rk = self._dk if decrypt else self._ek
+        nr = self._rounds
+        o1, o3 = (3, 1) if decrypt else (1, 3)
+        words = struct.unpack(f">{len(data) // 4}I", data)
+        out = []
+        for b in range(0, len(words), 4):
+            s0, s1, s2, s3 = words[b] ^ rk[0], words[b + 1] ^ rk[1], words[b + 2] ^ rk[2], words[b + 3] ^ rk[3]
+            k = 4
+            for _ in range(nr - 1):
+                if decrypt:
+                    s0, s1, s2, s3 = (
+                        t0_[s0 >> 24] ^ t1_[(s3 >> 16) & 255] ^ t2_[(s2 >> 8) & 255] ^ t3_[s1 & 255] ^ rk[k],
+                        t0_[s1 >> 24] ^ t1_[(s0 >> 16) & 255] ^ t2_[(s3 >> 8) & 255] ^ t3_[s2 & 255] ^ rk[k + 1],
+                        t0_[s2 >> 24] ^ t1_[(s1 >> 16) & 255] ^ t2_[(s0 >> 8) & 255] ^ t3_[s3 & 255] ^ rk[k + 2],
+                        t0_[s3 >> 24] ^ t1_[(s2 >> 16) & 255] ^ t2_[(s1 >> 8) & 255] ^ t3_[s0 & 255] ^ rk[k + 3])
+                else:
+                    s0, s1, s2, s3 = (
+                        t0_[s0 >> 24] ^ t1_[(s1 >> 16) & 255] ^ t2_[(s2 >> 8) & 255] ^ t3_[s3 & 255] ^ rk[k],
+                        t0_[s1 >> 24] ^ t1_[(s2 >> 16) & 255] ^ t2_[(s3 >> 8) & 255] ^ t3_[s0 & 255] ^ rk[k + 1],
+                        t0_[s2 >> 24] ^ t1_[(s3 >> 16) & 255] ^ t2_[(s0 >> 8) & 255] ^ t3_[s1 & 255] ^ rk[k + 2],
+                        t0_[s3 >> 24] ^ t1_[(s0 >> 16) & 255] ^ t2_[(s1 >> 8) & 255] ^ t3_[s2 & 255] ^ rk[k + 3])
+                k += 4
+            st = (s0, s1, s2, s3)
+            for i in range(4):   # last round: SubBytes/ShiftRows (inverse when decrypting) + key
+                out.append((box[st[i] >> 24] << 24 | box[(st[(i + o1) & 3] >> 16) & 255] << 16
+                            | box[(st[(i + 2) & 3] >> 8) & 255] << 8 | box[st[(i + o3) & 3] & 255]) ^ rk[k + i])
+        return struct.pack(f">{len(out)}I", *out)
+
+    def encrypt(self, data) -> bytes:
+        return self._run(data, False)
+
+    def decrypt(self, data) -> bytes:
+        return self._run(data, True)
+
+
+# ── AES backends ──────────────────────────────────────────────────────────────
+class _CryptographyECB:
+    """`cryptography` contexts wrapped to the pycryptodome encrypt()/decrypt() shape."""
+    def __init__(self, key: bytes):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        c = Cipher(algorithms.AES(key), modes.ECB())
+        self._enc = c.encryptor(); self._dec = c.decryptor()
+
+    def encrypt(self, data) -> bytes:
+        if len(data) % 16: raise ValueError("Data must be aligned to block boundary in ECB mode")
+        return self._enc.update(data)
+
+    def decrypt(self, data) -> bytes:
+        if len(data) % 16: raise ValueError("Data must be aligned to block boundary in ECB mode")
+        return self._dec.update(data)
+
+
+def _load_pycryptodome():
+    from Crypto.Cipher import AES
+    return lambda key: AES.new(key, AES.MODE_ECB)
+
+def _load_cryptography():
+    import cryptography.hazmat.primitives.ciphers  # noqa: F401
+    return _CryptographyECB
+
+# name -> loader; a loader returns a cipher factory (key -> object with encrypt/decrypt)
+# or raises ImportError. Fallbacks are only used when nothing else loads.
+AES_BACKENDS: Dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    "pycryptodome": _load_pycryptodome,
+    "cryptography": _load_cryptography,
+    "python": lambda: PurePythonAES,
+}
+_AES_FALLBACKS = ("python",)
+
+
+# ── zlib backends ─────────────────────────────────────────────────────────────
+class ZlibBackend(NamedTuple):
+    name: str
+    module: Any       # zlib-compatible: compressobj(level), decompressobj(), error
+    max_level: int
+
+def _load_zlib_ng():
+    from zlib_ng import zlib_ng
+    return zlib_ng, 9
+
+def _load_isal():
+    from isal import isal_zlib
+    return isal_zlib, isal_zlib.ISAL_BEST_COMPRESSION
+
+ZLIB_BACKENDS: Dict[str, Callable[[], Tuple[Any, int]]] = {
+    "zlib-ng": _load_zlib_ng,
+    "isal": _load_isal,
+    "zlib": lambda: (zlib, 9),
+}
+
+
+# ── Selection (microbenchmark once, cache the winner) ─────────────────────────
+_BENCH_ROUNDS = 3
+_BENCH_TEXT = b"".join(b"  - slot_%d: {serial: '@Ug%07d', level: %d, flags: %d}\n" % (i, i * 7919 % 10**7, i % 60, i % 17)
+                       for i in range(2000))
+
+def _best(candidates: List[Tuple[str, Any]], run: Callable[[Any], Any]) -> Tuple[str, Any]:
+    if len(candidates) == 1:
+        return candidates[0]
+    def timed(obj):
+        best = float("inf")
+        for _ in range(_BENCH_ROUNDS):
+            t0 = time.perf_counter(); run(obj); best = min(best, time.perf_counter() - t0)
+        return best
+    return min(candidates, key=lambda c: timed(c[1]))
+
+def _available(registry: Dict[str, Callable[[], Any]], forced_env: str) -> List[Tuple[str, Any]]:
+    forced = os.environ.get(forced_env, "").strip().lower()
+    if forced:
+        if forced not in registry:
+            raise RuntimeError(f"{forced_env}={forced!r}: unknown backend (choose from {', '.join(registry)})")
+        return [(forced, registry[forced]())]
+    found = []
+    for name, load in registry.items():
+        try:
+            found.append((name, load()))
+        except ImportError:
+            pass
+    return found
+
+@functools.lru_cache(maxsize=None)
+def aes_backend() -> Tuple[str, Callable[[bytes], Any]]:
+    """(name, cipher factory) of the fastest AES-ECB implementation available."""
+    found = _available(AES_BACKENDS, "BL4_AES_BACKEND")
+    fast = [c for c in found if c[0] not in _AES_FALLBACKS] or found
+    if fast[0][0] in _AES_FALLBACKS and not os.environ.get("BL4_AES_BACKEND"):
+        warnings.warn("no AES library found, using the slow pure-Python AES (pip install pycryptodome)",
+                      RuntimeWarning, stacklevel=2)
+    block = _BENCH_TEXT[:len(_BENCH_TEXT) // 16 * 16]
+    return _best(fast, lambda factory: factory(bytes(32)).encrypt(block))
+
+@functools.lru_cache(maxsize=None)
+def deflate_backend(level: int = 9) -> ZlibBackend:
+    """Fastest zlib implementation that supports compression `level`."""
+    found = [(n, ZlibBackend(n, m, top)) for n, (m, top) in _available(ZLIB_BACKENDS, "BL4_ZLIB_BACKEND") if top >= level]
+    if not found:   # a forced backend that can't do this level
+        return ZlibBackend("zlib", zlib, 9)
+    def run(b: ZlibBackend):
+        c = b.module.compressobj(level); c.compress(_BENCH_TEXT); c.flush()
+    return _best(found, run)[1]
+
+@functools.lru_cache(maxsize=None)
+def inflate_backend() -> ZlibBackend:
+    """Fastest zlib implementation for decompression."""
+    found = [(n, ZlibBackend(n, m, top)) for n, (m, top) in _available(ZLIB_BACKENDS, "BL4_ZLIB_BACKEND")]
+    packed = zlib.compress(_BENCH_TEXT, 9)
+    return _best(found, lambda b: b.module.decompressobj().decompress(packed))[1]
+
+def describe() -> str:
+    """One-line summary of the selected backends, e.g. for a startup log."""
+    return f"aes={aes_backend()[0]} deflate={deflate_backend().name} inflate={inflate_backend().name}"
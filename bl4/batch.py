@@ -0,0 +1,171 @@
+"""
+Batch jobs over directories of saves, fanned out on a process pool.
+Workers are top-level functions (picklable) that return a FileResult instead of
+raising, so one bad save never aborts the run.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import trace
+from .crypto import _source_platform, decrypt_auto, encrypt_from_yaml, rekey
+from .save import load_yaml_text, write_backup, write_encrypted_save, write_save_bytes, yaml_text_to_save_obj
+from .yamlio import dump_yaml
+
+
+class FileResult(NamedTuple):
+    path: str
+    ok: bool
+    nbytes: int
+    seconds: float
+    message: str
+
+
+class BatchSummary(NamedTuple):
+    total: int
+    ok: int
+    failed: int
+    nbytes: int
+    seconds: float
+
+    @property
+    def files_per_s(self) -> float:
+        return self.total / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.nbytes / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+
+def find_files(directory: Path, pattern: str, recursive: bool = False) -> List[Path]:
+    directory = Path(directory)
+    it = directory.rglob(pattern) if recursive else directory.glob(pattern)
+    return sorted(p for p in it if p.is_file())
+
+
+def _reason(e: Exception) -> str:
+    lines = [ln.strip() for ln in str(e).splitlines() if ln.strip()]
+    attempts = [ln for ln in lines if ln.startswith(("Epic Games attempt", "Steam attempt"))]
+    return " | ".join(attempts) if attempts else (lines[0] if lines else type(e).__name__)
+
+
+def decrypt_file(path: str, user_id: str) -> FileResult:
+    """Decrypt <name>.sav to <name>.yaml next to it."""
+    t0 = time.perf_counter(); p = Path(path); size = 0
+    try:
+        enc = p.read_bytes(); size = len(enc)
+        plain, plat = decrypt_auto(enc, user_id)
+        out = p.with_suffix(".yaml"); out.write_bytes(plain)
+        return FileResult(path, True, size, time.perf_counter() - t0, f"{plat} → {out.name}")
+    except Exception as e:
+        return FileResult(path, False, size, time.perf_counter() - t0, _reason(e))
+
+
+def encrypt_file(path: str, user_id: str, platform: str = "auto", backup: bool = True, level: int = 9,
+                 threads: int = 1) -> FileResult:
+    """Encrypt <name>.yaml to <name>.sav, backing up an existing .sav first.
+    platform="auto" re-uses the platform of the existing .sav."""
+    t0 = time.perf_counter(); p = Path(path); size = 0
+    try:
+        raw = p.read_bytes(); size = len(raw)
+        txt = raw.decode("utf-8", "ignore")
+        out = p.with_suffix(".sav")
+        plat = platform
+        if plat == "auto":
+            if not out.exists():
+                raise ValueError(f"platform unknown: no {out.name} to detect from (pass --platform)")
+            with out.open("rb") as f:
+                plat = _source_platform(f.read(16), user_id, out.read_bytes)
+        obj = yaml_text_to_save_obj(txt)
+        bak = write_backup(out, out.read_bytes()) if backup and out.exists() else None
+        write_encrypted_save(out, obj, plat, user_id, level, threads)
+        note = f" (backup {bak.name})" if bak else ""
+        return FileResult(path, True, size, time.perf_counter() - t0, f"{plat} → {out.name}{note}")
+    except Exception as e:
+        return FileResult(path, False, size, time.perf_counter() - t0, _reason(e))
+
+
+def roundtrip_file(path: str, user_id: str) -> FileResult:
+    """Decrypt, parse, re-dump, re-encrypt and decrypt again in memory; nothing is written."""
+    t0 = time.perf_counter(); p = Path(path); size = 0
+    try:
+        enc = p.read_bytes(); size = len(enc)
+        plain, plat = decrypt_auto(enc, user_id)
+        obj = load_yaml_text(plain.decode("utf-8", "ignore"))
+        yb = dump_yaml(obj).encode()
+        again, plat2 = decrypt_auto(encrypt_from_yaml(yb, plat, user_id), user_id)
+        if again != yb or plat2 != plat:
+            raise ValueError("re-encrypted save does not decrypt to the same YAML")
+        return FileResult(path, True, size, time.perf_counter() - t0, f"{plat} ok ({len(plain)} → {len(yb)} bytes YAML)")
+    except Exception as e:
+        return FileResult(path, False, size, time.perf_counter() - t0, _reason(e))
+
+
+def rekey_file(path: str, src_uid: str, dst_platform: str, dst_uid: str, backup: bool = True) -> FileResult:
+    """Re-encrypt a .sav in place for another platform/account (no YAML, no zlib)."""
+    t0 = time.perf_counter(); p = Path(path); size = 0
+    try:
+        enc = p.read_bytes(); size = len(enc)
+        src = _source_platform(enc, src_uid)
+        out = rekey(enc, src_uid, dst_platform, dst_uid, src)
+        bak = write_backup(p, enc) if backup else None
+        write_save_bytes(p, out)
+        note = f" (backup {bak.name})" if bak else ""
+        return FileResult(path, True, size, time.perf_counter() - t0, f"{src} → {dst_platform}{note}")
+    except Exception as e:
+        return FileResult(path, False, size, time.perf_counter() - t0, _reason(e))
+
+
+class LevelStat(NamedTuple):
+    level: int
+    seconds: float   # summed over all saves, best of `rounds` each
+    nbytes: int      # summed encrypted size
+    raw: int         # summed plaintext size
+
+
+def compression_profile(saves: List[Tuple[bytes, str]], user_id: str,
+                        levels: Iterable[int] = range(1, 10), rounds: int = 3) -> List[LevelStat]:
+    """Time encrypt_from_yaml at each zlib level over (plaintext, platform) pairs, in-process and sequentially."""
+    raw = sum(len(pt) for pt, _ in saves)
+    stats = []
+    for level in levels:
+        seconds = 0.0; nbytes = 0
+        for pt, plat in saves:
+            best = float("inf")
+            for _ in range(max(1, rounds)):
+                t0 = time.perf_counter(); enc = encrypt_from_yaml(pt, plat, user_id, level)
+                best = min(best, time.perf_counter() - t0)
+            seconds += best; nbytes += len(enc)
+        stats.append(LevelStat(level, seconds, nbytes, raw))
+    return stats
+
+
+def _call(worker: Callable[..., FileResult], path: str, *args) -> FileResult:
+    with trace.context(file=path):
+        res = worker(path, *args)
+        trace.record("file", res.seconds, worker=worker.__name__, ok=res.ok, bytes=res.nbytes)
+    return res
+
+
+def run_batch(worker: Callable[..., FileResult], paths: Iterable[Path], *args,
+              jobs: Optional[int] = None, on_result: Optional[Callable[[FileResult], None]] = None) -> BatchSummary:
+    """Run worker(str(path), *args) for every path; jobs=1 runs in-process."""
+    paths = [str(p) for p in paths]
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    t0 = time.perf_counter()
+    ok = nbytes = 0
+    def _take(res: FileResult):
+        nonlocal ok, nbytes
+        ok += res.ok; nbytes += res.nbytes
+        if on_result: on_result(res)
+    if jobs == 1 or len(paths) <= 1:
+        for p in paths:
+            _take(_call(worker, p, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+            for fut in as_completed([pool.submit(_call, worker, p, *args) for p in paths]):
+                _take(fut.result())
+    return BatchSummary(len(paths), ok, len(paths) - ok, nbytes, time.perf_counter() - t0)
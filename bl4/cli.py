@@ -0,0 +1,140 @@
+"""
+Command line entry point:  python -m bl4 [--debug] {decrypt,encrypt,roundtrip,rekey,bench} DIR --user-id ID [--jobs N]
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from . import trace
+from .batch import (
+    BatchSummary, FileResult, compression_profile, decrypt_file, encrypt_file, find_files, rekey_file,
+    roundtrip_file, run_batch,
+)
+from .crypto import COMPRESSION_PRESETS, DEFAULT_COMPRESSION, compression_level, decrypt_auto
+from .yamlio import yaml_engine
+
+app = typer.Typer(help="Batch BL4 save tools (decrypt / encrypt / roundtrip / rekey whole directories).",
+                  no_args_is_help=True, add_completion=False)
+
+_USER_ID = typer.Option(..., "--user-id", "-u", envvar="BL4_USER_ID",
+                        help="Epic account id or Steam ID64 (env: BL4_USER_ID).")
+_JOBS = typer.Option(None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count).")
+_RECURSIVE = typer.Option(False, "--recursive", "-r", help="Descend into sub-directories.")
+
+
+@app.callback()
+def _options(debug: bool = typer.Option(False, "--debug", help="Trace pipeline stages as JSON lines "
+                                        "(stderr, or the file named by BL4_TRACE).")):
+    if debug:
+        target = os.environ.get("BL4_TRACE", "").strip() or "stderr"
+        os.environ["BL4_TRACE"] = target   # worker processes enable themselves from the env
+        trace.enable(target)
+        typer.echo(f"YAML engine: {yaml_engine()}", err=True)
+
+
+def _echo_result(res: FileResult) -> None:
+    tag = typer.style(" OK ", fg="green") if res.ok else typer.style("FAIL", fg="red")
+    typer.echo(f"[{tag}] {res.path}  {res.seconds*1000:.0f} ms  {res.message}")
+
+
+def _finish(s: BatchSummary) -> None:
+    typer.echo(f"{s.total} file(s): {s.ok} ok, {s.failed} failed in {s.seconds:.2f} s "
+               f"— {s.files_per_s:.1f} files/s, {s.mb_per_s:.2f} MB/s")
+    if s.failed:
+        raise typer.Exit(1)
+
+
+def _run(worker, directory: Path, pattern: str, recursive: bool, jobs: Optional[int], *args) -> None:
+    files = find_files(directory, pattern, recursive)
+    if not files:
+        typer.echo(f"No {pattern} files in {directory}")
+        raise typer.Exit(1)
+    _finish(run_batch(worker, files, *args, jobs=jobs, on_result=_echo_result))
+
+
+@app.command()
+def decrypt(directory: Path = typer.Argument(..., exists=True, file_okay=False),
+            user_id: str = _USER_ID, jobs: Optional[int] = _JOBS, recursive: bool = _RECURSIVE,
+            pattern: str = typer.Option("*.sav", help="Glob for save files.")):
+    """Decrypt every save to <name>.yaml next to it."""
+    _run(decrypt_file, directory, pattern, recursive, jobs, user_id)
+
+
+@app.command()
+def encrypt(directory: Path = typer.Argument(..., exists=True, file_okay=False),
+            user_id: str = _USER_ID, jobs: Optional[int] = _JOBS, recursive: bool = _RECURSIVE,
+            pattern: str = typer.Option("*.yaml", help="Glob for YAML files."),
+            platform: str = typer.Option("auto", help="epic, steam, or auto (from the existing .sav)."),
+            backup: bool = typer.Option(True, help="Back up an existing .sav before overwriting it."),
+            level: str = typer.Option(DEFAULT_COMPRESSION, "--level", "-l",
+                                      help="Compression: fast, balanced, max, or a zlib level 0-9."),
+            threads: int = typer.Option(1, "--threads", "-t", min=1,
+                                        help="Deflate threads per file (parallel blocks; useful with --jobs 1).")):
+    """Encrypt every <name>.yaml back to <name>.sav."""
+    platform = platform.lower()
+    if platform not in ("auto", "epic", "steam"):
+        raise typer.BadParameter("platform must be epic, steam or auto", param_hint="--platform")
+    try:
+        lvl = compression_level(level)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--level")
+    _run(encrypt_file, directory, pattern, recursive, jobs, user_id, platform, backup, lvl, threads)
+
+
+@app.command()
+def roundtrip(directory: Path = typer.Argument(..., exists=True, file_okay=False),
+              user_id: str = _USER_ID, jobs: Optional[int] = _JOBS, recursive: bool = _RECURSIVE,
+              pattern: str = typer.Option("*.sav", help="Glob for save files.")):
+    """Decrypt → YAML → encrypt → decrypt in memory and verify; writes nothing."""
+    _run(roundtrip_file, directory, pattern, recursive, jobs, user_id)
+
+
+@app.command()
+def rekey(directory: Path = typer.Argument(..., exists=True, file_okay=False),
+          user_id: str = _USER_ID, jobs: Optional[int] = _JOBS, recursive: bool = _RECURSIVE,
+          pattern: str = typer.Option("*.sav", help="Glob for save files."),
+          to_platform: str = typer.Option(..., "--to-platform", help="Target platform: epic or steam."),
+          to_user_id: str = typer.Option(..., "--to-user-id", help="Target Epic account id or Steam ID64."),
+          backup: bool = typer.Option(True, help="Back up each .sav before overwriting it.")):
+    """Re-encrypt every save in place for another platform/account (no YAML round trip)."""
+    to_platform = to_platform.lower()
+    if to_platform not in ("epic", "steam"):
+        raise typer.BadParameter("platform must be epic or steam", param_hint="--to-platform")
+    _run(rekey_file, directory, pattern, recursive, jobs, user_id, to_platform, to_user_id, backup)
+
+
+@app.command()
+def bench(directory: Path = typer.Argument(..., exists=True, file_okay=False),
+          user_id: str = _USER_ID, recursive: bool = _RECURSIVE,
+          pattern: str = typer.Option("*.sav", help="Glob for save files."),
+          rounds: int = typer.Option(3, min=1, help="Timed runs per save and level (best is kept).")):
+    """Measure encrypt time and .sav size for every compression level on your own saves."""
+    saves = []
+    for f in find_files(directory, pattern, recursive):
+        try:
+            plain, plat = decrypt_auto(f.read_bytes(), user_id)
+            saves.append((plain, plat))
+        except Exception as e:
+            _echo_result(FileResult(str(f), False, 0, 0.0, str(e).splitlines()[0]))
+    if not saves:
+        typer.echo(f"No decryptable {pattern} files in {directory}")
+        raise typer.Exit(1)
+    stats = compression_profile(saves, user_id, rounds=rounds)
+    names = {v: k for k, v in COMPRESSION_PRESETS.items()}
+    ref = next(s for s in stats if s.level == compression_level(DEFAULT_COMPRESSION))
+    typer.echo(f"{len(saves)} save(s), {ref.raw / 1024:.0f} KiB of YAML, best of {rounds}:")
+    typer.echo(f"{'level':>5}  {'preset':<9}{'encrypt ms':>11}{'.sav KiB':>10}{'ratio':>7}{'time vs ' + DEFAULT_COMPRESSION:>14}{'size vs ' + DEFAULT_COMPRESSION:>14}")
+    for s in stats:
+        typer.echo(f"{s.level:>5}  {names.get(s.level, ''):<9}{s.seconds * 1000:>11.1f}{s.nbytes / 1024:>10.1f}"
+                   f"{s.raw / max(1, s.nbytes):>7.1f}{s.seconds / max(ref.seconds, 1e-9):>13.2f}x{s.nbytes / ref.nbytes:>13.3f}x")
+
+
+def main() -> None:
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+"""
+Save container codec: AES-256-ECB over a zlib stream with an 8-byte trailer
+(Adler-32 of the plaintext + plaintext length). Epic saves store the checksum
+big-endian, Steam saves little-endian.
+"""
+
+import collections
+import functools
+import io
+import os
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from . import trace
+from .backends import aes_backend, deflate_backend, inflate_backend
+
+# ── Crypto (AES/zlib implementations are picked in .backends) ─────────────────
+PUBLIC_KEY = bytes((0x35,0xEC,0x33,0x77,0xF3,0x5D,0xB0,0xEA,0xBE,0x6B,0x83,0x11,0x54,0x03,0xEB,0xFB,
+                    0x27,0x25,0x64,0x2E,0xD5,0x49,0x06,0x29,0x05,0x78,0xBD,0x60,0xBA,0x4A,0xA7,0x87))
+def _key_epic(uid:str)->bytes:
+    wid=uid.strip().encode("utf-16le")
+    k=bytearray(PUBLIC_KEY)
+    n=min(len(wid), len(k))
+    for i in range(n):
+        k[i] ^= wid[i]
+    return bytes(k)
+def _key_steam(uid:str)->bytes:
+    digits=''.join(ch for ch in uid if ch.isdigit())
+    sid=int(digits or "0",10).to_bytes(8,"little",signed=False)
+    k=bytearray(PUBLIC_KEY)
+    for i, b in enumerate(sid):
+        k[i % len(k)] ^= b
+    return bytes(k)
+def _strip_pkcs7(buf:bytes)->bytes:
+    n=buf[-1]
+    if 1<=n<=16 and all(buf[-i]==n for i in range(1,n+1)): return buf[:-n]
+    return buf
+# Derived keys and ECB cipher objects are cached per process: a GUI session or a
+# batch worker derives each (platform, uid) key and builds its cipher only once.
+@functools.lru_cache(maxsize=32)
+def _platform_key(platform: str, user_id: str) -> bytes:
+    return _key_epic(user_id) if platform == "epic" else _key_steam(user_id)
+@functools.lru_cache(maxsize=32)
+def _cipher(key: bytes):
+    return aes_backend()[1](key)
+def _cipher_for(platform: str, user_id: str):
+    return _cipher(_platform_key(platform, user_id))
+# ── Streaming decrypt ─────────────────────────────────────────────────────────
+_STREAM_CHUNK = 1 << 16      # ciphertext bytes per AES call; multiple of 16
+_LOOK_BEHIND = 16 + 8        # last pad block + trailer, held back from the inflater
+
+def _cipher_chunks(src, chunk_size: int) -> Iterator[bytes]:
+    """Ciphertext in chunks from bytes-like data (zero-copy slices) or a binary file/mmap."""
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        mv = memoryview(src)
+        for i in range(0, len(mv), chunk_size): yield mv[i:i + chunk_size]
+        return
+    while True:
+        b = src.read(chunk_size)
+        if not b: return
+        yield b
+
+def iter_plaintext(src, key: bytes, checksum_be: bool, chunk_size: int = _STREAM_CHUNK) -> Iterator[bytes]:
+    """
+    Decrypt a save incrementally and yield plaintext chunks as zlib produces them.
+    AES-ECB runs chunk by chunk straight into a decompressobj; Adler-32 and length
+    are accumulated on the way. The final 24 decrypted bytes are held back until EOF
+    so the PKCS7 padding and trailer never reach the inflater. Length is verified
+    (ValueError) once the stream is exhausted. With tracing on, per-stage time is
+    summed over the chunks and reported as aes/unpad/inflate/checksum spans.
+    """
+    aes = _cipher(key)
+    zb = inflate_backend(); inflater = zb.module.decompressobj()
+    adler = 1; n = 0; total = 0; carry = b""; tail = b""
+    clock = time.perf_counter if trace.enabled() else None
+    t_aes = t_inflate = t_sum = 0.0
+
+    def _inflate(data):
+        try:
+            return inflater.decompress(data)
+        except zb.module.error as e:
+            raise ValueError(f"Zlib decompression failed: {e}") from None
+
+    for chunk in _cipher_chunks(src, chunk_size):
+        total += len(chunk)
+        if carry: chunk = carry + bytes(chunk)
+        cut = len(chunk) - len(chunk) % 16
+        carry = bytes(chunk[cut:])
+        if not cut: continue
+        if clock: t0 = clock()
+        dec = tail + aes.decrypt(chunk[:cut])
+        if clock: t1 = clock(); t_aes += t1 - t0
+        tail = dec[-_LOOK_BEHIND:]
+        if len(dec) > _LOOK_BEHIND and not inflater.eof:
+            out = _inflate(dec[:-_LOOK_BEHIND])
+            if clock: t2 = clock(); t_inflate += t2 - t1
+            if out:
+                adler = zlib.adler32(out, adler); n += len(out)
+                if clock: t_sum += clock() - t2
+                yield out
+
+    if not total or total % 16:
+        raise ValueError(f"AES decryption failed: ciphertext length {total} is not a positive multiple of 16")
+    if clock: trace.record("aes", t_aes, bytes=total, backend=aes_backend()[0]); t0 = clock()
+    unp = _strip_pkcs7(tail)
+    if total - len(tail) + len(unp) < 8:
+        raise ValueError(f"data too short after padding removal: {total - len(tail) + len(unp)} bytes (need at least 8)")
+    trailer = unp[-8:]
+    chk = int.from_bytes(trailer[:4], "big" if checksum_be else "little")
+    ln = int.from_bytes(trailer[4:], "little")
+    if clock: trace.record("unpad", clock() - t0, padding=len(tail) - len(unp), expected_length=ln); t0 = clock()
+
+    out = _inflate(unp[:-8]) if not inflater.eof else b""
+    out += inflater.flush()
+    if not inflater.eof:
+        raise ValueError("Zlib decompression failed: incomplete or truncated stream")
+    if clock: t1 = clock(); t_inflate += t1 - t0
+    if out:
+        adler = zlib.adler32(out, adler); n += len(out)
+        if clock: t_sum += clock() - t1
+        yield out
+    adler &= 0xFFFFFFFF
+    if clock:
+        trace.record("inflate", t_inflate, bytes_in=total, bytes_out=n, backend=zb.name)
+        trace.record("checksum", t_sum, bytes=n, adler32=adler, expected=chk, ok=adler == chk,
+                     endian="big" if checksum_be else "little", length_ok=n == ln)
+
+    # Checksum mismatches are tolerated (see version compatibility notes); only the trace reports them
+    if n != ln:
+        raise ValueError(f"length mismatch: got {n}, expected {ln}")
+
+def _try_once(key:bytes, enc, checksum_be:bool)->bytes:
+    buf = io.BytesIO()
+    for part in iter_plaintext(enc, key, checksum_be): buf.write(part)
+    return buf.getvalue()
+def validate_user_id(user_id: str) -> Tuple[bool, str]:
+    """
+    Validate user ID format for Epic Games or Steam.
+    Returns (is_valid, error_message)
+    """
+    if not user_id or not user_id.strip():
+        return False, "User ID cannot be empty"
+    
+    user_id = user_id.strip()
+    
+    # Check if it looks like a Steam ID (all digits, typically 17 digits)
+    if user_id.isdigit():
+        if len(user_id) < 10:
+            return False, "Steam ID appears too short (should be 17 digits)"
+        elif len(user_id) > 20:
+            return False, "Steam ID appears too long (should be 17 digits)"
+        return True, "Valid Steam ID format"
+    
+    # Check if it looks like an Epic Games ID (alphanumeric, typically 32 characters)
+    if user_id.replace('-', '').replace('_', '').isalnum():
+        if len(user_id) < 10:
+            return False, "Epic Games ID appears too short"
+        elif len(user_id) > 50:
+            return False, "Epic Games ID appears too long"
+        return True, "Valid Epic Games ID format"
+    
+    return False, "User ID contains invalid characters. Should be alphanumeric for Epic Games or digits only for Steam"
+
+# ── Platform detection (first AES block only) ─────────────────────────────────
+# (platform, checksum stored big-endian)
+_PLATFORMS = (("epic", True), ("steam", False))
+
+def _zlib_header_ok(head: bytes) -> bool:
+    """RFC 1950 header: CM=8 (deflate), CINFO<=7, FCHECK valid, no preset dictionary."""
+    cmf, flg = head[0], head[1]
+    return (cmf & 0x0F) == 8 and (cmf >> 4) <= 7 and ((cmf << 8) | flg) % 31 == 0 and not flg & 0x20
+
+def detect_platform(enc: bytes, user_id: str) -> List[str]:
+    """Return the platforms whose key turns the first AES block into a zlib header,
+    in try order. Costs one 16-byte decrypt per candidate key."""
+    if len(enc) < 16 or len(enc) % 16:
+        return []
+    return [plat for plat, _ in _PLATFORMS if _zlib_header_ok(_cipher_for(plat, user_id).decrypt(enc[:16]))]
+
+def decrypt_auto(enc:bytes, user_id:str):
+    # Validate user ID format first
+    is_valid, validation_msg = validate_user_id(user_id)
+    if not is_valid:
+        raise ValueError(f"Invalid User ID format: {validation_msg}")
+
+    # Only the key(s) that yield a zlib header get the full decrypt
+    if len(enc) < 16 or len(enc) % 16:
+        reason = f"ciphertext length {len(enc)} is not a positive multiple of 16"
+        errors = {plat: reason for plat, _ in _PLATFORMS}
+    else:
+        with trace.span("detect") as sp:
+            candidates = detect_platform(enc, user_id); sp.set(candidates=candidates)
+        errors = {plat: "first block is not a zlib header (wrong key for this platform)"
+                  for plat, _ in _PLATFORMS if plat not in candidates}
+        for plat, checksum_be in _PLATFORMS:
+            if plat not in candidates:
+                continue
+            try:
+                with trace.span("attempt", platform=plat, bytes=len(enc)):
+                    return _try_once(_platform_key(plat, user_id),enc,checksum_be),plat
+            except Exception as e:
+                errors[plat] = str(e)
+
+    raise ValueError(_decrypt_error(errors))
+
+def _decrypt_error(errors) -> str:
+    # Both failed - provide detailed error message
+    error_msg = "Failed to decrypt save file. This usually means:\n"
+    error_msg += "1. Incorrect User ID - Make sure you're using the right Epic Games or Steam User ID\n"
+    error_msg += "2. Corrupted save file - The save file may be damaged\n"
+    error_msg += "3. Wrong save file - This might not be a valid BL4 save file\n\n"
+    error_msg += f"Epic Games attempt: {errors['epic']}\n"
+    error_msg += f"Steam attempt: {errors['steam']}\n\n"
+    error_msg += "For Epic Games: Use your Epic Games User ID (not display name)\n"
+    error_msg += "For Steam: Use your Steam ID64 number"
+    return error_msg
+
+def decrypt_stream(src, user_id: str, chunk_size: int = _STREAM_CHUNK) -> Tuple[str, Iterator[bytes]]:
+    """
+    Streaming counterpart of decrypt_auto: returns (platform, plaintext chunk iterator).
+    src is bytes-like or a seekable binary file/mmap positioned at the start of the save.
+    The platform is picked from the first block alone, so there is no fallback to the
+    other key if the full decrypt later fails.
+    """
+    is_valid, validation_msg = validate_user_id(user_id)
+    if not is_valid:
+        raise ValueError(f"Invalid User ID format: {validation_msg}")
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        head = bytes(src[:16])
+    else:
+        pos = src.tell(); head = src.read(16); src.seek(pos)
+    candidates = detect_platform(head, user_id)
+    if not candidates:
+        reason = "first block is not a zlib header (wrong key for this platform)"
+        raise ValueError(_decrypt_error({plat: reason for plat, _ in _PLATFORMS}))
+    plat = candidates[0]
+    return plat, iter_plaintext(src, _platform_key(plat, user_id), dict(_PLATFORMS)[plat], chunk_size)
+
+# ── Streaming encrypt ─────────────────────────────────────────────────────────
+# Named zlib levels for encrypt. The game reads any level; "max" is what saves
+# have always been written with.
+COMPRESSION_PRESETS = {"fast": 1, "balanced": 6, "max": 9}
+DEFAULT_COMPRESSION = "max"
+
+def compression_level(spec=DEFAULT_COMPRESSION) -> int:
+    """Preset name ("fast"/"balanced"/"max") or zlib level 0-9 (int or digit string) → level."""
+    if isinstance(spec, str):
+        name = spec.strip().lower()
+        if name in COMPRESSION_PRESETS: return COMPRESSION_PRESETS[name]
+        if not name.isdigit():
+            raise ValueError(f"unknown compression {spec!r} (use {', '.join(COMPRESSION_PRESETS)} or 0-9)")
+        spec = int(name)
+    if not 0 <= spec <= 9:
+        raise ValueError(f"compression level must be 0-9, got {spec}")
+    return spec
+
+# Parallel deflate (pigz-style): the plaintext is cut into blocks that are
+# raw-deflated on a thread pool (zlib releases the GIL), each primed with the
+# previous 32 KiB as dictionary and ended on a sync-flush byte boundary, so the
+# concatenation is one ordinary zlib stream.
+_PAR_BLOCK = 1 << 17
+_PAR_MIN = 4 * _PAR_BLOCK   # threads=None: smaller inputs aren't worth a pool and stay single-threaded
+_WINDOW = 1 << 15
+_ADLER_BASE = 65521
+
+def adler32_combine(adler1: int, adler2: int, len2: int) -> int:
+    """Adler-32 of A+B from adler32(A), adler32(B) and len(B) (zlib's adler32_combine)."""
+    rem = len2 % _ADLER_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = rem * sum1 % _ADLER_BASE
+    sum1 = (sum1 + (adler2 & 0xFFFF) + _ADLER_BASE - 1) % _ADLER_BASE
+    sum2 = (sum2 + ((adler1 >> 16) & 0xFFFF) + ((adler2 >> 16) & 0xFFFF) + _ADLER_BASE - rem) % _ADLER_BASE
+    return sum1 | (sum2 << 16)
+
+def _deflate_block(module, level: int, data, zdict: bytes, final: bool) -> Tuple[bytes, int, int]:
+    c = module.compressobj(level, zlib.DEFLATED, -15, zdict=zdict) if zdict else module.compressobj(level, zlib.DEFLATED, -15)
+    out = c.compress(data) + c.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+    return out, zlib.adler32(data), len(data)
+
+class EncryptWriter:
+    """
+    Write-only text/binary sink that encrypts a save on the fly:
+    plaintext → zlib.compressobj → whole 16-byte blocks → AES-ECB → dest.
+    Adler-32 and length are accumulated as data passes through; close() appends
+    the trailer and PKCS7 padding. dest is a binary file or a callable(bytes).
+    Pass it as the stream to yamlio.dump_yaml (str writes are UTF-8 encoded).
+    threads > 1 deflates blocks in parallel (still one valid zlib stream, but not
+    byte-identical to the single-threaded output). None picks from the input size:
+    one thread per CPU once _PAR_MIN bytes have been written, else one thread.
+    """
+    def __init__(self, dest, platform: str, user_id: str, level: int = 9, threads: Optional[int] = 1):
+        self._aes = _cipher_for(platform, user_id)
+        self._out = dest if callable(dest) else dest.write
+        self._be = platform == "epic"
+        self._level = level; self._zlib = deflate_backend(level).module
+        self._text = []; self._text_len = 0     # small writes (the YAML emitter writes per token)
+        self._blocks = bytearray()              # compressed bytes not yet encrypted
+        self.adler = 1; self.length = 0; self.closed = False
+        self._span = trace.span("encrypt", platform=platform, level=level).__enter__()
+        self._auto = threads is None
+        if self._auto:
+            self._threads = 1; self._drain_at = _PAR_MIN   # decided by the first drain
+        else:
+            self._start(max(1, threads or os.cpu_count() or 1))
+
+    def _start(self, threads: int):
+        self._threads = threads; self._span.set(threads=threads)
+        level = self._level
+        if threads > 1:
+            self._pool = ThreadPoolExecutor(self._threads, thread_name_prefix="bl4-deflate")
+            self._pending = collections.deque(); self._zdict = b""
+            self._drain_at = _PAR_BLOCK
+            self._emit(zlib.compress(b"", level)[:2])   # zlib header
+        else:
+            self._deflate = self._zlib.compressobj(level)
+            self._drain_at = _STREAM_CHUNK
+
+    def write(self, data) -> int:
+        if isinstance(data, str): data = data.encode("utf-8")
+        self._text.append(data); self._text_len += len(data)
+        if self._text_len >= self._drain_at: self._drain()
+        return len(data)
+
+    def _drain(self, final: bool = False):
+        data = b"".join(self._text); self._text = []; self._text_len = 0
+        if self._auto:
+            self._auto = False; self._start((os.cpu_count() or 1) if len(data) >= _PAR_MIN else 1)
+        if not data: return
+        if self._threads == 1:
+            self.adler = zlib.adler32(data, self.adler); self.length += len(data)
+            self._emit(self._deflate.compress(data))
+            return
+        # whole blocks only, so the stream doesn't depend on how the input was split into writes
+        cut = len(data) if final else len(data) - len(data) % _PAR_BLOCK
+        mv = memoryview(data)
+        for i in range(0, cut, _PAR_BLOCK):
+            self._submit(mv[i:min(i + _PAR_BLOCK, cut)], False)
+        if cut < len(data):
+            self._text = [data[cut:]]; self._text_len = len(data) - cut
+
+    def _submit(self, data, final: bool):
+        self._pending.append(self._pool.submit(_deflate_block, self._zlib, self._level, data, self._zdict, final))
+        self._zdict = (self._zdict + bytes(data[-_WINDOW:]))[-_WINDOW:]
+        while len(self._pending) > 2 * self._threads:
+            self._collect()
+
+    def _collect(self):
+        comp, adler, n = self._pending.popleft().result()
+        self.adler = adler32_combine(self.adler, adler, n); self.length += n
+        self._emit(comp)
+
+    def _emit(self, data: bytes):
+        self._blocks += data
+        cut = len(self._blocks) - len(self._blocks) % 16
+        if cut >= _STREAM_CHUNK:
+            self._out(self._aes.encrypt(bytes(self._blocks[:cut]))); del self._blocks[:cut]
+
+    def flush(self):
+        pass   # blocks are only final once the stream is closed
+
+    def close(self):
+        if self.closed: return
+        try:
+            self._finish()
+        except BaseException as e:
+            self._abort(type(e), e, e.__traceback__); raise
+        self.closed = True
+        self._span.set(bytes_in=self.length); self._span.__exit__(None, None, None)
+
+    def _finish(self):
+        self._drain(True)
+        if self._threads == 1:
+            self._blocks += self._deflate.flush()
+        else:
+            self._submit(b"", True)   # empty final block closes the deflate stream
+            while self._pending: self._collect()
+            self._pool.shutdown()
+            self._blocks += (self.adler & 0xFFFFFFFF).to_bytes(4, "big")   # zlib's own Adler-32
+        trailer = (self.adler & 0xFFFFFFFF).to_bytes(4, "big" if self._be else "little") + self.length.to_bytes(4, "little")
+        self._blocks += trailer
+        n = 16 - len(self._blocks) % 16
+        self._blocks += bytes((n,)) * n
+        self._out(self._aes.encrypt(bytes(self._blocks))); self._blocks = bytearray()
+
+    def _abort(self, exc_type, exc, tb):
+        # stop the workers and end the trace span with the error; nothing more is written
+        if self.closed: return
+        self.closed = True
+        if self._threads > 1: self._pool.shutdown(wait=False, cancel_futures=True)
+        self._span.set(bytes_in=self.length); self._span.__exit__(exc_type, exc, tb)
+
+    def __enter__(self): return self
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None: self.close()
+        else: self._abort(exc_type, exc, tb)
+
+def encrypt_from_yaml(yb:bytes, platform:str, user_id:str, level:int=9, threads:Optional[int]=1)->bytes:
+    buf = io.BytesIO()
+    with EncryptWriter(buf, platform, user_id, level, threads) as w: w.write(yb)
+    return buf.getvalue()
+# ── Re-key (AES + trailer only) ───────────────────────────────────────────────
+def _source_platform(enc: bytes, user_id: str, read_all: Optional[Callable[[], bytes]] = None) -> str:
+    """Platform of a save from its first block; a full decrypt only breaks the rare tie (or
+    reports why neither key fits). `enc` may be just the first block if read_all() returns the rest."""
+    candidates = detect_platform(enc[:16], user_id)
+    if len(candidates) == 1:
+        return candidates[0]
+    return decrypt_auto(read_all() if read_all else enc, user_id)[1]
+
+def rekey(enc: bytes, src_uid: str, dst_platform: str, dst_uid: str, src_platform: Optional[str] = None) -> bytes:
+    """
+    Re-encrypt a save for another platform and/or account without touching the
+    zlib stream: decrypt, byte-swap the stored Adler-32 if the target platform uses
+    the other endianness, and encrypt with the target key. The padding and length
+    are unchanged, so the result is exactly as long as the input.
+    src_platform is detected from the first block unless given.
+    """
+    dst_platform = dst_platform.lower()
+    if dst_platform not in ("epic", "steam"):
+        raise ValueError(f"unknown platform: {dst_platform!r} (expected epic or steam)")
+    for uid in (src_uid, dst_uid):
+        is_valid, validation_msg = validate_user_id(uid)
+        if not is_valid:
+            raise ValueError(f"Invalid User ID format: {validation_msg}")
+    src_platform = src_platform or _source_platform(enc, src_uid)
+    dec = bytearray(_cipher_for(src_platform, src_uid).decrypt(enc))
+    end = len(_strip_pkcs7(dec))
+    if end < 8:
+        raise ValueError(f"data too short after padding removal: {end} bytes (need at least 8)")
+    if src_platform != dst_platform:
+        dec[end - 8:end - 4] = dec[end - 8:end - 4][::-1]
+    return _cipher_for(dst_platform, dst_uid).encrypt(bytes(dec))
@@ -0,0 +1,198 @@
+"""
+Embedded advanced item decoder (compressed source shipped inside the editor).
+Loaded on first use, from a compiled-code cache when one matches the blob.
+"""
+
+import ast
+import base64 as _b64, binascii as _ba, zlib as _zl
+import hashlib
+import marshal
+import os
+import sys
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+
+from . import trace
+from .serials import _friendly_from_decoded
+
+_DEC_NS = None
+_DECODER_B64 = """eJztPf1b47jRv/NXeNNu4xwhmxDCsXkv17J8HbcLuy+wd72maerEDrgkdmo7C5SH/u2vRpKtb9uB7Eff4ueBJJY0mhmNRqPRSPJn8zBKrOTaDxIvspwYfV2bROEse+XTHMl13Zp5cexceqPwtm5dhPOp98mb1q2JP/Vc35mGl6Sk6yTOeOrEsRenpbNXFPbd3A8u08R9f5zUrXd+jP6/nyd+GDgI6scAfUHVLFA1azRnnESLcUJgzJ3kauqPUiAf0M81VpuX+DNvbe1PrGL83zpOvNl54iRxd81CzzzyZ050N4zRq25WeR9RPrB61mkYeDhb7I3DwC2REXMkJz1yIj+5y8kwc4LFxBkni8iLcrL5iIwhpign02TqXPLpwGGcKcul8mcfUep6LrCpS0mPUNN2gfWsZtR+nvRqjHh+GUZ37PXUCy6Tq66FaiSQMNtZC1CG3Awnvjd1UQrIQR+Vpm0PqBKxIEgPcAHUEBPf9YIxh0AY+Zc+onA4Qv8BhdFd4sVi0jzyJv6tpszcuZuGjstSgCXDeRj7wDaEVoYBqf/KiYbhZBJ7iZJ24znzMBgGzszj2I7gSk0cXXuRQC8WckIv5Gbt8+vB7of3p8PT3ZODc/TyHgOousPkT9WuVf3ZuQ5HsXV+FSaXi6BaJ6mjX+4jLvUDQjGcpol37Xfrmw984cCfe1Ga7H0c3kPiiTP1b5xABn3z+99uSOksw8lRmogk/5ok/jJ13HBi7Z6lSbeHNy+EJK7Y7fzVH0jamT9HqEgYjZPaS0i8CKPLhSdRM4ntHUjcdzzXmS5irspR7e0nSHofuQimxIQf/0ZqJIlihdHvf30z4xiE8gQOErfq2sPa2sXu8bvhxdnx7v7w3fv3bz9+YI3yZ1SGfMU/36GfdvXEi8ZIO8ZxtY5o9z/5SJMkSPVVa3WW9S3O+mExjUEp7i4uZ16QQIGDaDFXch/i3HthMF7Esf/Je/VruAhcyIVKpN9fsXQrS69hIA+Uzt9EfE8wP+KxE1kn/rVX5WrcR0n96pHjXnqJtXsV3kFNZ4vRyItGTuBaJ05QHUj0yOlc8hFO9ryp9ca/tA79+IpP/RlSj97v/3y4VxXw/YuIr4OFwkfNt8sXd7PX+/zrOHt9TqFCa745e//24HR4cLp/fHoE/atf3f6w7wJ52+/p5xH9PKGfM/Q5WFtzvYmF2DHkurzNqcqatfGjqAGINvUnVhAmVKk2kEaMkvjGT67s6p8+ogbqZhhHHhoCAqY0iEIPI6pVkVJFqjO49OytutVqcgWJnkO0kDr67W57nZQZZHkADqj5ugV4AyxezzRAn8c2B5NiTkDzWAMQKR+HPABfk4nBnBv5CdK74+uhi4cbhXNEH2ItjjUiNwwIX80alPIbtHWMmFHdfbO3f3B49NPxz2/fnZy+//C/Z+cXH3/59c+//cUZjRFKl1f+P66nsyCc/zOKk8Wnm9u7fzVbm+2tzvb3O6/XX/Ve/P7lH76za/3B/cO///634Q8//vF3/1NlI8LMmYMqGKPhDrPXr1tjYKwXLGZehMZGG6NSQ1JHuVksA9LYBWRADtbUZOTi25q0sTeNvVwwZhgEPdQ+wLX+QDMgsvf8UMje0uENuEGJJW+GU9RuuI8dzrwXb6EzPVz8dkk/sYI8O3ogH6/g49Uu/v8G/9/D//fx/8PqIOsOBDZwmquF0Y74zHKkI70gr4guhBRNaviB693apEhNyEfJ6pNPGKFtVLRupXlx5gCpAmKDCPxCDLJrabtT8hnKMdfrsXk4xDKByqV10iKDfnNgrYMGsOkbhqKu5sZiDpawTRQFD7su1rRudWqUAiy77q0ivZRBNYG1OE8m/qDqUVGs4NB7HUYi6z85U0RkWr4/HgipIIMN7zbxAtdGWM2cxIYCL61tpPKqze1RtSa2kCimDQcZE6gowkjMxkttmgkAv3qFINcy+UesiWA4ht7S+EfoBzYgREDdXKExHbcDy1hDmO1YL3pWkxHJgVlHcJpVCh3ptSFgi4DDdyeKnDsqIJj/TLs363I1dWuHawQMivAR6T4uX9/v+us7SEVu1sTMUG9KdlqaUk3VNFa7dpYZ1ShpkLrE6rrA07RLxJKqRyY7qPpZ6PrI4HcxbGqpKzV0idLX2uhy7V1+QDBY53hQQWW/zKBgFiEqx0A0yPAOkmHc4vACKwSeObRVUA8FQwPg0bG/h2VC5ELN+s7aTlWMLJk/qkC0QtrjfvS7Shnd4KKIOMLDVlHekHFKFaZ3g2kdpm3SH0hq6GoRXFM1JSikrH8oldWt7RrXRTAEkTQOaJf7vr7NNBDrUziD0I+IfKWqi0pbH6E74JVjmqtntbBqBIg/9KzNpqgEgQMAh4KL+5BvHakiBkzkuKkQyy8yNe3saRmO87RbpSMzfNhyn6uJ7QHDpdAOkhh2BSz4CvooEwybInaEbTJGXJeRwdSyvMRgQVllA2edByWoNlaMKCc0vETOOKEeCJtTSVhjFDkkCLGkMGfv0B6I+7D1Y8/aYkwhefvVK89xwVjxqsAS4tZqLAJQlHb1h+MqUXL97taghgZ9U/GRtviPSnEtVjsqVvhzsxCrre5ODtzWpgFwuxDwTre1yUHGDqNha1tSC8LoOEMiklW/0UL9tFmDztrlezIGIdf6U1orjJSbWj5Pqrjw0EmG9/4Dxh2/4Lt5q9mEbk1qQV/Q76bUxVM60p5oo8kBzp8ZXZRN8xBZOwmSTuxmjCmzSOE15tIz8kNgBmaF3lQgZGvIxXlSUtMCPLUZkB+AUJFMjBtPY2ZeGMnERXBl+JvQV0lu0k/JNJFOtm3BcuCmjiYzQrQelNlqjsfPaFDUy3jxiA6RHaqZutAonxqTe5Qh85Tatayr5c0est7mzPzp3ZCkY+7SUiuYZ9Deng4O0OHlqYQkFRQpmmu0CFyqBiiMPl++y/9Y74gzAlS3ERqi8Zfm8Hy7qnojMDsbpASqtsN4CfNNjpNIfMjkUz83u6QcBX6SkhoQMFYTIHxBmdEZLI7V2TvGbG8y8ZCAjKbh+FqctksdP62iLjSOxoNDWe4TjsUabo0iz7kW3gpYrPc4IIrk8asXQ1KOdG8eBuH/PAyRmvOm6HUYCasW6CckAnX9XCeAMBdNiyjtpqsMfmulVMhIpFTOSozMYeCPRlNvSNwHabtCZq5J4WcNfW/J7SB2IQ1IMBhTPiupGy3SfH/XNF9KiFBI6G4KuEGBSyqqirN+uf+39R0+cfzpENnbjitUv9HuDjhRbKDBglbVbKLZEO4/Wd5Od2NT1AGkM2fDYBi59pjMobAzQlc5o48N580qy83QJ8D5NUEYmShIruxABdjazIEoLh/qYKLiDCgeN7dy4PHdjINGy0mAdnIAsWVEGcyODKaVAybTrQKIVhU3tKSrU/cQHQZxe/NQpFrbXLW4V4hVtKEOpCc261Z7ayDjhVdjFbTaVSYRqRTyIo/Xf2omWJ0mKcw5/tFb/VIA0eRsxRJlrFz5l1cV0WjGBGwhe217gElUx3jCpsrMc/3FrCKYSZx9YTOUcfU98sGWQbK12141qkqv0/XbXpXQwaUTjdFjlqXImh7+z16yJd0e+WBJjBU99pUlS+u4PahNk0qMu57sldJkJK3bo58sh2jw9SR3Fuc6YMZfT/BxZVm4Ru9x31kG2oK91CkG72qCVev9c+HPYclv6D3RtH22Y5/t2Gc7ljzPduyzHfv/347NszqL7NhNnR2bZy0Wm7E7WtO4KdtwnL/Qau8UWW08oCWM0jwjuSUDaj/KSG7LYF4vbSS/ZiC+oi2qclNja5Phaev16o1Rz2yMZsbRsz365e1R99keZZCf7VHpebZHM/Y926PP9uizPYpMtDyvZZE9uvU17NEnGJ+dRxqfHRnQ9qOMz23FGM5jvsFFu/UNmZ+dXPOzQ0ajVmf15qdbwvwcOtNnE9T6UiZomFyhgQ5aJ8cCFXciPVukzxbps0Wase/ZIn22SP9bLVIpjC4zehrINLGVILu61R9kmzOkxAITVsqNxKHfGmSMExOh9ZuE6KwDMMCKKSuDbhWAbkmgV+8izXM1661LJabh6V7WFRrxX8TepYZkuj0sA1y9gQ2JtFg898aoCL9fcQHJi8SfIrby7yfwHolKvJg50N25pBeQlILCrx9WYBxn30wmMk8i7mCsBKIguA7Cm4Dfv/pZLOfKNLyp/LcbzZjxpCWVDZWKbZpEd12BjMfu8qE7K9TdnNSShUfZqAitL1VXI4OFHMtP4oO4rYlYAokapPXgEHs8jhZvqRSEm+HTzttsweev/rEqoMGlocRIGqZpz1Ojl9OZjIbpqYyV4z5nQU4VdLxcdOSwky+Dk1sSJ/fz4SS3r4iCNPVkGHB67cnI4Pq927E3T6wD/IGyw+ErHGp5ahseg+oWJLZX9aIo5GO9smTm46CETxw4xkXKSrV1U3xLNDU3aRWTOZ19TxHAmsj2ag9iTl6FB8h0qYjJsh4fVauGDFSVm9OpBpczSAq8P5Dw4xW3nJhq5PuH7DVVyGSro6CQCZNd/K7LN6q4NVFRyxa/RZQH0pCYwyScDRl0NyGCceggsRdHWtgHwsOLszNZOOLkTNz8mSOb14hC9nz1CPMQ1az2YxwiCpYsUepqlhcSVkzgiInPherWMaCaHHbQszZ17gO8QwgPZX6QhNwmobrVrGswqSkwOJ5fRAtPT69k7espljKVprm1aSa6tbUk1a3NuhadRxJO5wl6gmliEaF0drJMw+L9Tq1sNxUfabw0CcKcSU+IkKUUOVtmcjoGcrYYOXx9jyOKm3zpSeIylCJox0zQawNBO4wgVtvjyCETNj0lJK2ckLWX60lEzNqMDlzXsiSIStnkpyGB4pzzA2bDBpJUTFk5WcGzUqJrRQGRMZt4aFIGce9qoPTbauXwwEbctP50p+/4KhI8PDwoLZBRFF57wdDDpxthJ1HZ43t00OBongyrdQucVP1uC28vECvSUwRP5PhotvKLM114B2D22JPKcYAUs+9ijlsYdte6z+p5qOgp0w/0bBqVm97vbnQGdBM0Tw2buGC7PGeglicOn3+gzhmzlh2yNv9TBuocHdlqLkn0zkqH6c8yxj1tyP4Gx7ic0cE0OLRXN8atzJR6vZwYYjper8aWevo4zXt2zWQsa+u3MmMfY1Hci0prVtn98fk1a45pub0kW7aeNes3qVk7SzUx7sCdb1qzbpsJ+t5A0PY3qFlbOX2vZZrXtbaedauWuhwPrrrgm0uYeQVY4WKuWjau8pp1tnbFWOUgPZRQzdzUTsT4/TRQdN1q6ScpuS2DjzMso+DzWkngXoGSNy5l540A2oXxshxsfTEOFo0WpXmYO2LwS/wGkV9+ZOH2+3wdS92ggPkwhGJiCxU1C1JQydR4LTCZm6vRzTkDJh8oUUxkqYGVhVF8lYmKfiBSIjmKiS0ataQ4j686D4BYFTHCrIhGKY6rtDsPR8Pl8ESKcxPKkrrySkvBZXILk8p7OEgPU0EhokaqdjQxa4qDrPIBILw6tCJY+o28OD3fmgLqSA4yTI0+Ek9c1ytwoNmq2Oe71NKKB9a6ZqwJ4cjG6t+r4HUjiKu58itI4a9n0YTrm12RJi6gQjj+UD5hlZzfSs+AM9SaRnjk4SQly0vbQiK/UKpZidQcvwivy62Aaxzia/S2iiPPiU6PFsGB6yPpJiVhAXaI+jLiytBGgj+pW1EYJnxUF3rZgHeIefChJjQSP5l6duVNCBcETJFkx9YWrs0KLFSfRSrkhJMVvfTCmZdEd3Zlu9m87TSb2lx45fsSjZH26LJX+d3m3uZhu13hmhhn5UnnI2ezDIIgkPPVhXSSNpw6IxzBllw33sFXO0OkbiXebdKrHOC7Xs5J2FClbvFY1a0J/DrED/wKg6RnV37ypp+8xB87FVgnrNXMNWP1as8d967Xaso00ozITovuCIoH8JVH8cZ3k6tep0nRam+3X7cPFbT8AIFKRqiqywiuPGBpetRwjRxqHT33h6NFkiDZxKi9wd9V9pEFfYTEOJwhA8jt8QDSCBKMfGdnu3O4KSFfy6k4n3kwOg0nEQlFRAgeRiQGMcNPFC9TYaESfKPPtFcZhckVQtS7nQNFMMDJ1RMMH1s/XzqvHWBAMjUCDyNtjDPnxtqH2AlYSjr1IjeWGyace8EQwNIQH8QIr1dx/RiCKt3KEk3FcCMUxL4L4YjeJKlAWJB7q5ITO5+8IWC6FFHnqJSVhBYQd4HeyCQRqCEGbKTocOv7ve/38imS0VuOrqVJ+oN1EOj6DoaGftFRzUjSVvtNZ6dVgqQlqRmH87ulqNlDBZC03VAlKtOD4aWawEDL95s7r/d382nh8CpNS7hI5oukxCiwCsXPV6bTXVzEahasOp0IwzMdz1RlDe6bWgNO8Z7bwk4ldqmKaHSyC8sa8VV44xGjE9ueCPnKh6nnIIPUI3efpfGjks1JzJD8kdkYgitgqZRs8BsiexaJgVuKgkMctQeKgcBdigY/nk8d4qGIbbNiI7aKTYU2gDPsp4Vao3ShJfLzsi/mz3qSVMJgH2EZFKiXZBBGDmR1wIVHEIkgj5Y3fjAJh+Mrf+pGyF6XAoxJQdTQSFDD9GIHhhd1UarCIEbgZbsH1YxshiaC1ooYfymZOPtDbwxDN0eraQQXIZCOTsyGW6KH8ECu5FZ0EINBldCkAsa1H1x2rftcah4q2sOc5Uen0A4Ovu/smRQa6lWjcIpEyYQ+IZZTsvgtDkARSqDZLfGjWhAmC1Z15cRB4kRosFxnhjr2qyzmGc0jUfeGXLz7tSIF19qV89S1yMCyVwQ2BxQ3JeQRPZIq2DNyNSFkhbhUutmT3Gho2Q7Z4odjh61/LhzYmGJt4CEObmlcBOk3VAy1pJeMGzUARaCotZ3w9xxCxl9lxHk/ImQQfivwMMp7+EJEzBDYBzPxxyo/YCkWcjC3lgrsHb7FMeMEZcHNlYdmqJ+QwgVVg6nDKVynGIgeIHF7rm6/EpOe7OB0pNKhlHWCSzEsCDALRosEnE6RZXuNy0bdwht3MTpCfbz8ao5hLYkMkQrrDS6FkaFv8GBDMfj474NFyDU3rUTGQLtntCwivMBYB6Qw7VIsYSNO252ClwUnrbZSq63lq80SOyR1aF5AnNcFjvPCBoYXXdOWg1lVNLvB3SPBzffn+m/1v5CGgyA3WeHIoLGr7Jx68gjpoUucT/ar3br16g3620N/++jvEMMVnH9F8N8Rz9spdmCRpg6nU9TQC9RtcBSbA3tqaZt38BhJ6xHchEX17EbjKw/v24eibwN/4kE8+REaSR0mU0kPp6Dhp0dTcE1OWjitRRiycVV0CoSG33HdcpIE3/1FkJD2rz5l7DMPe5sSYhkP+GGPH/F4rPPMb+IGaXUQVcH4Kox6lZuKhtXKtECDj+Jt4el9gn+FdifMdTBoiWBzTnxyJ60ybBPzntQA13qUiQkVa8WRN2lr9yVVqGgmk1pQ+owi3IIMahYeZUpg3wu3+AwYIhBIemX05UVtEzAEBYCQSFsi4LUaMF2XIKy7kINTpNbivGDCTJIJteD/4YvGaYXYyTqp3MOvBzJVg3LwqZE96JiqHch3CNJ1NV1h5+D15uvv9YbbjnwdXFZN0TwZZgO8+0SeDGTzS2mMWGqidprO0FxiQ6EZG9RZNFGDa6xRg85g+3B6rXUj+xKEN2Q+PIGfduXlbxsvZxsvXevlT92XJ92X5xx0PDlDJiCsiMPeaJ1z+5Rzblvv8UT+r0FFD2IdYBx5Ab4GCqKaM1Qf8spUehXrO6vTtNatyl8DyPnI6YuKDLnEtHDaINWqwnl/dnx0fLr7zjo/ODvefdfNZ4GmNmI7FFd0fHFwYp1/PDnZPfutoJYLfM6Npq4svjCX65PKXnY/twlIuiOwANAbvN3Mekdv974nO3FliPLutAdyhE8Bjtzd3hosmbOkmLUnu8en1vnF7sW5wNiyk2/4NZz6gafO6ibirA4hqokUKowfIqfHnL7arT5Imx4n8gQvrUGOpikRZZNXC53vpdDToIucIIw8aMJ8LoUpxq4URrTkwefmdyl0PoqiILIiDzKZ7KVAabSCOXghDxRn/Fv3ZUwYeRcND5ybVJrEHCnQCqmEyWtNo1jV7nF+cfZx7+LjGVJyh8cH7/bPC9SPOCfVdU45yE6c+9YJVbUC3SLONstUI85qS1ajnUuWqU07gy1ZqTh9K1ObGLpRshpxFlemGjHGo2Q1bBJXporMYubBF4jo2e6v1v7uxW4ZAa1sgFGxSY0Klo/T5xDmg5rNHWZ+1b54Ifq1d4ev5Vt4mcvXRBP81l2QjkCk19uol/nVLeXiu7rsIqrLbpp8D6dRHhXJUdqYtYhmDqNwK5u8MyZx1nYeG2VICs/8GE1vEjSh9Wxcqo6vIdVcKo9T4QZXbLz274EKovxmztzGx/JRxB4GFaG0fm7Fw4N5FSlcYGLeI/IekMhnhR+04kbCv8T2L5IqEUPihaAXs+YV09waWUDDX4MPaQlsYMSpEZdViay1CczwedrS9sUxrnADZDqUSTeum+u1rA80esi6R1AoG8swkPSW5RiIyyzLQHof5RIMPMT+DMJAVmVZBrIST2Qgt2qEMCFurQnxcRvnJ/1uqzl4GLJ5WyPy5lMHdcRqFzrXBtLSjeQ2qQjA5w6+gRq+ughIeNlw4muYyTpxWrcYXIdm185imuCb3GOEe6+CgUq2EyoK2iju9e0KhDfgN9gf8x3OXqtbdmV3OuXff1epSUdyQNQXQgry9FJsxBw4sIuGHgjzcYgEYZSK3uGUbmkCyp/VkT7gKbYgvMROC9XhsK86ORPEDy571UUy2diBHdyxNdEHmU8aN2gQ8GxeBDTBp6LDAZYk7cr5YjxG78FFQoOSXHKOCDQRrBOjcfQ+RU3eflwQj2eoWPJ0TLg1aagUcw/b1/gAmArndBHCcGSvC7xHRLnhDUTXhnNsirOQhZomYxq2lwYAVbSZxAC9LSFAj8tWGKG3nLtCwXLC4pQ2Clc6+YiOcQRu+Z6VJNeNc/xj5EQ2g1+TsvLuLzQrv2LevTse7tgJPjkxccnt4e8cTNkbd0dAZxEupKLY45qFwDN6FvODywg8usaf1kIh3n3yvRu+HYIAWT+KM5/kNrnwKaxx5DmJR4m0wcUK10eTnz0OMHO5Bzc805RahTL6qgtXDuDJ9Y8+0QmTu25evACx2dQvQJgWHz6rlV1oP38uG/kxLV9KApTcBaJATNKCyK38livdglwrlLbb4fmcy01CHdJaiTxTUfM/auEjfeQFEBBe3By6NRChbu2M5JlTeq3eWMxhxWPoox6dgLVpq3qcRoPhcSPyLsHOpEkjZKfYFWc6Fdb88XqPIbCYH/a4SFUYrveu4BRuJZ44gzYm6SVjU0UcTMGSMvAvuTxl0TpBdxctVWWjjRjAqdu+oRQhA5S2iJRHLcufLmosTDMxbNOtW1p/kHLynvGwPeWMPXm0W27Witryyolzu4pGxaZK47Kgl6l9k3eC6EJs1VmpbtKDm2PqDsm4XjDdRvgYD2DKdvDhyT5wDw7qv/Icl8ZPpa8wrPSN+UAmCP9MkfKDxM7I1WspigUr9aLH6DLXAk8hyQiDDG4uJEkwRddbBsKkqqfZYdvP3NFzB0QItizKbrNyfPLQl/9aRhH32DOjNIz67JMR7jC+oqkJx1qm31fL2gzu41nLZENjH0uOKD3C4Bnzg4V+zH10awwKR+RHjsZPG4nl/E8eiDF83BJySBhH+rLysxrZ+eJyo3XlFR5ezJ8zvJyZp2eVJmSkaOmCw0DZnC8cCbw6/JSrSkpi2NrUoMidX7Ia7LKbSPKxEq44URDaWiFC0h0rJdDaMqG1s0K0uECZUkjtGBuvvUKs0ptWyjReu8pf2lCiB2tONZUvUv+aPVjXPaRrML9uBzaLwFftLsZevErBXLa7tE1Ivf5Kuu517viwyvGrXB9Wr2SCp1Q/1pyhKV9A+zX7sU59/2f0485X7ccdE1rbX7Efbxt13ioFbSmjJVe+vqGeXHxIY5kIyBInNRrv7Cui7zPc5ldU5crv+VMF89scjFdpXy3TXYyTjm/NOvh2ujA/K5ZvmMiDQ69ge+RGWv5GiHxsjddS0F6TQTJdQGFilvGu0QyiyBzJTaFaJeqW60L+OcGdfU0cDmJh7NqqW0N8861YscYH5Qv3R6u1au/OTR/pzmhj6TK3SMtNLFBV2NTS5c8mL1Xa6kJ23PqaU5bNUlDqnMDlQPSFa651hwfmMyg/f4n6xVu2u3oWwmP20BsPuYTnMTqCyThfMk/An6ZaUtY+Ub1QckupGJrXdKHMm7P3bw9Ohwen+8enR+dmGZUW7W+cKPCDS7vyK/mCoy0vsptl+ItlrJlzZ40if3xtJVceXtN/YXDzluoIZUTdcO3Mo2RKPTy1UKw0J6guN4jSo1SLgsXN56liQUvPVM0Hk3ewKuVBuavR+WNXcWY4dL7awZcdmRaHHnFya3mJXPZIVw3FS45XadvRg2HN45X2qFj++UJjQt5hsjJRxQfLLll7iZNm+ecJ4wJbpCzXf/1kZBpBZCpUQcgqK+x63NqprtsxQLg7JdCTRqaeZJI4Gd+GH7jerU1IhC2am49XxWb5Kyd7uWLHqDfnKSVk8XrLIFXlDsNfkxNYjJh4mWmRIX7lxEMywQmjIUy/EASwQKRYIxxWxAXO5NojSgXSTB2qSmcTxNopuyVwkF+v3Mcg8E8lEOtzmmLCTBPRrIRn5/KVwyJbcieRWkOyuk5/jPAPDGGTpuAfbfiRE71gXOCWKoZBjNVb6oh7+dEcAn/MX/yq2Rqoe1RJVU7Flx8h0IYxbEVU/Pg1qGAtrVKx88S22PqyVLT1VOjuEViKjJ3PRUa5+If0UeMg4FnFLg14tOGcwvQPXizn1oAnVy+Q8RiCGRHwRjyf+oldHVZr/Y3WIDcGrfQFMOlTfBFMiSZeonnLN+3nb1YhvvQ/pk3z2xNfe4KNIxqh9K003GP2kktuFqX4ci2kbPsumCBL29GNZsNSfa5UfyuerEgNlsPpcpvOjZymxb8Mp6ntWJbTZi5LveDR7OSNcpJF9fZnRbkLSxT7luWDAERxF0YZz766w4SBVIrnXeeTpaEmyrWLtboMI5Z7a8uy80FCQn3ZYvTml0fOPsuWk+6KKVmKv0RGKaJ27TRUhGMrLyO64+DNdYt7lriLaozFhXPu6f4zuiWT3QKQno7DAJqu/MbZzAecKwei80/hSQCwdS3dyUUOAiAOdUwz2V2Xng1QAl3z7kUtIsfoPzk4WEKibiFSUywib+b4QQwnSeM8rrzdbOWHE5COB/qA4iAcUmAmNpfI05AclZtR6nqJN04IORkYIn/S8fs4Ndvwx66+UO5HWOkB8ll2RW8pke/CueTm+Hch+FwtUhDXngadGzquLnAj27ukDB8S/mL0RUkKdIVWQIMSCVKaCrqkVw57PvMKsM5CL0pjK+6xKIWzWmQFmEuxLKXxZ7EdJbGXC6wAdyG+pDTmOPajJNJc3hXgm0adlEaVnINUDlUub0lUMw8OwSVnybYgDgSX1zu1R1F47QUILTjjBxeubn/Yx3u1tt/TzyP6eUI/Z/u6JWYBc3HZWKxkdcvGuK4yS8aaluM3WZVtQbXMk4QunQ+JG770E3mjOiUBF8tpVb7MSiiQ4l1KUqDbxvYoVcsXXQk9+g12JckSVtrLmhtqmbJKonClPZ9UKS4g14uU1ckvwPNxr2J0QO0rrMrrhhMOp9LDilJmqeYoEctgCKgoKWPZcmdJgqT8SxGTv5KsWZ0ukqGnLZinz4qXsOH5YmEUhREUdBR9alV5y9nwSAuzqreHzOQwdP7WO6FapQOqiPGny+FcekdTKdcENmsKzp0r5754rOui0G1BboZ0uSl6KaSLvRh6D8aq3TpfkC96mnmgTEKpI+WX7BZujSelyItyHBAvhx8gZukPd+QuvNScWCQh21X7D7kmeerPR6ETuWj64zmRpGN1+ehecQl+LY86mcG4oam8ISp84i7KqnixjHdIc84SJ83ZbWK4AsQw7CXy4QJrfN3cEF+iMxyCa2w4pDdD0purk+vGxTVlCCIavRFvw7bZKZmYRQBjGoZonPo/suiOWg=="""
+# The embedded decoder's symbol set (no '-'): a symbol's value mod 64 gives its 6 data bits and
+# value // 64 its "offset" flag, so its bit stream is standard base64 over the translated symbols.
+_EMB_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=!$%&*()[]{}~`^_<>?#;"
+_EMB_B64 = str.maketrans({c: _EMB_CHARS[i % 64] for i, c in enumerate(_EMB_CHARS)})
+_EMB_OFFSET = bytes(int(chr(b) in _EMB_CHARS[64:]) for b in range(256))   # ASCII byte -> value // 64
+_EMB_SET = frozenset(_EMB_CHARS)
+_EMB_MARKERS = ['Fme!K', '}TYg', '}TYs', 'RG}', 'RG/', '/A', '/B', '/C', '/D', '/F']
+
+def _embedded_bit_pack_decode(serial):
+    """Same result as the embedded decoder's bit_pack_decode, without building a bit string."""
+    if serial.startswith('@Ug'):
+        original_prefix = '@Ug'; payload = serial[3:]
+    else:
+        original_prefix = ''; payload = serial
+    markers = {m: (payload.index(m), m) for m in _EMB_MARKERS if m in payload}
+    skip = range(0)
+    if 'Fme!K' in markers:
+        start = markers['Fme!K'][0] + 5; skip = range(start, start + 5)
+    if not skip and _EMB_SET.issuperset(payload):
+        positions = list(range(len(payload))); kept = payload
+    else:
+        positions = [i for i, c in enumerate(payload) if c in _EMB_SET and i not in skip]
+        kept = ''.join(payload[i] for i in positions)
+    b64 = kept.translate(_EMB_B64)
+    data = _ba.a2b_base64(b64 + "A" * (-len(b64) % 4))[:(6 * len(b64) + 7) // 8]
+    return data, original_prefix, positions, list(kept.encode("ascii").translate(_EMB_OFFSET)), markers
+
+# ── Compiled-code cache ──
+# The blob also carries the original tkinter editor (GearNGunEditor and a __main__ block);
+# only the codec is compiled, and the code object is marshalled under the user cache dir so
+# later processes skip both the decompression and the compile.
+_GUI_MODULES = ("tkinter",)
+_STRIP_VERSION = 1   # bump whenever _codec_module() changes what it keeps, so stale caches aren't reused
+
+def _cache_dir() -> Path:
+    env = os.environ.get("BL4_CACHE_DIR")
+    if env: return Path(env)
+    if sys.platform == "win32": base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin": base = Path.home() / "Library" / "Caches"
+    else: base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "bl4"
+
+def _cache_path() -> Path:
+    rules = f"{_STRIP_VERSION}:{','.join(_GUI_MODULES)}:".encode("ascii")   # the cached code depends on these too
+    key = hashlib.sha256(rules + _DECODER_B64.encode("ascii")).hexdigest()[:16]
+    return _cache_dir() / f"decoder-{key}.{sys.implementation.cache_tag}.bin"
+
+def _codec_module(src: bytes) -> ast.Module:
+    """The embedded source minus its GUI: tkinter imports, anything using their names, and
+    the `if __name__ == "__main__":` block."""
+    tree = ast.parse(src)
+    gui = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            gui.update((a.asname or a.name).split(".")[0] for a in node.names if a.name.split(".")[0] in _GUI_MODULES)
+        elif isinstance(node, ast.ImportFrom) and (node.module or "").split(".")[0] in _GUI_MODULES:
+            gui.update(a.asname or a.name for a in node.names)
+    def keep(node):
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Compare) and \
+                isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__":
+            return False
+        if isinstance(node, ast.Import):
+            return not any(a.name.split(".")[0] in _GUI_MODULES for a in node.names)
+        if isinstance(node, ast.ImportFrom):
+            return (node.module or "").split(".")[0] not in _GUI_MODULES
+        return not any(isinstance(n, ast.Name) and n.id in gui for n in ast.walk(node))
+    tree.body = [node for node in tree.body if keep(node)]
+    return tree
+
+def _decoder_code():
+    """Code object of the embedded codec: from the marshal cache when it matches this blob and
+    interpreter, else decompressed, stripped, compiled and written back (best-effort)."""
+    path = _cache_path()
+    try:
+        raw = path.read_bytes()
+        if raw[:len(MAGIC_NUMBER)] == MAGIC_NUMBER:
+            return marshal.loads(raw[len(MAGIC_NUMBER):]), True
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    src = _zl.decompress(_b64.b64decode(_DECODER_B64))
+    code = compile(_codec_module(src), "<bl4_embedded_decoder>", "exec")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(MAGIC_NUMBER + marshal.dumps(code)); os.replace(tmp, path)
+    except OSError:
+        pass
+    return code, False
+
+def _load_embedded_decoder():
+    global _DEC_NS
+    if _DEC_NS is not None: return _DEC_NS
+    try:
+        with trace.span("decoder") as sp:
+            code, cached = _decoder_code(); sp.set(cached=cached)
+            ns = {}; ns["__name__"] = "bl4_embedded_decoder"
+            exec(code, ns, ns)
+        if callable(ns.get("bit_pack_decode")): ns["bit_pack_decode"] = _embedded_bit_pack_decode
+        _DEC_NS = ns
+    except Exception as e:
+        print("[decoder] embed load failed:", e); _DEC_NS = {}
+    return _DEC_NS
+
+# --- Decoder adapter: tolerate different function names & return shapes ---
+def _get_decoder_fn(ns):
+    for name in ("decode_item_serial","adv_decode_item_serial","decode_serial","decode","parse_item_serial","item_decode"):
+        fn = ns.get(name)
+        if callable(fn):
+            return fn
+    return None
+
+def _extract_name_from_decoded(obj):
+    # dict-like
+    try:
+        if isinstance(obj, dict):
+            for k in ("weapon_name","friendly_name","name","label","title","gun_name","item_name"):
+                if k in obj and isinstance(obj[k], str) and obj[k].strip():
+                    return obj[k]
+    except Exception:
+        pass
+    # object-like
+    try:
+        for k in ("weapon_name","friendly_name","name","label","title","gun_name","item_name"):
+            v = getattr(obj, k, None)
+            if isinstance(v, str) and v.strip():
+                return v
+    except Exception:
+        pass
+    # tuple/list
+    try:
+        if isinstance(obj, (list, tuple)) and obj:
+            if isinstance(obj[0], str) and obj[0].strip():
+                return obj[0]
+            if isinstance(obj[0], dict):
+                return _extract_name_from_decoded(obj[0])
+    except Exception:
+        pass
+    return ""
+
+
+def _to_int_sane(x, default=0):
+    try:
+        s = str(x).strip()
+        if s == "" or s.lower() == "none":
+            return default
+        return int(s, 0) if s.lower().startswith("0x") else int(''.join(ch for ch in s if ch in "-0123456789") or default)
+    except Exception:
+        return default
+
+
+def adv_decode_item_serial(serial):
+    serial = str(serial).strip()
+    ns = _load_embedded_decoder()
+    fn = _get_decoder_fn(ns)
+    if callable(fn):
+        try:
+            return fn(serial)
+        except Exception as e:
+            print("[decoder] decode error:", e)
+    return None
+
+def resolve_item_name(serial: str, decoded=None) -> str:
+    try:
+        if decoded is None:
+            decoded = adv_decode_item_serial(serial.strip())
+        nm = _extract_name_from_decoded(decoded)
+        if nm:
+            return nm
+        try:
+            return _friendly_from_decoded(decoded)
+        except Exception:
+            pass
+    except Exception:
+        pass
+    try:
+        return _friendly_from_decoded(None)
+    except Exception:
+        pass
+    return ""
@@ -0,0 +1,169 @@
+"""
+One-pass index over a loaded save: where the item serials are (with their parent
+mapping, for the flags/state_flags siblings), where the currencies live, the
+experience entries and a graph → node map for progression. Built once per loaded
+tree and kept current by the editing helpers, so the tabs query it instead of
+each re-walking the save.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .paths import ItemPath, walk_paths
+from .serials import forget_serial
+from .yamlio import LazyMapping
+
+# explicit `currencies` block keys first, then any scalar with one of these names anywhere
+CURRENCY_KEYS = [
+    ("cash", "cash"), ("eridium", "eridium"),
+    ("golden_keys", "shift"), ("gold_keys", "shift"), ("golden_key", "shift"), ("keys", "shift"), ("shift", "shift"),
+]
+CURRENCY_NAMES = {
+    "cash": ["cash", "money", "credits", "dollars"],
+    "eridium": ["eridium", "vaultcoin", "vault_coins", "eridium_amount"],
+    "shift": ["shift", "gold_keys", "goldkeys", "golden_keys", "goldenkeys", "keys"],
+}
+_BY_NAME = {}
+for _name, _keys in CURRENCY_NAMES.items():
+    for _k in _keys: _BY_NAME.setdefault(_k, []).append(_name)
+
+
+class SerialRef(NamedTuple):
+    path: ItemPath   # e.g. ("inventory", "backpack", "slot_3", "serial"); str() for display
+    serial: str
+    parent: dict     # mapping that holds the serial (and its flags/state_flags)
+    key: Any
+
+
+class GraphRef(NamedTuple):
+    path: Tuple[Any, ...]   # from the document root, e.g. ("state", "progression", "graphs", 4)
+    graph: dict
+
+
+class SaveIndex:
+    """
+    Index of `doc` (the whole loaded YAML) with `root` the character container inside
+    it (doc["state"] or doc itself). Serials and currencies are collected in one
+    walk_paths() pass over `root`, in the same order walk_ug() would find them; sections of a
+    lazily loaded root whose text holds no serial stay unloaded unless the currency name scan
+    needs them. Graphs come from root["progression"] and, when root is not doc, doc["progression"].
+    """
+
+    def __init__(self, doc: dict, root: Optional[dict] = None):
+        self.doc = doc; self.root = doc if root is None else root
+        self.root_path: Tuple[Any, ...] = () if self.root is doc else ("state",)
+        self.serials: List[SerialRef] = []
+        self.currencies: Dict[str, Optional[List[Any]]] = {}
+        self._walk()
+        self.refresh_experience()
+        self.refresh_graphs()
+
+    def _walk(self):
+        found = {name: None for name in CURRENCY_NAMES}
+        cur = self.root.get("currencies")
+        if isinstance(cur, dict):
+            for key, name in CURRENCY_KEYS:
+                if key in cur and isinstance(cur[key], (int, float, str)): found[name] = ["currencies", key]
+        # the name scan is only needed when the block is missing or incomplete
+        fallback = {name: None for name in CURRENCY_NAMES if found[name] is None}
+        serials = self.serials
+        def is_serial(parent, k, v):
+            return v.__class__ is str and v.startswith("@Ug") and isinstance(parent, dict)
+        def hit(parent, k, v):
+            return is_serial(parent, k, v) or str(k).lower() in _BY_NAME
+        for path, parent, v in self._scalars(hit if fallback else is_serial, None if fallback else "@Ug"):
+            k = path[-1]
+            if is_serial(parent, k, v):
+                serials.append(SerialRef(ItemPath(path), v, parent, k))
+                if not fallback: continue
+            for name in _BY_NAME.get(str(k).lower(), ()):
+                if name in fallback and fallback[name] is None: fallback[name] = list(path)
+        self.currencies = {name: found[name] or fallback.get(name) for name in CURRENCY_NAMES}
+        self._serial_pos: Dict[ItemPath, int] = {s.path: i for i, s in enumerate(serials)}
+        self._text_pos: Optional[Dict[str, int]] = None
+
+    def _scalars(self, where, needle: Optional[str]):
+        """walk_paths() over root for scalars passing `where`. With `needle`, top-level sections of
+        a lazily loaded root whose source text lacks it are skipped without being loaded."""
+        root = self.root
+        if needle is None or not isinstance(root, LazyMapping):
+            yield from walk_paths(root, types=(int, float, str), where=where); return
+        for k in list(root):
+            if root.unloaded_contains(k, needle) is False: continue
+            v = root[k]
+            if isinstance(v, (dict, list)):
+                for path, parent, x in walk_paths(v, types=(int, float, str), where=where):
+                    yield (k, *path), parent, x
+            elif isinstance(v, (int, float, str)) and where(root, k, v):
+                yield (k,), root, v
+
+    # ── queries / updates ──
+    def _pos(self, path: Union[ItemPath, str]) -> Optional[int]:
+        if not isinstance(path, str): return self._serial_pos.get(path)
+        if self._text_pos is None:   # displayed path text (Items tab) -> entry
+            self._text_pos = {str(s.path): i for i, s in enumerate(self.serials)}
+        return self._text_pos.get(path)
+
+    def serial(self, path: Union[ItemPath, str]) -> Optional[SerialRef]:
+        """The entry at an ItemPath or at its displayed text."""
+        i = self._pos(path)
+        return None if i is None else self.serials[i]
+
+    def set_serial(self, path: Union[ItemPath, str], serial: str) -> bool:
+        """Write `serial` at an indexed path (dropping the old serial's cached decode); False if the
+        path isn't indexed (or no longer valid)."""
+        i = self._pos(path)
+        if i is None: return False
+        ref = self.serials[i]
+        if ref.parent.get(ref.key) is not ref.serial: return False
+        ref.parent[ref.key] = serial; self.serials[i] = ref._replace(serial=serial)
+        forget_serial(ref.serial)
+        return True
+
+    def flags(self, path: Union[ItemPath, str]) -> Tuple[Any, Any]:
+        ref = self.serial(path)
+        return (ref.parent.get("flags", ""), ref.parent.get("state_flags", "")) if ref else ("", "")
+
+    def refresh_experience(self):
+        """Re-find the Character/Specialization experience entries (call after adding one)."""
+        self.character = self.specialization = None
+        exp = self.root.get("experience")
+        if isinstance(exp, list):
+            for entry in exp:
+                if isinstance(entry, dict):
+                    t = str(entry.get("type", "")).lower()
+                    if t == "character": self.character = entry
+                    elif t == "specialization": self.specialization = entry
+
+    def refresh_graphs(self):
+        """Re-index progression graphs and nodes (call after graphs or nodes are added/removed)."""
+        self.graphs: List[GraphRef] = []
+        self.nodes: Dict[Tuple[str, str], dict] = {}
+        scopes = [(self.root_path, self.root)] + ([((), self.doc)] if self.root is not self.doc else [])
+        for base, scope in scopes:
+            graphs = (scope.get("progression") or {}).get("graphs") or []
+            for gi, g in enumerate(graphs):
+                if not isinstance(g, dict): continue
+                self.graphs.append(GraphRef(base + ("progression", "graphs", gi), g))
+                gname = g.get("name")
+                for n in g.get("nodes") or []:
+                    if isinstance(n, dict): self.nodes.setdefault((gname, n.get("name")), n)
+        # what the Progression tab lists: the root's progression, else the top-level one
+        prog = self.root.get("progression") or {}
+        if not prog and self.root is not self.doc:
+            prog = self.doc.get("progression") or {}
+        self.progression: dict = prog
+
+    def graph_refs(self, gname: str) -> List[GraphRef]:
+        return [g for g in self.graphs if g.graph.get("name") == gname]
+
+    def node(self, gname: str, nname: str) -> Optional[dict]:
+        return self.nodes.get((gname, nname))
+
+    def graph_paths(self, gname: str, nname: Optional[str] = None) -> List[Tuple[Any, ...]]:
+        """Paths of graph `gname` (or of its nodes named `nname`), root scope first, then top-level."""
+        out = []
+        for ref in self.graph_refs(gname):
+            if nname is None: out.append(ref.path); continue
+            out += [ref.path + ("nodes", ni) for ni, n in enumerate(ref.graph.get("nodes") or [])
+                    if isinstance(n, dict) and n.get("name") == nname]
+        return out
@@ -0,0 +1,108 @@
+"""
+Path helpers for addressing nodes inside a loaded save tree.
+"""
+
+import functools
+from typing import Any, Callable, Collection, Iterator, List, Optional, Tuple
+
+# ── Path type ─────────────────────────────────────────────────────────────────
+class ItemPath(tuple):
+    """
+    Immutable, hashable path into a save tree: dict keys and list indices, e.g.
+    ItemPath(("inventory", "backpack", "slot_3", "serial")). Equal to (and hashes like)
+    the plain tuple. Text is only produced for display (str(): "inventory/backpack/slot_3/serial")
+    and for the dotted keys of _DECODED_ITEMS; parse() reads either form back.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, text: str, sep: str = "/") -> "ItemPath":
+        return cls(_parse(text, sep))
+
+    def get(self, root: Any) -> Any:
+        cur=root
+        for t in self: cur=cur[t]
+        return cur
+
+    def set(self, root: Any, value: Any) -> None:
+        cur=root
+        for t in self[:-1]: cur=cur[t]
+        cur[self[-1]]=value
+
+    @property
+    def parent(self) -> "ItemPath":
+        return ItemPath(self[:-1])
+
+    def __str__(self) -> str:
+        return path_str(self)
+
+    def dotted(self) -> str:
+        return path_str(self, ".")
+
+    def __repr__(self) -> str:
+        return f"ItemPath({tuple(self)!r})"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(text: str, sep: str) -> Tuple[Any, ...]:
+    out=[]
+    for part in text.split(sep):
+        key, *idx = part.split("[")
+        if key: out.append(key)
+        out.extend(int(i.rstrip("]")) for i in idx)
+    return tuple(out)
+
+
+def path_str(path: Tuple[Any, ...], sep: str = "/")->str:
+    """Text form of a path tuple: "inventory/backpack/slot_3/serial", "graphs[2]/name" (sep="." for dotted)."""
+    if not path: return ""
+    head=path[0]
+    return (f"[{head}]" if head.__class__ is int else str(head)) + \
+        "".join(f"[{t}]" if t.__class__ is int else f"{sep}{t}" for t in path[1:])
+
+
+# ── YAML path helpers for Items table ─────────────────────────────────────────
+def _is_serial(parent: Any, key: Any, value: Any) -> bool:
+    return value.__class__ is str and value.startswith("@Ug") and isinstance(parent, dict)
+
+
+def walk_serials(node: Any)->List[Tuple[ItemPath,str]]:
+    """(path, serial) for every @Ug… string held in a mapping below `node`, in document order."""
+    return [(ItemPath(p), v) for p, _, v in walk_paths(node, types=(str,), where=_is_serial)]
+def walk_ug(node: Any, path: str = "")->List[Tuple[str,str]]:
+    """walk_serials() with the paths rendered as text (optionally under a `path` prefix)."""
+    out=[]
+    for p,v in walk_serials(node):
+        s=str(p)
+        out.append((s if not path else path+s if s.startswith("[") else f"{path}/{s}", v))
+    return out
+def tokens(path: str)->List[Any]:
+    return list(_parse(path, "/"))
+def set_by(obj: Any, toks: List[Any], val: Any)->None:
+    ItemPath(toks).set(obj, val)
+
+
+# ── Generic traversal ─────────────────────────────────────────────────────────
+def walk_paths(node: Any, keys: Optional[Collection[str]] = None, types: Optional[Tuple[type, ...]] = None,
+               where: Optional[Callable[[Any, Any, Any], bool]] = None) -> Iterator[Tuple[Tuple[Any, ...], Any, Any]]:
+    """
+    Depth-first (pre-order) walk yielding (path, parent, value) for every entry below `node`
+    that passes the filters: `keys` (lower-cased key names; list indices never match),
+    `types` (isinstance of the value) and `where(parent, key, value)`, applied in that order.
+    One shared path stack is kept for the whole walk; a path tuple is only built for a match.
+    """
+    path: List[Any] = []; parents = [node]
+    its = [iter(node.items()) if isinstance(node, dict) else iter(enumerate(node))]
+    while its:
+        parent = parents[-1]
+        for k, v in its[-1]:
+            if ((keys is None or (k.__class__ is str and k.lower() in keys))
+                    and (types is None or isinstance(v, types)) and (where is None or where(parent, k, v))):
+                yield (*path, k), parent, v
+            if isinstance(v, (dict, list)):
+                path.append(k); parents.append(v)
+                its.append(iter(v.items()) if isinstance(v, dict) else iter(enumerate(v)))
+                break
+        else:
+            its.pop(); parents.pop()
+            if path: path.pop()
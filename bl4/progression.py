@@ -0,0 +1,56 @@
+"""
+Progression graph helpers (SDU graph, point totals).
+"""
+
+from typing import Any, Dict, List, Optional
+
+# ── SDU helpers ───────────────────────────────────────────────────────────────
+SDU_GRAPH_NAME = "sdu_upgrades"
+SDU_GROUP_DEF = "Oak2_GlobalProgressGraph_Group"
+SDU_NODES = [
+    ("Ammo_Pistol_01",5), ("Ammo_Pistol_02",10), ("Ammo_Pistol_03",20), ("Ammo_Pistol_04",30),
+    ("Ammo_Pistol_05",50), ("Ammo_Pistol_06",80), ("Ammo_Pistol_07",120),
+    ("Ammo_SMG_01",5), ("Ammo_SMG_02",10), ("Ammo_SMG_03",20), ("Ammo_SMG_04",30),
+    ("Ammo_SMG_05",50), ("Ammo_SMG_06",80), ("Ammo_SMG_07",120),
+    ("Ammo_AR_01",5), ("Ammo_AR_02",10), ("Ammo_AR_03",20), ("Ammo_AR_04",30),
+    ("Ammo_AR_05",50), ("Ammo_AR_06",80), ("Ammo_AR_07",120),
+    ("Ammo_SG_01",5), ("Ammo_SG_02",10), ("Ammo_SG_03",20), ("Ammo_SG_04",30),
+    ("Ammo_SG_05",50), ("Ammo_SG_06",80), ("Ammo_SG_07",120),
+    ("Ammo_SR_01",5), ("Ammo_SR_02",10), ("Ammo_SR_03",20), ("Ammo_SR_04",30),
+    ("Ammo_SR_05",50), ("Ammo_SR_06",80), ("Ammo_SR_07",120),
+    ("Backpack_01",5), ("Backpack_02",10), ("Backpack_03",20), ("Backpack_04",30),
+    ("Backpack_05",50), ("Backpack_06",80), ("Backpack_07",120), ("Backpack_08",235),
+    ("Bank_01",5), ("Bank_02",10), ("Bank_03",20), ("Bank_04",30),
+    ("Bank_05",50), ("Bank_06",80), ("Bank_07",120), ("Bank_08",235),
+    ("Lost_Loot_01",5), ("Lost_Loot_02",10), ("Lost_Loot_03",20), ("Lost_Loot_04",30),
+    ("Lost_Loot_05",50), ("Lost_Loot_06",80), ("Lost_Loot_07",120), ("Lost_Loot_08",235),
+]
+def ensure_sdu_graph(prog: Dict[str, Any]) -> None:
+    graphs = prog.setdefault("graphs", [])
+    existing = None
+    for g in graphs:
+        if isinstance(g, dict) and g.get("name") == SDU_GRAPH_NAME:
+            existing = g; break
+    if existing is None:
+        existing = {"name": SDU_GRAPH_NAME, "group_def_name": SDU_GROUP_DEF, "nodes": []}
+        graphs.append(existing)
+    nodes = existing.setdefault("nodes", [])
+    by_name = {n.get("name"): n for n in nodes if isinstance(n, dict)}
+    for name, pts in SDU_NODES:
+        n = by_name.get(name)
+        if n is None:
+            nodes.append({"name": name, "points_spent": pts})
+        else:
+            n["points_spent"] = pts
+
+def sum_points_in_graphs(prog: Dict[str, Any], name_prefixes: Optional[List[str]] = None) -> int:
+    total = 0
+    for g in prog.get("graphs", []) or []:
+        gname = g.get("name","")
+        if name_prefixes and not any(gname.startswith(p) for p in name_prefixes):
+            continue
+        for n in g.get("nodes", []) or []:
+            if isinstance(n, dict) and "points_spent" in n and isinstance(n["points_spent"], (int, float)):
+                total += int(n["points_spent"])
+    return total
+
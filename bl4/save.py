@@ -0,0 +1,127 @@
+"""
+Headless save/profile workflows: decrypt a file with a timestamped backup, and
+turn edited YAML text back into an encrypted save.
+"""
+
+import hashlib
+import io
+import os
+import time
+from itertools import count
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, NamedTuple, Optional, Tuple
+
+from .crypto import EncryptWriter, _platform_key, decrypt_auto, encrypt_from_yaml
+from .serials import extract_and_encode_serials_from_yaml
+from .yamlio import dump_yaml, load_yaml_lazy
+
+
+class DecryptedSave(NamedTuple):
+    plaintext: bytes
+    platform: str
+    backup: Optional[Path]
+
+
+def write_backup(path: Path, enc: bytes) -> Path:
+    """Write `enc` next to `path` as <stem>.<YYYY-mm-dd-HHMMSS>.bak and return the backup path.
+    Never overwrites: a name already taken gets a -2, -3, … suffix."""
+    ts = time.strftime("%Y-%m-%d-%H%M%S")
+    for n in count(1):
+        backup = path.with_suffix(f".{ts}.bak" if n == 1 else f".{ts}-{n}.bak")
+        try:
+            with backup.open("xb") as f:
+                f.write(enc)
+            return backup
+        except FileExistsError:
+            continue
+
+
+class OriginalSave(NamedTuple):
+    """A save as it was decrypted, so an unmodified session can be written back byte-for-byte."""
+    ciphertext: bytes
+    plaintext: bytes
+    platform: str
+    user_id: str
+    digest: bytes
+
+
+def plaintext_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def open_save_file(path: Path, user_id: str, backup: bool = True) -> Tuple[DecryptedSave, OriginalSave]:
+    """decrypt_save_file() plus the OriginalSave that unchanged_payload() compares against."""
+    path = Path(path)
+    enc = path.read_bytes()
+    plain, plat = decrypt_auto(enc, user_id)
+    return (DecryptedSave(plain, plat, write_backup(path, enc) if backup else None),
+            OriginalSave(enc, plain, plat, user_id, plaintext_digest(plain)))
+
+
+def decrypt_save_file(path: Path, user_id: str, backup: bool = True) -> DecryptedSave:
+    """Decrypt a .sav, auto-detecting Epic/Steam. Backs up the ciphertext on success."""
+    return open_save_file(path, user_id, backup)[0]
+
+
+def unchanged_payload(orig: Optional[OriginalSave], text: str, platform: str, user_id: str, level: int = 9,
+                      threads: Optional[int] = 1) -> Optional[bytes]:
+    """The encrypted save for `text` if it is still exactly the decrypted plaintext, else None.
+    Same key: the original ciphertext. Otherwise the original plaintext re-encrypted, skipping the
+    YAML parse/serial re-encode/dump round trip."""
+    if orig is None or plaintext_digest(text.encode("utf-8")) != orig.digest:
+        return None
+    if _platform_key(platform, user_id) == _platform_key(orig.platform, orig.user_id):
+        return orig.ciphertext
+    return encrypt_from_yaml(orig.plaintext, platform, user_id, level, threads)
+
+
+def load_yaml_text(text: str) -> Any:
+    """Parse save YAML; sections are built on first access and untouched ones dump back verbatim."""
+    return load_yaml_lazy(text)
+
+
+def yaml_text_to_save_obj(text: str) -> Any:
+    """Parse edited YAML and re-encode any _DECODED_ITEMS serials, ready to dump into a save."""
+    return extract_and_encode_serials_from_yaml(load_yaml_text(text))
+
+
+def yaml_text_to_plaintext(text: str) -> bytes:
+    """Parse edited YAML, re-encode any _DECODED_ITEMS serials and dump it back as save plaintext."""
+    return dump_yaml(yaml_text_to_save_obj(text)).encode()
+
+
+def dump_encrypted(obj: Any, dest, platform: str, user_id: str, level: int = 9, threads: Optional[int] = 1) -> None:
+    """Stream dump_yaml(obj) through compression and AES into dest (binary file or callable).
+    threads > 1 deflates blocks in parallel; None does so only for large saves (see EncryptWriter)."""
+    with EncryptWriter(dest, platform, user_id, level, threads) as w:
+        dump_yaml(obj, w)
+
+
+def _write_atomically(path: Path, write: Callable[[BinaryIO], Any]) -> Path:
+    # temporary sibling renamed over `path`, so a failure never leaves a half-written save
+    path = Path(path); tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists(): tmp.unlink()
+    return path
+
+
+def write_encrypted_save(path: Path, obj: Any, platform: str, user_id: str, level: int = 9,
+                         threads: Optional[int] = 1) -> Path:
+    """Encrypt obj straight into `path` without building the YAML/ciphertext in memory.
+    Writes to a temporary sibling and renames it over `path`, so a failure never leaves a half-written save."""
+    return _write_atomically(path, lambda f: dump_encrypted(obj, f, platform, user_id, level, threads))
+
+
+def write_save_bytes(path: Path, data: bytes) -> Path:
+    """Write ready-made save bytes (e.g. from unchanged_payload) the same all-or-nothing way."""
+    return _write_atomically(path, lambda f: f.write(data))
+
+
+def encrypt_yaml_text(text: str, platform: str, user_id: str, level: int = 9, threads: Optional[int] = 1) -> bytes:
+    buf = io.BytesIO()
+    dump_encrypted(yaml_text_to_save_obj(text), buf, platform, user_id, level, threads)
+    return buf.getvalue()
@@ -0,0 +1,537 @@
+"""
+Item serial codec (@Ug… strings): 6-bit unpacking, coarse field extraction,
+friendly names and the _DECODED_ITEMS YAML helpers.
+"""
+
+import binascii
+import os
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Union
+
+from . import trace
+from .paths import ItemPath, walk_paths
+
+# optional numpy vectorizes decode_item_serials(); imported on its first call (it costs ~100 ms),
+# not with the package. None = not tried yet, False = not installed.
+_np = None
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+# -- Weapon friendly-name mapping 
+WEAPON_NAMES = {
+    'd_t@': 'Jakobs Shotgun',
+    'bV{r': 'Jakobs Pistol',
+    'y3L+2}': 'Jakobs Sniper',
+    'eU_{': 'Maliwan Shotgun',
+    'w$Yw2}': 'Maliwan SMG',
+    'velk2}': 'Vladof AR',
+    'xFw!2}': 'Vladof SMG',
+    'xp/&2}': 'Ripper Sniper',
+    'ct)%': 'Torgue Pistol',
+    'fs(8': 'Daedalus AR',
+    'b)Kv': 'Order Pistol',
+    'y>^2}': 'Order Sniper',
+    'r$WBm': 'Jakobs Ordnance'
+}
+
+def _weapon_name_from_serial(serial: str) -> str:
+    if not serial or not serial.startswith('@Ug'):
+        return ''
+    for length in range(4, 10):
+        prefix = serial[3:3+length]
+        for code, name in WEAPON_NAMES.items():
+            if prefix.startswith(code):
+                return name
+    return ''
+
+# ── Serial codec + glacier-style grouping ─────────────────────────────────────
+_ALPHABET="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=!$%&*()[]{}~`^_<>?#;-"
+# symbol -> its bit code, indexed by ord (ASCII). Symbols past 63 have always been written with
+# format(i,'06b'), i.e. 7 bits wide; the table keeps that so old and new bytes stay identical.
+# Other characters map to None and are dropped.
+_SYMBOL_BITS=[None]*128
+for _i,_c in enumerate(_ALPHABET): _SYMBOL_BITS[ord(_c)]=format(_i,'06b')
+def bit_pack_decode(serial:str)->bytes:
+    payload=serial[3:] if serial.startswith("@Ug") else serial
+    if not payload.isascii(): payload=payload.encode("ascii","ignore").decode()
+    bits=payload.translate(_SYMBOL_BITS)   # one C-level pass; no per-symbol Python work
+    n=len(bits); pad=-n%8
+    return (int(bits,2)<<pad).to_bytes((n+pad)//8,"big") if n else b""
+def bit_pack_encode(data:bytes, prefix:str)->str:
+    # 6-bit groups over the first 64 symbols, zero-padded, is exactly unpadded standard base64
+    return prefix + binascii.b2a_base64(bytes(data),newline=False).rstrip(b"=").decode("ascii")
+
+@lru_cache(maxsize=64)
+def _raw_names(n: int):
+    """(ordered keys, key set) of the raw fields of an n-byte decode."""
+    names=(["header_le","header_be"] if n>=4 else [])+(["field2_le"] if n>=8 else [])+(["field3_le"] if n>=12 else [])
+    names+=[f"val16_at_{i}" for i in range(0, min(n-1, 20), 2)]+["potential_stats"]
+    names+=[f"byte_{i}" for i in range(min(n, 20))]+["potential_flags"]
+    return tuple(names), frozenset(names)
+
+class RawFields(Mapping):
+    """
+    Read-only view of the coarse fields of decoded serial bytes (header_le/_be, field2_le,
+    field3_le, val16_at_<i>, byte_<i>, potential_stats, potential_flags); each value is
+    computed from the bytes when read.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __iter__(self):
+        return iter(_raw_names(len(self.data))[0])
+
+    def __len__(self) -> int:
+        return len(_raw_names(len(self.data))[0])
+
+    def __contains__(self, key) -> bool:
+        return key in _raw_names(len(self.data))[1]
+
+    def __getitem__(self, key: str) -> Union[int, List[tuple]]:
+        b=self.data
+        if key not in _raw_names(len(b))[1]: raise KeyError(key)
+        if key[0]=="b": return b[int(key[5:])]
+        if key[0]=="v":
+            i=int(key[9:]); return b[i]|b[i+1]<<8
+        if key=="potential_stats": return self.potential_stats
+        if key=="potential_flags": return self.potential_flags
+        lo={"header_le":0,"header_be":0,"field2_le":4,"field3_le":8}[key]
+        return int.from_bytes(b[lo:lo+4],"big" if key=="header_be" else "little")
+
+    @property
+    def potential_stats(self) -> List[tuple]:
+        """(offset, value) of the 16-bit values in 100..10000 among the first 20 bytes."""
+        b=self.data
+        return [(i, v) for i, v in ((i, b[i]|b[i+1]<<8) for i in range(0, min(len(b)-1, 20), 2)) if 100<=v<=10000]
+
+    @property
+    def potential_flags(self) -> List[tuple]:
+        """(offset, value) of the bytes below 100 among the first 20."""
+        return [(i, v) for i, v in enumerate(self.data[:20]) if v<100]
+
+class ItemStats:
+    __slots__ = ("primary_stat", "secondary_stat", "level", "rarity", "manufacturer", "item_class")
+
+    def __init__(self):
+        self.primary_stat: Optional[int] = None
+        self.secondary_stat: Optional[int] = None
+        self.level: Optional[int] = None
+        self.rarity: Optional[int] = None
+        self.manufacturer: Optional[int] = None
+        self.item_class: Optional[int] = None
+
+class DecodedItem:
+    """
+    One decoded serial. `data` keeps the decoded bytes; raw_fields is a RawFields view over
+    them, built on first access unless a mapping was passed in.
+    """
+    __slots__ = ("serial", "item_type", "item_category", "length", "stats", "confidence", "data", "_raw")
+
+    def __init__(self, serial: str, item_type: str, category: str, data_len: int,
+                 stats: ItemStats, raw: Optional[Mapping] = None, conf: str = "low", data: bytes = b""):
+        self.serial = serial
+        self.item_type = item_type
+        self.item_category = category
+        self.length = data_len
+        self.stats = stats
+        self.confidence = conf
+        self.data = data
+        self._raw = raw
+
+    @property
+    def raw_fields(self) -> Mapping:
+        if self._raw is None: self._raw = RawFields(self.data)
+        return self._raw
+
+    @raw_fields.setter
+    def raw_fields(self, value: Mapping):
+        self._raw = value
+
+# ---- Friendly naming helpers (coarse fallback when explicit map missing) ----
+_MANUFACTURER_MAP = {
+    11: "Jakobs", 12: "Maliwan", 13: "Tediore", 14: "Hyperion",
+    15: "Torgue", 16: "Vladof", 17: "Atlas", 18: "DAHL", 49: "UGe"
+}
+_ITEMCLASS_MAP = {
+    10: "Pistol", 11: "Shotgun", 12: "SMG", 13: "Assault Rifle",
+    14: "Sniper", 15: "Heavy", 16: "Shield", 17: "Grenade", 18: "Relic"
+}
+def _tags_text(rarity: Optional[int], manufacturer: Optional[int], item_class: Optional[int])->str:
+    bits = []
+    if rarity is not None: bits.append(f"rarity={rarity}")
+    if manufacturer is not None: bits.append(f"mfr={manufacturer}")
+    if item_class is not None: bits.append(f"class={item_class}")
+    return " | ".join(bits) if bits else "—"
+
+def _compact_tags(d: 'DecodedItem')->str:
+    s = getattr(d, 'stats', None)
+    return _tags_text(s.rarity, s.manufacturer, s.item_class) if s is not None else "—"
+
+
+def _friendly_from_decoded(d: 'DecodedItem')->str:
+    """Return the best human-friendly name we can compute.
+    Priority:
+      1) Known serial prefix → weapon name 
+      2) Manufacturer + ItemClass (when both available)
+      3) ItemClass only
+      4) Generic by item_type
+    """
+    s = getattr(d, 'stats', None)
+    return _friendly_name(getattr(d, 'serial', None), getattr(d, 'item_type', '?'),
+                          getattr(s, 'manufacturer', None), getattr(s, 'item_class', None))
+
+
+def _friendly_name(serial: Optional[str], item_type: str, manufacturer: Optional[int], item_class: Optional[int])->str:
+    try:
+        if serial is not None:
+            nm = _weapon_name_from_serial(serial)
+            if nm:
+                return nm
+    except Exception:
+        pass
+    # Fallbacks based on decoded stats maps
+    brand = _MANUFACTURER_MAP.get(manufacturer, None)
+    kind = _ITEMCLASS_MAP.get(item_class, None)
+    if brand and kind:
+        return f"{brand} {kind}"
+    if kind:
+        return kind
+    return {"r":"Weapon","e":"Equipment","d":"Equipment Alt","u":"Special","f":"Special","!":"Special"}.get(item_type, "Unknown")
+
+
+def decode_item_serial(serial: str)->DecodedItem:
+    """Editable decode of `serial`; the unpacking is shared through SERIAL_CACHE."""
+    return SERIAL_CACHE.get(serial).item()
+
+# ── Batch decode (columnar) ───────────────────────────────────────────────────
+_CATEGORIES={'r':'weapon','e':'equipment','d':'equipment_alt','w':'weapon_special','u':'utility','f':'consumable','!':'special'}
+_HEAD=20   # no field is read past the first 20 bytes
+_NUMERIC_COLUMNS=("length","primary_stat","secondary_stat","level","rarity","manufacturer","item_class")
+_ROW_COLUMNS=_NUMERIC_COLUMNS[1:]
+
+class ItemColumns:
+    """
+    decode_item_serials() result, one column per field; row i is serials[i]. Numeric columns
+    are int arrays (numpy when installed, else array('i')) holding MISSING where
+    decode_item_serial() would give None.
+    """
+    MISSING = -1
+    __slots__ = ("serial", "item_type", "category", "confidence") + _NUMERIC_COLUMNS
+
+    def __init__(self, serial: List[str], item_type: List[str], category: List[str], confidence: List[str], **numeric):
+        self.serial = serial; self.item_type = item_type; self.category = category; self.confidence = confidence
+        for name in _NUMERIC_COLUMNS: setattr(self, name, numeric[name])
+
+    def __len__(self) -> int:
+        return len(self.serial)
+
+    def value(self, name: str, i: int) -> Optional[int]:
+        """Row i of a numeric column as decode_item_serial() would report it (None if missing)."""
+        v = int(getattr(self, name)[i]); return None if v < 0 else v
+
+def _row_fields(t: str, b: bytes):
+    """(primary, secondary, level, rarity, manufacturer, item_class, confidence) of one decoded
+    serial; -1 = None. These are the per-type field rules ('r' weapon, 'e'/'d' equipment, anything
+    else generic); _columns_np applies the same rules to whole columns."""
+    n=len(b)
+    def by(i): return b[i] if i<n else -1
+    def v16(i): return b[i]|b[i+1]<<8 if i+2<=n else -1
+    if t=='r':
+        lv=by(13)
+        return (v16(0),v16(12),lv if lv in (2,34) else -1,by(1),by(4),by(8),"high" if n in (24,26) else "medium")
+    if t=='e':
+        return (v16(2),v16(8),v16(10) if n>38 else -1,by(9),by(1),by(3),"high" if by(1)==49 else "medium")
+    if t=='d':
+        return (v16(4),v16(8),v16(10),by(14),by(5),by(6),"high" if by(5)==15 else "medium")
+    ps=[v for v in map(v16,range(0,_HEAD,2)) if 100<=v<=10000]
+    return (ps[0] if ps else -1,ps[1] if len(ps)>1 else -1,-1,by(2),by(1),-1,"low")
+
+# bytes.translate tables for the vectorized unpack: ASCII symbol -> alphabet index, anything else deleted
+_SYMBOL_INDEX=bytes(max(_ALPHABET.find(chr(c)),0) for c in range(256))
+_NOT_SYMBOL=bytes(c for c in range(256) if chr(c) not in _ALPHABET)
+_HEAD_SYMBOLS=(_HEAD*8+5)//6   # enough symbols to cover the head even when all are 6 bits wide
+_NO_SYMBOL=b"\x80"   # pads short rows of the symbol matrix; never a real index
+
+def _unpack_heads_np(serials: List[str]):
+    """bit_pack_decode() of every serial at once, keeping the first _HEAD bytes:
+    (n x _HEAD zero-padded head bytes, decoded lengths)."""
+    syms=[(s[3:] if s.startswith("@Ug") else s).encode("ascii","ignore").translate(_SYMBOL_INDEX,_NOT_SYMBOL) for s in serials]
+    n=len(syms)
+    # decoded length: 6 bits per symbol plus one for each past index 63
+    lens=_np.fromiter(map(len,syms),_np.int64,n); ends=_np.cumsum(lens)
+    wide=_np.concatenate(([0],_np.cumsum(_np.frombuffer(b"".join(syms),_np.uint8)>=64)))
+    nbits=6*lens+wide[ends]-wide[ends-lens]
+    # n x _HEAD_SYMBOLS symbol matrix; each symbol's low 6 or 7 bits, MSB first, form the bit stream
+    sym=_np.frombuffer(b"".join(x[:_HEAD_SYMBOLS].ljust(_HEAD_SYMBOLS,_NO_SYMBOL) for x in syms),_np.uint8).reshape(n,_HEAD_SYMBOLS)
+    width=(sym!=_NO_SYMBOL[0]).view(_np.uint8)*(6+(sym>=64).view(_np.uint8))
+    stream=_np.append(_np.unpackbits(sym[...,None],axis=-1)[_np.arange(8)>=(8-width)[...,None]],_np.uint8(0))
+    count=width.sum(1,dtype=_np.int64); k=_np.arange(_HEAD*8)
+    idx=_np.cumsum(count)[:,None]-count[:,None]+k
+    idx[k>=count[:,None]]=len(stream)-1   # past the row's bits: the trailing 0
+    return _np.packbits(stream[idx],axis=1).astype(_np.int32),((nbits+7)//8).astype(_np.int32)
+
+def _columns_np(types: List[str], head, length) -> dict:
+    M=ItemColumns.MISSING
+    def by(i): return _np.where(length>i,head[:,i],M)
+    def v16(i): return _np.where(length>=i+2,head[:,i]|head[:,i+1]<<8,M)
+    tt=_np.array(types,dtype="U1")
+    groups=[tt=='r',tt=='e',tt=='d']
+    def pick(r,e,d,other): return _np.select(groups,[r,e,d],other).astype(_np.int32)
+    # generic types: the first two 16-bit values in 100..10000 (potential_stats)
+    grid=_np.stack([v16(i) for i in range(0,_HEAD,2)],1)
+    hit=(grid>=100)&(grid<=10000); rank=_np.cumsum(hit,1)
+    def nth(k):
+        m=hit&(rank==k); return _np.where(m.any(1),(grid*m).sum(1),M)
+    lv=by(13)
+    high=_np.select(groups,[(length==24)|(length==26),by(1)==49,by(5)==15],False)
+    return dict(
+        confidence=_np.where(groups[0]|groups[1]|groups[2],_np.where(high,"high","medium"),"low").tolist(),
+        length=length,
+        primary_stat=pick(v16(0),v16(2),v16(4),nth(1)),
+        secondary_stat=pick(v16(12),v16(8),v16(8),nth(2)),
+        level=pick(_np.where((lv==2)|(lv==34),lv,M),_np.where(length>38,v16(10),M),v16(10),M),
+        rarity=pick(by(1),by(9),by(14),by(2)),
+        manufacturer=pick(by(4),by(1),by(5),by(1)),
+        item_class=pick(by(8),by(3),by(6),M),
+    )
+
+def _decode_columns(serials: List[str], types: List[str], category: List[str]) -> ItemColumns:
+    if _numpy() is not None:
+        head,length=_unpack_heads_np(serials)
+        return ItemColumns(serials,types,category,**_columns_np(types,head,length))
+    cols={name: array('i') for name in _NUMERIC_COLUMNS}; conf=[]
+    for s,t in zip(serials,types):
+        b=bit_pack_decode(s); row=_row_fields(t,b)
+        cols["length"].append(len(b)); conf.append(row[6])
+        for name,val in zip(_ROW_COLUMNS,row): cols[name].append(val)
+    return ItemColumns(serials,types,category,conf,**cols)
+
+def _columns_from_records(serials: List[str], types: List[str], category: List[str], recs: List['SerialRecord']) -> ItemColumns:
+    n=len(recs); conf=[r.confidence for r in recs]
+    if _numpy() is not None:
+        grid=_np.fromiter(chain.from_iterable(r.row for r in recs),_np.int32,n*len(_ROW_COLUMNS)).reshape(n,len(_ROW_COLUMNS)).T.copy()
+        cols=dict(zip(_ROW_COLUMNS,grid)); cols["length"]=_np.fromiter((r.length for r in recs),_np.int32,n)
+    else:
+        cols={name: array('i',(r.row[j] for r in recs)) for j,name in enumerate(_ROW_COLUMNS)}
+        cols["length"]=array('i',(r.length for r in recs))
+    return ItemColumns(serials,types,category,conf,**cols)
+
+def decode_item_serials(serials: Sequence[str]) -> ItemColumns:
+    """
+    Decode many serials at once into columns, with decode_item_serial()'s per-type rules but
+    no DecodedItem per serial. Serials already in SERIAL_CACHE are not decoded again; the rest
+    go through one batch (with NumPy the unpack and the field reads run over a 2-D array of
+    every serial's first bytes, one masked pass per type; otherwise the scalar codec) and are
+    added to the cache.
+    """
+    t0=time.perf_counter(); cache=SERIAL_CACHE; hits,misses=cache.hits,cache.misses
+    serials=list(serials)
+    types=[s[3] if s.startswith("@Ug") and len(s)>=4 else "?" for s in serials]
+    category=[_CATEGORIES.get(t,"unknown") for t in types]
+    if not cache.maxsize:
+        cols=_decode_columns(serials,types,category)
+    else:
+        recs=[cache.lookup(s) for s in serials]
+        missing=list(dict.fromkeys(s for s,r in zip(serials,recs) if r is None))
+        if missing:
+            mt=[s[3] if s.startswith("@Ug") and len(s)>=4 else "?" for s in missing]
+            fresh=_decode_columns(missing,mt,[_CATEGORIES.get(t,"unknown") for t in mt])
+            rows=zip(*(getattr(fresh,name).tolist() for name in _ROW_COLUMNS))
+            new={}
+            for s,t,c,conf,ln,row in zip(missing,mt,fresh.category,fresh.confidence,fresh.length.tolist(),rows):
+                new[s]=cache.put(SerialRecord(s,t,c,conf,ln,row))
+            recs=[r or new[s] for s,r in zip(serials,recs)]
+        cols=_columns_from_records(serials,types,category,recs)
+    if trace.enabled():
+        trace.record("serials", time.perf_counter()-t0, rows=len(serials), hits=cache.hits-hits,
+                     misses=cache.misses-misses, cached=len(cache), total_hits=cache.hits, total_misses=cache.misses)
+    return cols
+
+# ── Decoded-serial cache ──────────────────────────────────────────────────────
+class SerialRecord:
+    """
+    Immutable decode of one serial, as kept in SERIAL_CACHE: one ItemColumns row (`row` holds
+    primary_stat..item_class with MISSING for None) plus the decoded bytes, unpacked on first
+    use. item() gives a fresh, editable DecodedItem.
+    """
+    __slots__ = ("serial", "item_type", "category", "confidence", "length", "row", "_data")
+
+    def __init__(self, serial: str, item_type: str, category: str, confidence: str, length: int,
+                 row: Sequence[int], data: Optional[bytes] = None):
+        init = object.__setattr__
+        init(self, "serial", serial); init(self, "item_type", item_type); init(self, "category", category)
+        init(self, "confidence", confidence); init(self, "length", length); init(self, "row", tuple(row))
+        init(self, "_data", data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"SerialRecord is read-only ({name})")
+    __delattr__ = __setattr__
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None: object.__setattr__(self, "_data", bit_pack_decode(self.serial))
+        return self._data
+
+    def value(self, name: str) -> Optional[int]:
+        v = self.row[_ROW_COLUMNS.index(name)]; return None if v < 0 else v
+
+    def item(self) -> DecodedItem:
+        s = ItemStats()
+        for name, v in zip(_ROW_COLUMNS, self.row):
+            if v >= 0: setattr(s, name, v)
+        return DecodedItem(self.serial, self.item_type, self.category, self.length, s, None, self.confidence, self.data)
+
+def _decode_record(serial: str) -> SerialRecord:
+    b=bit_pack_decode(serial)
+    t=serial[3] if serial.startswith("@Ug") and len(serial)>=4 else "?"
+    row=_row_fields(t,b)
+    return SerialRecord(serial,t,_CATEGORIES.get(t,"unknown"),row[6],len(b),row[:6],b)
+
+class SerialCache:
+    """
+    Bounded LRU of SerialRecords keyed by serial string. maxsize=0 turns caching off (every
+    get() decodes). hits/misses count lookups since start-up.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize; self.hits = self.misses = 0
+        self._records: "OrderedDict[str, SerialRecord]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def lookup(self, serial: str) -> Optional[SerialRecord]:
+        rec = self._records.get(serial)
+        if rec is None: self.misses += 1; return None
+        self.hits += 1; self._records.move_to_end(serial)
+        return rec
+
+    def put(self, rec: SerialRecord) -> SerialRecord:
+        if self.maxsize > 0:
+            self._records[rec.serial] = rec; self._records.move_to_end(rec.serial)
+            while len(self._records) > self.maxsize: self._records.popitem(last=False)
+        return rec
+
+    def get(self, serial: str) -> SerialRecord:
+        rec = self.lookup(serial)
+        return rec if rec is not None else self.put(_decode_record(serial))
+
+    def invalidate(self, serial: str) -> None:
+        self._records.pop(serial, None)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._records), "maxsize": self.maxsize}
+
+def _cache_size() -> int:
+    try: return max(0, int(os.environ.get("BL4_SERIAL_CACHE", "4096")))
+    except ValueError: return 4096
+
+SERIAL_CACHE = SerialCache(_cache_size())   # process-wide; BL4_SERIAL_CACHE=0 disables
+
+def serial_record(serial: str) -> SerialRecord:
+    """Cached, read-only decode of `serial`."""
+    return SERIAL_CACHE.get(serial)
+
+def forget_serial(serial: str) -> None:
+    """Drop `serial` from the cache (called when the save entry holding it is rewritten)."""
+    SERIAL_CACHE.invalidate(serial)
+
+def encode_item_serial(d: DecodedItem)->str:
+    import struct
+    b=bytearray(bit_pack_decode(d.serial))
+    try:
+        if d.item_type=='r':
+            if d.stats.primary_stat is not None and len(b)>=2: struct.pack_into('<H', b, 0, d.stats.primary_stat)
+            if d.stats.secondary_stat is not None and len(b)>=14: struct.pack_into('<H', b, 12, d.stats.secondary_stat)
+            if d.stats.rarity is not None and len(b)>=2: b[1]=int(d.stats.rarity)&0xFF
+            if d.stats.manufacturer is not None and len(b)>=5: b[4]=int(d.stats.manufacturer)&0xFF
+            if d.stats.item_class is not None and len(b)>=9: b[8]=int(d.stats.item_class)&0xFF
+        elif d.item_type=='e':
+            if d.stats.primary_stat is not None and len(b)>=4: struct.pack_into('<H', b, 2, d.stats.primary_stat)
+            if d.stats.secondary_stat is not None and len(b)>=10: struct.pack_into('<H', b, 8, d.stats.secondary_stat)
+            if d.stats.manufacturer is not None and len(b)>=2: b[1]=int(d.stats.manufacturer)&0xFF
+            if d.stats.item_class is not None and len(b)>=4: b[3]=int(d.stats.item_class)&0xFF
+            if d.stats.rarity is not None and len(b)>=10: b[9]=int(d.stats.rarity)&0xFF
+        elif d.item_type=='d':
+            if d.stats.primary_stat is not None and len(b)>=6: struct.pack_into('<H', b, 4, d.stats.primary_stat)
+            if d.stats.secondary_stat is not None and len(b)>=10: struct.pack_into('<H', b, 8, d.stats.secondary_stat)
+            if d.stats.manufacturer is not None and len(b)>=6: b[5]=int(d.stats.manufacturer)&0xFF
+            if d.stats.item_class is not None and len(b)>=7: b[6]=int(d.stats.item_class)&0xFF
+    except Exception:
+        pass
+    prefix=f"@Ug{d.item_type}"
+    return bit_pack_encode(bytes(b), prefix)
+
+# ── YAML decoded-items helpers ────────────────────────────────────────────────
+def find_and_decode_serials_in_yaml(yaml_data: dict) -> Dict[ItemPath, DecodedItem]:
+    """Decode every @Ug… string in the tree (mapping values and list items), keyed by path."""
+    return {ItemPath(p): decode_item_serial(v)
+            for p, _, v in walk_paths(yaml_data, types=(str,), where=lambda parent, k, v: v.startswith("@Ug"))}
+
+def insert_decoded_items_in_yaml(yaml_data: dict, decoded: Dict[str, DecodedItem]) -> dict:
+    out=yaml_data.copy(); out["_DECODED_ITEMS"]={}
+    for path,d in decoded.items():
+        item={
+            "original_serial": d.serial,
+            "item_type": d.item_type,
+            "category": d.item_category,
+            "confidence": d.confidence,
+            "stats": {}
+        }
+        s=d.stats
+        if s.primary_stat is not None: item["stats"]["primary_stat"]=s.primary_stat
+        if s.secondary_stat is not None: item["stats"]["secondary_stat"]=s.secondary_stat
+        if s.level is not None: item["stats"]["level"]=s.level
+        if s.rarity is not None: item["stats"]["rarity"]=s.rarity
+        if s.manufacturer is not None: item["stats"]["manufacturer"]=s.manufacturer
+        if s.item_class is not None: item["stats"]["item_class"]=s.item_class
+        out["_DECODED_ITEMS"][path.dotted() if isinstance(path, ItemPath) else path]=item
+    return out
+
+def set_nested_value(data: dict, path: Union[ItemPath, str], value: str):
+    """Set `value` at an ItemPath, or at a dotted _DECODED_ITEMS key ("state.inventory.items[3].serial")."""
+    (path if isinstance(path, ItemPath) else ItemPath.parse(path, ".")).set(data, value)
+
+def extract_and_encode_serials_from_yaml(yaml_data: dict) -> dict:
+    if "_DECODED_ITEMS" not in yaml_data: return yaml_data
+    out=yaml_data.copy()
+    for path, info in yaml_data["_DECODED_ITEMS"].items():
+        d=DecodedItem(
+            serial=info["original_serial"],
+            item_type=info["item_type"],
+            category=info.get("category","unknown"),
+            data_len=0,
+            stats=ItemStats(),
+            raw={},
+            conf=info.get("confidence","low")
+        )
+        st=info.get("stats",{})
+        d.stats.primary_stat=st.get("primary_stat")
+        d.stats.secondary_stat=st.get("secondary_stat")
+        d.stats.level=st.get("level")
+        d.stats.rarity=st.get("rarity")
+        d.stats.manufacturer=st.get("manufacturer")
+        d.stats.item_class=st.get("item_class")
+        new_serial=encode_item_serial(d)
+        set_nested_value(out, path, new_serial)
+        if new_serial!=d.serial: forget_serial(d.serial)
+    out.pop("_DECODED_ITEMS", None)
+    return out
@@ -0,0 +1,109 @@
+"""
+Opt-in tracing for the save pipeline: named spans (aes, unpad, inflate, checksum, …)
+with durations and byte counts, written as one JSON object per line so runs over
+thousands of files can be aggregated with jq/pandas.
+
+Disabled by default, and then free: span() hands back a shared no-op object and
+hot loops check enabled() once before timing anything. Enable with
+BL4_TRACE=1 (stderr), BL4_TRACE=/path/trace.jsonl (append), --debug on the CLI or
+GUI, or enable() from code.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+_sink: Optional[Callable[[str], None]] = None
+_lock = threading.Lock()
+_context: Dict[str, Any] = {}
+
+
+class _NoSpan:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+    def set(self, **fields): pass
+
+NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("name", "fields", "t0")
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name = name; self.fields = fields; self.t0 = 0.0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter(); return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.fields["error"] = f"{exc_type.__name__}: {exc}"
+        record(self.name, time.perf_counter() - self.t0, **self.fields)
+        return False
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+
+def enabled() -> bool:
+    return _sink is not None
+
+
+def span(name: str, **fields):
+    """Context manager timing a block; .set(**fields) adds fields before it closes."""
+    return NO_SPAN if _sink is None else _Span(name, fields)
+
+
+def record(name: str, seconds: float, **fields) -> None:
+    """Emit a finished span measured by the caller (e.g. summed over stream chunks)."""
+    if _sink is None: return
+    rec = {"ts": round(time.time(), 6), "pid": os.getpid(), "span": name, "ms": round(seconds * 1000, 3)}
+    rec.update(_context); rec.update(fields)
+    line = json.dumps(rec, default=str) + "\n"
+    with _lock:
+        _sink(line)
+
+
+class context:
+    """Fields (e.g. file=...) attached to every record emitted inside the with-block."""
+    def __init__(self, **fields):
+        self.fields = fields; self.saved = None
+
+    def __enter__(self):
+        global _context
+        self.saved = _context; _context = {**_context, **self.fields}
+        return self
+
+    def __exit__(self, *exc):
+        global _context
+        _context = self.saved
+        return False
+
+
+def enable(target: Optional[str] = None) -> None:
+    """target: None/"1"/"stderr", "-"/"stdout", or a file path (appended, line-buffered)."""
+    global _sink
+    target = (target or "stderr").strip()
+    if target.lower() in ("1", "true", "yes", "on", "stderr"):
+        stream = sys.stderr
+    elif target in ("-", "stdout"):
+        stream = sys.stdout
+    else:
+        stream = open(target, "a", encoding="utf-8", buffering=1)
+    def _write(line: str):
+        stream.write(line); stream.flush()
+    _sink = _write
+
+
+def disable() -> None:
+    global _sink
+    _sink = None
+
+
+_env = os.environ.get("BL4_TRACE", "").strip()
+if _env and _env.lower() not in ("0", "false", "no", "off"):
+    enable(_env)
@@ -0,0 +1,656 @@
+"""
+Unlock catalogs and headless unlock helpers (map, class, cosmetics, profile).
+Functions take plain dicts and an optional ``log`` callable instead of UI state.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# ── Embedded Profile Unlock Catalog (fallback, no CSV required) ───────────────
+EMBEDDED_PROFILE_UNLOCKS = {
+    "shared_progress": [
+        "shared_progress.vault_hunter_level",
+        "shared_progress.prologue_completed",
+        "shared_progress.story_completed",
+        "shared_progress.epilogue_started",
+    ],
+    "unlockable_echo4": [
+        "Unlockable_Echo4.attachment01_partyhat",
+        "Unlockable_Echo4.attachment04_wings",
+        "Unlockable_Echo4.attachment03_bolt",
+        "Unlockable_Echo4.attachment09_goggles",
+        "Unlockable_Echo4.Skin01_Prison",
+        "Unlockable_Echo4.Skin02_Order",
+        "Unlockable_Echo4.Skin03_Ghost",
+        "Unlockable_Echo4.Skin04_Tech",
+        "Unlockable_Echo4.Skin05_Ripper",
+        "Unlockable_Echo4.Skin11_Astral",
+        "Unlockable_Echo4.Skin21_Graffiti",
+        "Unlockable_Echo4.Skin22_Knitted",
+        "Unlockable_Echo4.Skin25_Slimed",
+        "Unlockable_Echo4.Skin29_Guardian",
+        "Unlockable_Echo4.Skin31_Koto",
+        "Unlockable_Echo4.Skin33_Jakobs",
+        "Unlockable_Echo4.Skin35_Vladof",
+        "Unlockable_Echo4.Skin36_Torgue",
+        "Unlockable_Echo4.Skin37_Maliwan",
+        "Unlockable_Echo4.Skin38_CyberPop",
+        "Unlockable_Echo4.Skin39_Critters",
+        "Unlockable_Echo4.Skin40_Veil",
+        "Unlockable_Echo4.Skin42_Legacy",
+        "Unlockable_Echo4.Skin50_BreakTheGame",
+        "Unlockable_Echo4.Skin24_PreOrder",
+        "Unlockable_Echo4.Skin14_Fire",
+        "Unlockable_Echo4.attachment10_crown",
+        "Unlockable_Echo4.Body03_Ripper",
+        "Unlockable_Echo4.attachment07_horns",
+        "Unlockable_Echo4.Skin07_RedHanded",
+        "Unlockable_Echo4.Skin19_Dirty",
+        "Unlockable_Echo4.Skin45_BreakFree",
+        "Unlockable_Echo4.attachment08_tinfoilhat",
+        "Unlockable_Echo4.Skin09_Sewer",
+        "Unlockable_Echo4.Skin18_Electi",
+        "Unlockable_Echo4.Skin15_Survivalist",
+        "Unlockable_Echo4.Skin17_Auger",
+        "Unlockable_Echo4.Skin27_Space",
+        "Unlockable_Echo4.Body01_GeneVIV",
+        "Unlockable_Echo4.Skin12_Tediore",
+        "Unlockable_Echo4.Skin32_DuctTaped",
+        "Unlockable_Echo4.Skin16_Crimson",
+    ],
+    "unlockable_darksiren": [
+        "Unlockable_DarkSiren.Head01_Prison",
+        "Unlockable_DarkSiren.Body01_Prison",
+        "Unlockable_DarkSiren.Skin01_Prison",
+        "Unlockable_DarkSiren.Skin02_Order",
+        "Unlockable_DarkSiren.Skin03_Ghost",
+        "Unlockable_DarkSiren.Skin04_Tech",
+        "Unlockable_DarkSiren.Skin05_Ripper",
+        "Unlockable_DarkSiren.Skin06_Amara",
+        "Unlockable_DarkSiren.Skin07_RedHanded",
+        "Unlockable_DarkSiren.Skin08_Corrupted",
+        "Unlockable_DarkSiren.Skin21_Graffiti",
+        "Unlockable_DarkSiren.Skin29_Guardian",
+        "Unlockable_DarkSiren.Skin31_Koto",
+        "Unlockable_DarkSiren.Skin37_Maliwan",
+        "Unlockable_DarkSiren.Skin39_Critters",
+        "Unlockable_DarkSiren.Skin40_Veil",
+        "Unlockable_DarkSiren.Head02_PigTails",
+        "Unlockable_DarkSiren.Head03_MoHawk",
+        "Unlockable_DarkSiren.Head05_BikeHelmet",
+        "Unlockable_DarkSiren.Head06_PunkMask",
+        "Unlockable_DarkSiren.Head07_Demon",
+        "Unlockable_DarkSiren.Head11_Ripper",
+        "Unlockable_DarkSiren.Head12_Order",
+        "Unlockable_DarkSiren.Head23_CrashTestDummy",
+        "Unlockable_DarkSiren.Skin24_PreOrder",
+        "Unlockable_DarkSiren.Body02_Premium",
+        "Unlockable_DarkSiren.Head16_Premium",
+        "Unlockable_DarkSiren.Skin44_Premium",
+        "Unlockable_DarkSiren.Skin10_Hawaiian",
+        "Unlockable_DarkSiren.Skin14_Fire",
+        "Unlockable_DarkSiren.Skin25_Slimed",
+        "Unlockable_DarkSiren.Skin26_Camo",
+        "Unlockable_DarkSiren.Skin34_Daedalus",
+        "Unlockable_DarkSiren.Skin45_BreakFree",
+        "Unlockable_DarkSiren.Head08_Survivalist",
+        "Unlockable_DarkSiren.Skin09_Sewer",
+        "Unlockable_DarkSiren.Head09_Electi",
+        "Unlockable_DarkSiren.Head15_CrimeLord",
+        "Unlockable_DarkSiren.Skin11_Astral",
+        "Unlockable_DarkSiren.Head10_Transhuman",
+        "Unlockable_DarkSiren.Skin18_Electi",
+        "Unlockable_DarkSiren.Skin13_3CatMoon",
+        "Unlockable_DarkSiren.Skin15_Survivalist",
+        "Unlockable_DarkSiren.Skin17_Auger",
+        "Unlockable_DarkSiren.Skin27_Space",
+        "Unlockable_DarkSiren.Head04_Shades",
+        "Unlockable_DarkSiren.Skin12_Tediore",
+        "Unlockable_DarkSiren.Head14_Thresher",
+        "Unlockable_DarkSiren.Skin16_Crimson",
+    ],
+    "unlockable_exosoldier": [
+        "Unlockable_ExoSoldier.Head01_Prison",
+        "Unlockable_ExoSoldier.Body01_Prison",
+        "Unlockable_ExoSoldier.Skin01_Prison",
+        "Unlockable_ExoSoldier.Skin02_Order",
+        "Unlockable_ExoSoldier.Skin03_Ghost",
+        "Unlockable_ExoSoldier.Skin04_Tech",
+        "Unlockable_ExoSoldier.Skin05_Ripper",
+        "Unlockable_ExoSoldier.Skin06_Amara",
+        "Unlockable_ExoSoldier.Skin07_RedHanded",
+        "Unlockable_ExoSoldier.Skin08_Corrupted",
+        "Unlockable_ExoSoldier.Skin21_Graffiti",
+        "Unlockable_ExoSoldier.Skin29_Guardian",
+        "Unlockable_ExoSoldier.Skin31_Koto",
+        "Unlockable_ExoSoldier.Skin37_Maliwan",
+        "Unlockable_ExoSoldier.Skin39_Critters",
+        "Unlockable_ExoSoldier.Skin40_Veil",
+        "Unlockable_ExoSoldier.Head02_Mullet",
+        "Unlockable_ExoSoldier.Head03_Guerilla",
+        "Unlockable_ExoSoldier.Head04_TechHawk",
+        "Unlockable_ExoSoldier.Head06_BlindFold",
+        "Unlockable_ExoSoldier.Head07_Helm",
+        "Unlockable_ExoSoldier.Head11_Ripper",
+        "Unlockable_ExoSoldier.Head12_Order",
+        "Unlockable_ExoSoldier.Head23_CrushTestDummy",
+        "Unlockable_ExoSoldier.Skin24_PreOrder",
+        "Unlockable_ExoSoldier.Body02_Premium",
+        "Unlockable_ExoSoldier.Head16_Premium",
+        "Unlockable_ExoSoldier.Skin44_Premium",
+        "Unlockable_ExoSoldier.Skin10_Hawaiian",
+        "Unlockable_ExoSoldier.Skin14_Fire",
+        "Unlockable_ExoSoldier.Skin25_Slimed",
+        "Unlockable_ExoSoldier.Skin26_Camo",
+        "Unlockable_ExoSoldier.Skin34_Daedalus",
+        "Unlockable_ExoSoldier.Skin45_BreakFree",
+        "Unlockable_ExoSoldier.Head08_Survivalist",
+        "Unlockable_ExoSoldier.Skin09_Sewer",
+        "Unlockable_ExoSoldier.Head09_Electi",
+        "Unlockable_ExoSoldier.Head15_CrimeLord",
+        "Unlockable_ExoSoldier.Skin11_Astral",
+        "Unlockable_ExoSoldier.Head10_Transhuman",
+        "Unlockable_ExoSoldier.Skin18_Electi",
+        "Unlockable_ExoSoldier.Skin13_3CatMoon",
+        "Unlockable_ExoSoldier.Skin15_Survivalist",
+        "Unlockable_ExoSoldier.Skin17_Auger",
+        "Unlockable_ExoSoldier.Skin27_Space",
+        "Unlockable_ExoSoldier.Head05_LongHair",
+        "Unlockable_ExoSoldier.Skin12_Tediore",
+        "Unlockable_ExoSoldier.Head14_Thresher",
+        "Unlockable_ExoSoldier.Skin16_Crimson",
+    ],
+    "unlockable_gravitar": [
+        "Unlockable_Gravitar.Head01_Prison",
+        "Unlockable_Gravitar.Body01_Prison",
+        "Unlockable_Gravitar.Skin01_Prison",
+        "Unlockable_Gravitar.Skin02_Order",
+        "Unlockable_Gravitar.Skin03_Ghost",
+        "Unlockable_Gravitar.Skin04_Tech",
+        "Unlockable_Gravitar.Skin05_Ripper",
+        "Unlockable_Gravitar.Skin06_Amara",
+        "Unlockable_Gravitar.Skin07_RedHanded",
+        "Unlockable_Gravitar.Skin08_Corrupted",
+        "Unlockable_Gravitar.Skin21_Graffiti",
+        "Unlockable_Gravitar.Skin29_Guardian",
+        "Unlockable_Gravitar.Skin31_Koto",
+        "Unlockable_Gravitar.Skin37_Maliwan",
+        "Unlockable_Gravitar.Skin39_Critters",
+        "Unlockable_Gravitar.Skin40_Veil",
+        "Unlockable_Gravitar.Head02_DreadBuns",
+        "Unlockable_Gravitar.Head03_Helmet",
+        "Unlockable_Gravitar.Head04_TechBraids",
+        "Unlockable_Gravitar.Head05_SafetyFirst",
+        "Unlockable_Gravitar.Head07_VRPunk",
+        "Unlockable_Gravitar.Head11_Ripper",
+        "Unlockable_Gravitar.Head12_Order",
+        "Unlockable_Gravitar.Head23_CrushTestDummy",
+        "Unlockable_Gravitar.Skin24_PreOrder",
+        "Unlockable_Gravitar.Body02_Premium",
+        "Unlockable_Gravitar.Head16_Premium",
+        "Unlockable_Gravitar.Skin44_Premium",
+        "Unlockable_Gravitar.Skin10_Hawaiian",
+        "Unlockable_Gravitar.Skin14_Fire",
+        "Unlockable_Gravitar.Skin25_Slimed",
+        "Unlockable_Gravitar.Skin26_Camo",
+        "Unlockable_Gravitar.Skin34_Daedalus",
+        "Unlockable_Gravitar.Skin45_BreakFree",
+        "Unlockable_Gravitar.Head08_Survivalist",
+        "Unlockable_Gravitar.Skin09_Sewer",
+        "Unlockable_Gravitar.Head09_Electi",
+        "Unlockable_Gravitar.Head15_CrimeLord",
+        "Unlockable_Gravitar.Skin11_Astral",
+        "Unlockable_Gravitar.Head10_Transhuman",
+        "Unlockable_Gravitar.Skin18_Electi",
+        "Unlockable_Gravitar.Skin13_3CatMoon",
+        "Unlockable_Gravitar.Skin15_Survivalist",
+        "Unlockable_Gravitar.Skin17_Auger",
+        "Unlockable_Gravitar.Skin27_Space",
+        "Unlockable_Gravitar.Head06_RoundGlasses",
+        "Unlockable_Gravitar.Skin12_Tediore",
+        "Unlockable_Gravitar.Head14_Thresher",
+        "Unlockable_Gravitar.Skin16_Crimson",
+    ],
+    "unlockable_paladin": [
+        "Unlockable_Paladin.Head01_Prison",
+        "Unlockable_Paladin.Body01_Prison",
+        "Unlockable_Paladin.Skin01_Prison",
+        "Unlockable_Paladin.Skin02_Order",
+        "Unlockable_Paladin.Skin03_Ghost",
+        "Unlockable_Paladin.Skin04_Tech",
+        "Unlockable_Paladin.Skin05_Ripper",
+        "Unlockable_Paladin.Skin06_Amara",
+        "Unlockable_Paladin.Skin07_RedHanded",
+        "Unlockable_Paladin.Skin08_Corrupted",
+        "Unlockable_Paladin.Skin21_Graffiti",
+        "Unlockable_Paladin.Skin29_Guardian",
+        "Unlockable_Paladin.Skin31_Koto",
+        "Unlockable_Paladin.Skin37_Maliwan",
+        "Unlockable_Paladin.Skin39_Critters",
+        "Unlockable_Paladin.Skin40_Veil",
+        "Unlockable_Paladin.Head02_PonyTail",
+        "Unlockable_Paladin.Head03_BaldMask",
+        "Unlockable_Paladin.Head04_Visor",
+        "Unlockable_Paladin.Head06_Hooded",
+        "Unlockable_Paladin.Head07_Headband",
+        "Unlockable_Paladin.Head11_Ripper",
+        "Unlockable_Paladin.Head12_Order",
+        "Unlockable_Paladin.Head23_CrushTestDummy",
+        "Unlockable_Paladin.Skin24_PreOrder",
+        "Unlockable_Paladin.Body02_Premium",
+        "Unlockable_Paladin.Head16_Premium",
+        "Unlockable_Paladin.Skin44_Premium",
+        "Unlockable_Paladin.Skin10_Hawaiian",
+        "Unlockable_Paladin.Skin14_Fire",
+        "Unlockable_Paladin.Skin25_Slimed",
+        "Unlockable_Paladin.Skin26_Camo",
+        "Unlockable_Paladin.Skin34_Daedalus",
+        "Unlockable_Paladin.Skin45_BreakFree",
+        "Unlockable_Paladin.Head08_Survivalist",
+        "Unlockable_Paladin.Skin09_Sewer",
+        "Unlockable_Paladin.Head09_Electi",
+        "Unlockable_Paladin.Head15_CrimeLord",
+        "Unlockable_Paladin.Skin11_Astral",
+        "Unlockable_Paladin.Head10_Transhuman",
+        "Unlockable_Paladin.Skin18_Electi",
+        "Unlockable_Paladin.Skin13_3CatMoon",
+        "Unlockable_Paladin.Skin15_Survivalist",
+        "Unlockable_Paladin.Skin17_Auger",
+        "Unlockable_Paladin.Skin27_Space",
+        "Unlockable_Paladin.Head05_Goth",
+        "Unlockable_Paladin.Skin12_Tediore",
+        "Unlockable_Paladin.Head14_Thresher",
+        "Unlockable_Paladin.Skin16_Crimson",
+    ],
+    "unlockable_weapons": [
+        "Unlockable_Weapons.Mat13_Whiteout",
+        "Unlockable_Weapons.Mat31_Splash",
+        "Unlockable_Weapons.Mat16_PolePosition",
+        "Unlockable_Weapons.Mat14_Grunt",
+        "Unlockable_Weapons.Mat18_CrashTest",
+        "Unlockable_Weapons.Mat07_CuteCat",
+        "Unlockable_Weapons.Mat19_Meltdown",
+        "Unlockable_Weapons.Mat36_PreOrder",
+        "Unlockable_Weapons.Mat38_HeadHunter",
+        "Unlockable_Weapons.shiny_ballista",
+        "Unlockable_Weapons.shiny_symmetry",
+        "Unlockable_Weapons.shiny_plasmacoil",
+        "Unlockable_Weapons.shiny_star_helix",
+        "Unlockable_Weapons.shiny_anarchy",
+        "Unlockable_Weapons.Mat01_Synthwave",
+        "Unlockable_Weapons.Mat29_Cheers",
+        "Unlockable_Weapons.Mat17_DeadWood",
+        "Unlockable_Weapons.Mat25_LocustGas",
+        "Unlockable_Weapons.Mat26_AugerSight",
+        "Unlockable_Weapons.Mat27_GoldenPower",
+        "Unlockable_Weapons.shiny_leadballoon",
+        "Unlockable_Weapons.shiny_convergence",
+        "Unlockable_Weapons.shiny_boomslang",
+        "Unlockable_Weapons.Mat08_EchoBot",
+        "Unlockable_Weapons.shiny_luty",
+        "Unlockable_Weapons.shiny_rocketreload",
+        "Unlockable_Weapons.Mat06_ElectiSamurai",
+        "Unlockable_Weapons.shiny_noisycricket",
+        "Unlockable_Weapons.shiny_heavyturret",
+        "Unlockable_Weapons.shiny_kaoson",
+        "Unlockable_Weapons.Mat33_Creepy",
+        "Unlockable_Weapons.Mat34_MoneyCamo",
+        "Unlockable_Weapons.Mat30_CrimsonRaiders",
+        "Unlockable_Weapons.Mat32_ImperialGuard",
+        "Unlockable_Weapons.shiny_kaleidosplode",
+        "Unlockable_Weapons.shiny_slugger",
+        "Unlockable_Weapons.shiny_beegun",
+        "Unlockable_Weapons.shiny_kickballer",
+        "Unlockable_Weapons.shiny_vamoose",
+    ],
+    "unlockable_vehicles": [
+        "Unlockable_Vehicles.Mat17_DeadWood",
+        "Unlockable_Vehicles.Mat16_PolePosition",
+        "Unlockable_Vehicles.Mat13_Whiteout",
+        "Unlockable_Vehicles.Mat29_Cheers",
+        "Unlockable_Vehicles.Mat09_FolkHero",
+        "Unlockable_Vehicles.Mat07_CuteCat",
+        "Unlockable_Vehicles.Mat22_Overload",
+        "Unlockable_Vehicles.Mat10_Graffiti",
+        "Unlockable_Vehicles.DarkSiren",
+        "Unlockable_Vehicles.DarkSiren_Proto",
+        "Unlockable_Vehicles.Paladin_Proto",
+        "Unlockable_Vehicles.Gravitar_Proto",
+        "Unlockable_Vehicles.ExoSoldier_Proto",
+        "Unlockable_Vehicles.Grazer",
+        "Unlockable_Vehicles.Borg",
+        "Unlockable_Vehicles.Mat27_GoldenPower",
+        "Unlockable_Vehicles.Mat23_FutureProof",
+        "Unlockable_Vehicles.Mat34_MoneyCamo",
+        "Unlockable_Vehicles.Mat20_Cyberspace",
+        "Unlockable_Vehicles.Mat19_Meltdown",
+        "Unlockable_Vehicles.mat47_jakobsuncommon",
+        "Unlockable_Vehicles.Mat01_Synthwave",
+        "Unlockable_Vehicles.Mat32_ImperialGuard",
+        "Unlockable_Vehicles.Mat33_Creepy",
+    ],
+}
+
+EMBEDDED_REWARD_PACKAGES = [
+    "RewardPackage_CharacterSkin_36_Torgue",
+    "RewardPackage_CharacterSkin_26_MoneyCamo",
+    "RewardPackage_CharacterSkin_03_Ghost",
+    "RewardPackage_CharacterSkin_37_Maliwan",
+    "RewardPackage_CharacterSkin_39_Critters",
+    "RewardPackage_CharacterSkin_38_Cyberpop",
+    "RewardPackage_CharacterSkin_34_Daedalus",
+    "RewardPackage_CharacterSkin_25_Slimed",
+    "RewardPackage_CharacterSkin_40_Veil",
+    "RewardPackage_CharacterHeads_06_UniqueE",
+    "RewardPackage_CharacterHeads_07_UniqueF",
+    "RewardPackage_EchoSkin_04_Tech",
+    "RewardPackage_EchoSkin_33_Jakobs",
+    "RewardPackage_EchoSkin_37_Maliwan",
+    "RewardPackage_EchoSkin_29_Guardian",
+    "RewardPackage_EchoSkin_11_Astral",
+    "RewardPackage_EchoSkin_35_Vladof",
+    "RewardPackage_EchoSkin_26_Camo",
+    "RewardPackage_EchoSkin_03_Ghost",
+    "RewardPackage_EchoSkin_02_Order",
+    "RewardPackage_EchoSkin_38_CyberPop",
+    "RewardPackage_EchoSkin_22_Knitted",
+    "RewardPackage_EchoSkin_25_Slimed",
+    "RewardPackage_EchoSkin_39_Critters",
+    "RewardPackage_EchoSkin_31_Koto",
+    "RewardPackage_EchoSkin_20_HighRoller",
+    "RewardPackage_EchoSkin_21_Graffiti",
+    "RewardPackage_EchoSkin_19_Dirty",
+    "RewardPackage_EchoSkin_40_Veil",
+    "RewardPackage_EchoSkin_06_Amara",
+    "RewardPackage_EchoSkin_36_Torgue",
+    "RewardPackage_EchoAttachment_10_Crown",
+    "RewardPackage_EchoAttachment_04_Wings",
+    "RewardPackage_EchoAttachment_03_Bolt",
+    "RewardPackage_EchoAttachment_09_Goggles",
+    "RewardPackage_WeaponSkin_16_PolePosition",
+    "RewardPackage_WeaponSkin_31_Splash",
+    "RewardPackage_WeaponSkin_13_Whiteout",
+    "RewardPackage_WeaponSkin_14_Grunt",
+    "RewardPackage_WeaponSkin_18_CrashTest",
+    "RewardPackage_WeaponSkin_07_CuteCat",
+    "RewardPackage_WeaponSkin_19_Meltdown",
+    "RewardPackage_VehicleSkin_17_DeadWood",
+    "Reward_Vehicle_DarkSiren",
+    "Reward_Vehicle_Grazer",
+    "Reward_HoverDrive_Jakobs_01",
+    "Reward_HoverDrive_Jakobs_02",
+    "Reward_HoverDrive_Maliwan_01",
+    "Reward_HoverDrive_Maliwan_02",
+    "Reward_HoverDrive_Maliwan_03",
+    "Reward_HoverDrive_Maliwan_04",
+    "Reward_HoverDrive_Daedalus_01",
+    "Reward_HoverDrive_Daedalus_02",
+    "Reward_HoverDrive_Daedalus_03",
+    "Reward_HoverDrive_Daedalus_04",
+    "Reward_HoverDrive_Vladof_01",
+    "Reward_HoverDrive_Vladof_02",
+    "Reward_HoverDrive_Vladof_03",
+    "RewardPackage_Combined_Propaganda",
+    "RewardPackage_PreOrder",
+    "RewardPackage_Premium",
+    "RewardPackage_Headhunter",
+    "RewardPackage_Legacy",
+    "ChallengeReward_Shiny_BeeGun",
+    "ChallengeReward_Shiny_Kickballer",
+    "ChallengeReward_Shiny_Vamoose",
+    "ChallengeReward_Shiny_anarchy",
+    "RewardPackage_CharacterSkin_19_Dirty",
+    "RewardPackage_CharacterSkin_30_Cute",
+    "RewardPackage_EchoAttachment_01_PartyHat",
+    "RewardPackage_EchoSkin_2_Order",
+    "RewardPackage_EchoSkin_3_Ghost",
+    "RewardPackage_GoldenEcho4",
+    "RewardPackage_SHiFT",
+    "RewardPackage_VehicleSkin_07_CuteCat",
+    "RewardPackage_VehicleSkin_10_Graffiti",
+    "RewardPackage_VehicleSkin_19_Meltdown",
+    "RewardPackage_VehicleSkin_42_Gratata",
+    "RewardPackage_WeaponSkin_20_Cyberspace",
+    "RewardPackage_WeaponSkin_21_Afterburn",
+    "RewardPackage_WeaponSkin_22_Overload",
+    "RewardPackage_WeaponSkin_23_FutureProof",
+    "Reward_HoverDrive_Borg_01",
+    "Reward_HoverDrive_Borg_02",
+    "Reward_HoverDrive_Borg_03",
+    "Reward_HoverDrive_Borg_04",
+    "Reward_HoverDrive_Borg_05",
+    "Reward_HoverDrive_Jakobs_03",
+    "Reward_HoverDrive_Jakobs_04",
+    "Reward_HoverDrive_Maliwan_05",
+    "Reward_HoverDrive_Order_01",
+    "Reward_HoverDrive_Order_02",
+    "Reward_HoverDrive_Order_03",
+    "Reward_HoverDrive_Order_04",
+    "Reward_HoverDrive_Order_05",
+    "Reward_HoverDrive_Tediore_01",
+    "Reward_HoverDrive_Tediore_02",
+    "Reward_HoverDrive_Tediore_03",
+    "Reward_HoverDrive_Tediore_04",
+    "Reward_HoverDrive_Tediore_05",
+    "Reward_HoverDrive_Torgue_01",
+    "Reward_HoverDrive_Torgue_02",
+    "Reward_HoverDrive_Torgue_03",
+    "Reward_HoverDrive_Torgue_04",
+    "Reward_HoverDrive_Torgue_05",
+    "Reward_HoverDrive_Vladof_04",
+    "Reward_HoverDrive_Vladof_05",
+    "Reward_Vehicle_Gravitar",
+    "pgraph.sdu_upgrades.Class_Mod_Slot",
+    "pgraph.sdu_upgrades.Enhancement_Slot",
+    "pgraph.sdu_upgrades.RepKit_Slot",
+    "pgraph.sdu_upgrades.Weapon_Slot_03",
+    "pgraph.sdu_upgrades.Weapon_Slot_04",
+]
+
+
+CHAR_UNLOCK_CATEGORIES = ["unlockable_darksiren","unlockable_paladin","unlockable_gravitar","unlockable_exosoldier"]
+ECHO_UNLOCK_CATEGORY = "unlockable_echo4"
+CASEFLEX_UNLOCK_CATEGORIES = {"unlockable_echo4","unlockable_darksiren","unlockable_paladin",
+                              "unlockable_gravitar","unlockable_exosoldier","unlockable_weapons"}
+
+_CLASS_ALIASES = {
+    "ECHO4": "Echo4", "ECHO 4": "Echo4",
+    "DARKSIREN": "DarkSiren", "DARK SIREN": "DarkSiren",
+    "EXOSOLDIER": "ExoSoldier", "EXO SOLDIER": "ExoSoldier",
+    "GRAVITAR": "Gravitar",
+    "PALADIN": "Paladin",
+}
+
+
+def unlock_all_map_areas(save_dict):
+    """Best-effort: ensure world/map/areas/locations exist and set visited/discovered=True.
+    If empty, seed a minimal 'ALL' entry so users still see an unlock effect."""
+    try:
+        if not isinstance(save_dict, dict):
+            return 0
+        world = save_dict.setdefault("state", {}).setdefault("world", {})
+        m = world.setdefault("map", {})
+        areas = m.setdefault("areas", {})
+        locations = m.setdefault("locations", {})
+        touched = 0
+
+        def touch_container(container):
+            nonlocal touched
+            if isinstance(container, dict):
+                if not container:
+                    container["ALL"] = {"visited": True, "discovered": True}
+                    touched += 1
+                else:
+                    for k, v in list(container.items()):
+                        if not isinstance(v, dict):
+                            v = {}
+                        if not v.get("visited"):
+                            v["visited"] = True; touched += 1
+                        if not v.get("discovered"):
+                            v["discovered"] = True; touched += 1
+                        container[k] = v
+        touch_container(areas)
+        touch_container(locations)
+        return touched
+    except Exception as e:
+        print("Map unlock error:", e)
+        return 0
+
+
+def normalize_class_name(cls: str) -> str:
+    """Map free-form class input ("dark siren", "EXO-SOLDIER") to the save spelling."""
+    key = cls.upper().replace("-", " ").replace("_", " ")
+    return _CLASS_ALIASES.get(key, cls)
+
+
+def set_character_class(root: Dict[str, Any], cls: str) -> str:
+    """Write the class into state/character and character; returns the normalized name."""
+    cls_norm = normalize_class_name(cls)
+    state = root.setdefault("state", {})
+    character = state.setdefault("character", {})
+    character["class"] = cls_norm
+    root.setdefault("character", {})["class"] = cls_norm
+    return cls_norm
+
+
+def ensure_unique_rewards(root_dict):
+    if not isinstance(root_dict, dict):
+        return None
+    if "unique_rewards" not in root_dict or not isinstance(root_dict.get("unique_rewards"), list):
+        root_dict["unique_rewards"] = []
+    return root_dict["unique_rewards"]
+
+
+def add_reward_packages(root_dict: Dict[str, Any], packages: Optional[List[str]] = None) -> Tuple[int, int, int]:
+    """Append missing RewardPackages to unique_rewards. Returns (added, before, after)."""
+    uniq = ensure_unique_rewards(root_dict)
+    before = set(map(str, uniq))
+    added = 0
+    for pkg in (EMBEDDED_REWARD_PACKAGES if packages is None else packages):
+        if pkg and pkg not in before:
+            uniq.append(pkg); added += 1
+    return added, len(before), len(uniq)
+
+
+def normalize_unlock_variants(entry: str):
+    """Return case-flex variants used for case-sensitive unlockables.
+    Variants:
+      - original
+      - lowercased after the first dot (prefix preserved)
+      - fully lowercase
+    """
+    e = str(entry)
+    out = {e}
+    if "." in e:
+        prefix, rest = e.split(".", 1)
+        out.add(prefix + "." + rest.lower())
+    out.add(e.lower())
+    return list(out)
+
+
+# ── Profile unlockables (domains/local/unlockables) ───────────────────────────
+def unlockables_root(profile_obj: Dict[str, Any]) -> Dict[str, Any]:
+    if profile_obj is None:
+        raise RuntimeError("Profile not loaded")
+    return (profile_obj
+            .setdefault("domains", {})
+            .setdefault("local", {})
+            .setdefault("unlockables", {}))
+
+def profile_unlock_entries(profile_obj: Dict[str, Any], key: str) -> List[Any]:
+    unl = unlockables_root(profile_obj)
+    cat = unl.setdefault(key, {})
+    ent = cat.setdefault("entries", [])
+    if not isinstance(ent, list):
+        cat["entries"] = ent = []
+    return ent
+
+def migrate_unlockables_to_domains(profile_obj: Dict[str, Any]) -> bool:
+    """Move a legacy top-level 'unlockables' block under domains/local. Returns True if migrated."""
+    if not isinstance(profile_obj, dict):
+        return False
+    legacy = profile_obj.get("unlockables")
+    target = unlockables_root(profile_obj)
+    if not isinstance(legacy, dict):
+        return False
+    for cat, obj in legacy.items():
+        if not isinstance(obj, dict):
+            continue
+        tgt_cat = target.setdefault(cat, {})
+        tgt_list = tgt_cat.setdefault("entries", [])
+        src_list = obj.get("entries") or []
+        seen = set(map(str, tgt_list))
+        for e in map(str, src_list):
+            if e not in seen:
+                tgt_list.append(e); seen.add(e)
+    profile_obj.pop("unlockables", None)
+    return True
+
+def extract_echo_skins(echo_entries) -> Set[Tuple[int, str]]:
+    pat = re.compile(r'^Unlockable_Echo4\.Skin(\d+)_([A-Za-z0-9_]+)$', re.I)
+    pairs = set()
+    for s in map(str, echo_entries or []):
+        m = pat.match(s) or pat.match(s.lower().replace("unlockable_echo4.","Unlockable_Echo4."))
+        if m:
+            pairs.add( (int(m.group(1)), m.group(2)) )
+    return pairs
+
+def mirror_echo_skins(profile_obj: Dict[str, Any]) -> int:
+    """Mirror every Echo-4 skin index onto all character categories. Returns the index count."""
+    echo_pairs = extract_echo_skins(profile_unlock_entries(profile_obj, ECHO_UNLOCK_CATEGORY))
+    for cat in CHAR_UNLOCK_CATEGORIES:
+        prefix = cat.replace("unlockable_","Unlockable_")
+        dest = profile_unlock_entries(profile_obj, cat)
+        already = set(map(str, dest))
+        for idx, suf in sorted(echo_pairs):
+            token = f"{prefix}.Skin{idx}_{suf}"
+            for v in normalize_unlock_variants(token):
+                if v not in already:
+                    dest.append(v)
+                    already.add(v)
+    return len(echo_pairs)
+
+def merge_unlock_catalogs(*catalogs: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Union category→entries maps; the first catalog keeps its order, later ones are merged sorted."""
+    out: Dict[str, List[str]] = {}
+    for i, catalog in enumerate(catalogs):
+        for k, lst in (catalog.items() if isinstance(catalog, dict) else []):
+            if i == 0:
+                out[k] = list(lst)
+                continue
+            merged = set(map(str, out.get(k, [])))
+            for e in lst or []:
+                merged.add(str(e))
+            out[k] = sorted(merged)
+    return out
+
+def apply_profile_unlocks(profile_obj: Dict[str, Any], catalog: Dict[str, List[str]],
+                          log: Optional[Callable[[str], None]] = None) -> int:
+    """Write every catalog entry missing from the profile. Returns the number of entries added."""
+    added = 0
+    for cat_key, entries in (catalog.items() if isinstance(catalog, dict) else []):
+        try:
+            ent_list = profile_unlock_entries(profile_obj, cat_key)
+            before = set(map(str, ent_list))
+
+            expanded = []
+            if cat_key in CASEFLEX_UNLOCK_CATEGORIES:
+                for e in (entries or []):
+                    expanded.extend(normalize_unlock_variants(e))
+            else:
+                expanded = list(entries or [])
+
+            new_items = [x for x in expanded if x not in before]
+            if new_items:
+                seen, ordered = set(), []
+                for x in new_items:
+                    if x not in seen:
+                        seen.add(x); ordered.append(x)
+                ent_list.extend(ordered)
+                added += len(ordered)
+                if log:
+                    log(f"[Profile] {cat_key}: wrote {len(ordered)} entries → {', '.join(ordered[:5])}")
+        except Exception as e:
+            if log:
+                log(f"[Profile] Could not apply '{cat_key}': {e}")
+    return added
@@ -0,0 +1,359 @@
+"""
+YAML loading helpers shared by the GUI and headless tools.
+Uses PyYAML's libyaml bindings (CSafeLoader / CSafeDumper) when they are
+compiled in and falls back to the pure-Python classes otherwise.
+"""
+
+import functools
+from array import array
+from typing import List, Optional, Tuple
+
+# ── Optional deps ─────────────────────────────────────────────────────────────
+try:
+    import yaml
+except Exception:
+    yaml = None
+
+if yaml is not None:
+    _BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+else:
+    _BaseLoader = _Dumper = None
+
+def yaml_engine() -> str:
+    """Which YAML implementation is active, for startup/diagnostic logs."""
+    if yaml is None: return "unavailable (pip install pyyaml)"
+    return "libyaml (C)" if _BaseLoader.__name__.startswith("C") else "pure Python"
+
+# ── YAML loader: ignore unknown tags ──────────────────────────────────────────
+@functools.lru_cache(maxsize=None)
+def get_yaml_loader():
+    if yaml is None:
+        raise RuntimeError("PyYAML is not installed. Install with: pip install pyyaml")
+    class AnyTagLoader(_BaseLoader): pass
+    def _ignore_any(loader: AnyTagLoader, tag_suffix: str, node: 'yaml.Node'):
+        if isinstance(node, yaml.ScalarNode): return loader.construct_scalar(node)
+        if isinstance(node, yaml.SequenceNode): return loader.construct_sequence(node)
+        if isinstance(node, yaml.MappingNode): return loader.construct_mapping(node)
+        return None
+    AnyTagLoader.add_multi_constructor("", _ignore_any)
+    return AnyTagLoader
+
+# ── Dumping: same output as yaml.safe_dump(obj, sort_keys=False, allow_unicode=True) ──
+def dump_yaml(obj, stream=None):
+    """Dump with the fastest safe dumper; returns the text when no stream is given."""
+    if yaml is None:
+        raise RuntimeError("PyYAML is not installed. Install with: pip install pyyaml")
+    if isinstance(obj, LazyMapping) and obj._is_root:
+        text = obj.to_yaml()
+        if stream is None: return text
+        stream.write(text); return None
+    return yaml.dump(obj, stream, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+
+
+# ── Lazy section loading ──────────────────────────────────────────────────────
+# One pass over the parser's event stream records where each top-level entry (and
+# each entry under `state`) lives in the text. Sections are constructed on first
+# access; sections nobody touched are written back as the original text, and loaded
+# sections whose shape is unchanged get their edited scalars spliced into it.
+class _Pending:
+    __slots__ = ("start", "end", "column")
+
+    def __init__(self, start: int, end: int, column: int):
+        self.start = start; self.end = end; self.column = column
+
+    def load(self, src: str):
+        """Construct the value and note where each of its scalars sits in `src` (see _Spans)."""
+        # pad to the original column so continuation lines keep their relative indentation
+        loader = get_yaml_loader()(" " * self.column + src[self.start:self.end])
+        try:
+            node = loader.get_single_node()
+            value = loader.construct_document(node) if node is not None else None
+        finally:
+            loader.dispose()
+        return value, (_Spans.track(node, value, self.start - self.column) if node is not None else None)
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _scalar_text(value) -> Optional[str]:
+    """`value` as a one-line scalar that is valid in block and flow context, or None for non-scalars."""
+    if not isinstance(value, _SCALAR_TYPES):
+        return None
+    return yaml.dump([value], Dumper=_Dumper, default_flow_style=True, width=1 << 30, allow_unicode=True).rstrip("\n")[1:-1]
+
+
+class _Spans:
+    """
+    Source spans of every scalar in a loaded section plus the shape of every collection,
+    from the composer's marks. While the shape holds (same containers, same keys/lengths),
+    edited scalars are written back by replacing just their spans; no emitter, no reformatting.
+    Kept compact: scalars are numbered in walk order (start/end offsets in arrays, the
+    constructed value in a list) and re-found by walking the value the same way.
+    """
+    __slots__ = ("value", "starts", "ends", "origs", "blocks", "colls")
+
+    @classmethod
+    def track(cls, node, value, offset: int) -> Optional["_Spans"]:
+        sp = cls(); sp.value = value
+        starts = sp.starts = array("q"); ends = sp.ends = array("q"); origs = sp.origs = []
+        colls = sp.colls = []; sp.blocks = set()   # numbers of `|`/`>` scalars, which can't be spliced
+        stack = [(node, value)]
+        while stack:
+            n, v = stack.pop()
+            if isinstance(n, yaml.ScalarNode):
+                if n.style in ("|", ">"): sp.blocks.add(len(origs))
+                starts.append(n.start_mark.index + offset); ends.append(n.end_mark.index + offset); origs.append(v)
+            elif isinstance(n, yaml.SequenceNode):
+                if not isinstance(v, list) or len(v) != len(n.value): return None
+                colls.append((v, len(v)))
+                stack.extend(zip(n.value, v))
+            else:   # duplicate or merge (<<) keys make node and dict disagree: leave it to the emitter
+                if not isinstance(v, dict) or len(v) != len(n.value): return None
+                colls.append((v, tuple(v)))
+                stack.extend(zip([vn for _, vn in n.value], v.values()))
+        return sp
+
+    def splice(self, value, src: str, start: int, end: int) -> Optional[str]:
+        """src[start:end] with every changed scalar of `value` replaced, or None if the shape changed."""
+        if value is not self.value and not (isinstance(value, _SCALAR_TYPES) and not self.colls):
+            return None
+        origs, colls = self.origs, self.colls
+        edits = []; si = ci = 0
+        stack = [value]
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, (list, dict)):
+                if ci == len(colls) or colls[ci][0] is not cur: return None
+                shape = colls[ci][1]; ci += 1
+                if isinstance(cur, list):
+                    if len(cur) != shape: return None
+                    stack.extend(cur)
+                else:
+                    if tuple(cur) != shape: return None
+                    stack.extend(cur.values())
+                continue
+            if si == len(origs): return None
+            orig = origs[si]
+            if not (cur is orig or (type(cur) is type(orig) and cur == orig)):
+                text = _scalar_text(cur) if si not in self.blocks else None
+                if text is None: return None
+                edits.append((self.starts[si], self.ends[si], text))
+            si += 1
+        if si != len(origs) or ci != len(colls):
+            return None
+        if not edits:
+            return src[start:end]
+        out = []; pos = start
+        for s, e, text in sorted(edits):
+            out.append(src[pos:s]); out.append(text); pos = e
+        out.append(src[pos:end])
+        return "".join(out)
+
+
+class LazyMapping(dict):
+    """
+    dict whose values are parsed from the source text on first access. Iterating
+    items()/values(), comparing or copying into a plain dict loads everything;
+    copy() stays lazy. dump_yaml() of a lazy document re-emits only the entries
+    that were loaded or assigned and copies the others verbatim.
+    """
+    __slots__ = ("_src", "_segments", "_header", "_indent", "_is_root", "_spans")
+
+    def _load(self, key, value):
+        if isinstance(value, _Pending):
+            value, self._spans[key] = value.load(self._src); dict.__setitem__(self, key, value)
+        return value
+
+    def _load_all(self):
+        for k, v in list(dict.items(self)):
+            if isinstance(v, _Pending): self._load(k, v)
+
+    def __getitem__(self, key):
+        return self._load(key, dict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key in self: return self[key]
+        dict.__setitem__(self, key, default); return default
+
+    def pop(self, key, *default):
+        if key in self: self[key]
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._load_all(); return dict.popitem(self)
+
+    def items(self):
+        self._load_all(); return dict.items(self)
+
+    def values(self):
+        self._load_all(); return dict.values(self)
+
+    def __iter__(self):   # a Python-level __iter__ makes dict(x)/{**x} go through __getitem__
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._load_all()
+        if isinstance(other, LazyMapping): other._load_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._load_all(); return dict.__repr__(self)
+
+    def copy(self):
+        new = LazyMapping(dict.items(self))
+        new._src, new._segments, new._header, new._indent, new._is_root = \
+            self._src, self._segments, self._header, self._indent, self._is_root
+        new._spans = dict(self._spans)
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        import copy
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self.items()),)
+
+    def unloaded_contains(self, key, text: str) -> Optional[bool]:
+        """Whether the source of `key`'s value contains `text`, while that value is still
+        unloaded; None once it is loaded (or assigned)."""
+        v = dict.get(self, key)
+        return self._src.find(text, v.start, v.end) >= 0 if isinstance(v, _Pending) else None
+
+    @property
+    def loaded_keys(self):
+        return [k for k, v in dict.items(self) if not isinstance(v, _Pending)]
+
+    def to_yaml(self) -> str:
+        out = [self._header]
+        for k, v in dict.items(self):
+            seg = self._segments.get(k); piece = None
+            if isinstance(v, _Pending):
+                piece = self._src[seg[0]:seg[1]]
+            elif isinstance(v, LazyMapping) and seg and v._src is self._src and not v._is_root and len(v):
+                piece = v.to_yaml()   # (emptied, it would be just the `key:` line, i.e. null)
+            else:
+                sp = self._spans.get(k) if seg else None
+                piece = sp.splice(v, self._src, *seg) if sp is not None else None
+            if piece is None:
+                piece = dump_yaml({k: v})
+                if self._indent:
+                    pad = " " * self._indent
+                    piece = "".join(pad + ln if ln.strip() else ln for ln in piece.splitlines(True))
+            if len(out) > 1 and not out[-1].endswith("\n"): out.append("\n")   # the header is whole lines (or a BOM)
+            out.append(piece)
+        if self._is_root and not len(self):
+            out.append("{}\n")   # as dump_yaml({}); the header alone would load as None
+        return "".join(out)
+
+
+class _NotLazy(Exception):
+    pass
+
+
+def _skip_node(events, first) -> int:
+    """Consume the node opened by `first`; return its end index. Anchors/aliases make the text non-splittable."""
+    if isinstance(first, yaml.AliasEvent) or first.anchor:
+        raise _NotLazy
+    if isinstance(first, yaml.ScalarEvent):
+        return first.end_mark.index
+    depth = 1
+    for ev in events:
+        if isinstance(ev, yaml.AliasEvent) or getattr(ev, "anchor", None):
+            raise _NotLazy
+        if isinstance(ev, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(ev, yaml.CollectionEndEvent):
+            depth -= 1
+            if not depth: return ev.end_mark.index
+    raise _NotLazy
+
+
+def _block_mapping(ev) -> bool:
+    return isinstance(ev, yaml.MappingStartEvent) and not ev.flow_style and ev.tag is None and ev.anchor is None
+
+
+def _scan_mapping(events, src: str, opener, nested=()) -> Tuple["LazyMapping", List[Tuple[object, int]]]:
+    """Read the entries of the block mapping opened by `opener`; values become _Pending
+    except the keys in `nested`, which are split one level further."""
+    lm = LazyMapping(); lm._src = src; lm._segments = {}; lm._spans = {}; lm._is_root = False
+    lm._indent = opener.start_mark.column
+    starts = []   # (key, index of the key's line start)
+    for key_ev in events:
+        if isinstance(key_ev, yaml.MappingEndEvent):
+            return lm, starts
+        if (not isinstance(key_ev, yaml.ScalarEvent) or key_ev.anchor or key_ev.tag
+                or key_ev.start_mark.column != lm._indent):
+            raise _NotLazy
+        key = key_ev.value if key_ev.style else yaml.load(key_ev.value, Loader=get_yaml_loader())
+        if key in lm:
+            raise _NotLazy
+        starts.append((key, key_ev.start_mark.index - key_ev.start_mark.column))
+        first = next(events)
+        if key in nested and _block_mapping(first):
+            child, child_starts = _scan_mapping(events, src, first)
+            dict.__setitem__(lm, key, (child, child_starts))
+        else:
+            end = _skip_node(events, first)
+            dict.__setitem__(lm, key, _Pending(first.start_mark.index, end, first.start_mark.column))
+    raise _NotLazy
+
+
+def _split(lm: "LazyMapping", starts, begin: int, end: int):
+    """Cut [begin, end) into the header and one segment per entry (key line to next key line)."""
+    if not starts:
+        raise _NotLazy
+    lm._header = lm._src[begin:starts[0][1]]
+    for i, (key, start) in enumerate(starts):
+        stop = starts[i + 1][1] if i + 1 < len(starts) else end
+        lm._segments[key] = (start, stop)
+        v = dict.__getitem__(lm, key)
+        if isinstance(v, tuple):
+            child, child_starts = v
+            _split(child, child_starts, start, stop)
+            dict.__setitem__(lm, key, child)
+
+
+def load_yaml_lazy(text: str, nested: Tuple[str, ...] = ("state",)):
+    """
+    Parse `text` into a LazyMapping: one event pass records where each top-level entry
+    (and each entry under the `nested` keys) lives; values are constructed on first access.
+    Anything this can't split safely (anchors/aliases, flow or non-mapping roots, several
+    documents, syntax errors) is loaded eagerly instead, so the result is always usable.
+    """
+    if yaml is None:
+        raise RuntimeError("PyYAML is not installed. Install with: pip install pyyaml")
+    # the parser's marks don't count a leading BOM, so scan without it and keep it in the header
+    bom = "\ufeff" if text.startswith("\ufeff") else ""
+    try:
+        src = text[len(bom):]
+        events = yaml.parse(src, Loader=_BaseLoader)
+        if not isinstance(next(events), yaml.StreamStartEvent) or not isinstance(next(events), yaml.DocumentStartEvent):
+            raise _NotLazy
+        opener = next(events)
+        if not _block_mapping(opener) or opener.start_mark.column:
+            raise _NotLazy
+        root, starts = _scan_mapping(events, src, opener, nested)
+        if not isinstance(next(events), yaml.DocumentEndEvent) or not isinstance(next(events), yaml.StreamEndEvent):
+            raise _NotLazy
+        _split(root, starts, 0, len(src))
+        root._header = bom + root._header; root._is_root = True
+        return root
+    except (_NotLazy, StopIteration, yaml.YAMLError):
+        return yaml.load(text, Loader=get_yaml_loader())
+
+
+if yaml is not None:   # nested or copied lazy mappings dump like plain dicts (items() loads them)
+    for _d in {yaml.SafeDumper, _Dumper}:
+        _d.add_representer(LazyMapping, lambda dumper, data: dumper.represent_dict(data))
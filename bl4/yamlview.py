@@ -0,0 +1,228 @@
+"""
+Line index over the YAML document shown in the editor, so an edit to one subtree
+(a backpack slot, a progression graph, …) is re-emitted on its own and spliced
+over just that subtree's lines instead of re-rendering the whole save.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from .yamlio import _BaseLoader, dump_yaml, get_yaml_loader, yaml
+
+Path = Tuple[Any, ...]
+
+if yaml is not None:
+    _resolver = yaml.resolver.Resolver()
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _key(ev) -> Any:
+    if not isinstance(ev, yaml.ScalarEvent):
+        raise _Unsupported("complex mapping key")
+    if ev.style:
+        return ev.value
+    # plain keys are nearly always strings; only build the others through the loader
+    if _resolver.resolve(yaml.ScalarNode, ev.value, (True, False)) == "tag:yaml.org,2002:str":
+        return ev.value
+    return yaml.load(ev.value, Loader=get_yaml_loader())
+
+
+def _scan(text: str, base: Path = (), line0: int = 0, first_index: int = 0):
+    """Entries of the block collections in `text`, in document order: (path, line, column, ok, item).
+    `ok` is False when the entry's first line also holds something else (e.g. the `- ` of the
+    item it sits in), so it can only be replaced together with its parent. `item` is True for
+    sequence items, False for mapping entries (whatever the type of their key)."""
+    lines = text.splitlines()
+    out: List[Tuple[Path, int, int, bool, bool]] = []
+    stack: List[list] = []   # [kind, path, column, flow, next index / pending key]
+    for ev in yaml.parse(text, Loader=_BaseLoader):
+        if isinstance(ev, (yaml.StreamStartEvent, yaml.DocumentStartEvent, yaml.DocumentEndEvent, yaml.StreamEndEvent)):
+            continue
+        if isinstance(ev, yaml.AliasEvent) or getattr(ev, "anchor", None):
+            raise _Unsupported("anchors/aliases")
+        if isinstance(ev, yaml.CollectionEndEvent):
+            stack.pop(); continue
+        if not stack:
+            path = base
+        else:
+            f = stack[-1]
+            if f[0] == "map":
+                if f[4] is _NO_KEY:   # this event is a key
+                    f[4] = _key(ev)
+                    if not f[3]:
+                        ln, col = ev.start_mark.line, ev.start_mark.column
+                        out.append((f[1] + (f[4],), line0 + ln, col, not lines[ln][:col].strip(), False))
+                    continue
+                path = f[1] + (f[4],); f[4] = _NO_KEY
+            else:
+                path = f[1] + (f[4],); f[4] += 1
+                if not f[3]:
+                    ln, col = ev.start_mark.line, f[2]
+                    text_ln = lines[ln]
+                    out.append((path, line0 + ln, col, len(text_ln) > col and text_ln[col] == "-" and not text_ln[:col].strip(),
+                                True))
+        if isinstance(ev, yaml.MappingStartEvent):
+            stack.append(["map", path, ev.start_mark.column, bool(stack and stack[-1][3]) or bool(ev.flow_style), _NO_KEY])
+        elif isinstance(ev, yaml.SequenceStartEvent):
+            stack.append(["seq", path, ev.start_mark.column, bool(stack and stack[-1][3]) or bool(ev.flow_style),
+                          first_index if path == base else 0])
+    return out
+
+
+_NO_KEY = object()
+
+
+def _ends(paths: List[Path], starts: List[int], total: int) -> List[int]:
+    """Each entry runs to the next entry that isn't one of its descendants (or `total`)."""
+    ends = [total] * len(paths); open_: List[int] = []
+    for i, p in enumerate(paths):
+        while open_ and p[:len(paths[open_[-1]])] != paths[open_[-1]]:
+            ends[open_.pop()] = starts[i]
+        open_.append(i)
+    return ends
+
+
+def _lookup(root: Any, path: Path) -> Any:
+    cur = root
+    for t in path:
+        if not isinstance(cur, (dict, list)): raise KeyError(t)
+        cur = cur[t]
+    return cur
+
+
+def _render(key: Any, value: Any, column: int, item: bool) -> str:
+    text = dump_yaml([value] if item else {key: value})
+    if not column:
+        return text
+    pad = " " * column
+    return "".join(pad + ln if ln.strip() else ln for ln in text.splitlines(True))
+
+
+class LineIndex:
+    """
+    0-based line span [start, end) of every block mapping entry and sequence item in a
+    YAML document, keyed by path tuple (("state", "inventory", "backpack", "slot_12"),
+    ("progression", "graphs", 3)). An entry owns the comment/blank lines below it.
+    Built once from the text; splice() keeps it current.
+    """
+
+    def __init__(self, text: str):
+        entries = _scan(text)
+        self.paths = [e[0] for e in entries]
+        self.starts = [e[1] for e in entries]
+        self.cols = [e[2] for e in entries]
+        self.ok = [e[3] for e in entries]
+        self.items = [e[4] for e in entries]
+        self.total = text.count("\n") + (not text.endswith("\n") and bool(text))
+        self._open_end = bool(text) and not text.endswith("\n")   # last line has no newline to insert after
+        self.ends = _ends(self.paths, self.starts, self.total)
+        self._pos = None
+
+    def _index(self, path: Path) -> Optional[int]:
+        if self._pos is None:
+            self._pos = {p: i for i, p in enumerate(self.paths)}
+        return self._pos.get(path)
+
+    def span(self, path: Path) -> Optional[Tuple[int, int]]:
+        i = self._index(tuple(path))
+        return None if i is None else (self.starts[i], self.ends[i])
+
+    def splice(self, root: Any, path: Path) -> Optional[Tuple[int, int, str]]:
+        """
+        Re-emit from `root` the smallest indexed entry that contains `path` and update the
+        index. Returns (start, end, text) to put over lines [start, end), or None when the
+        change can only be shown by re-rendering the whole document. Callers mark the
+        container, not an item, when items were inserted or removed; a key added last to an
+        indexed mapping (or the root) is inserted after its siblings' lines on its own.
+        """
+        path = tuple(path)
+        added = self._insert(root, path)
+        if added is not None:
+            return added
+        while path:
+            i = self._index(path)
+            if i is not None and self.ok[i]:
+                try:
+                    value = _lookup(root, path)
+                    break
+                except (KeyError, IndexError, TypeError):
+                    pass
+            path = path[:-1]
+        else:
+            return None
+        start, end, item = self.starts[i], self.ends[i], self.items[i]
+        text = _render(path[-1], value, self.cols[i], item)
+        try:
+            new = _scan(text, path[:-1], start, path[-1] if item else 0)
+        except (_Unsupported, yaml.YAMLError):
+            return None
+        j = i + 1
+        while j < len(self.paths) and self.paths[j][:len(path)] == path:
+            j += 1
+        n = text.count("\n"); delta = n - (end - start)
+        old = self.paths[i:j]
+        self.paths[i:j] = [e[0] for e in new]
+        self.starts[i:j] = [e[1] for e in new]
+        self.cols[i:j] = [e[2] for e in new]
+        self.ok[i:j] = [e[3] for e in new]
+        self.items[i:j] = [e[4] for e in new]
+        k = i + len(new)
+        self.ends[i:j] = _ends(self.paths[i:k], self.starts[i:k], start + n)
+        if len(new) != len(old):
+            self._pos = None
+        else:
+            for p in old: self._pos.pop(p, None)
+            for x in range(i, k): self._pos[self.paths[x]] = x
+        self._shift(k, path, delta)
+        return start, end, text
+
+    def _insert(self, root: Any, path: Path) -> Optional[Tuple[int, int, str]]:
+        # the first prefix of `path` that has no lines yet, if it is the last key of a block
+        # mapping whose other keys are all indexed (dump order puts it after them)
+        d = next((d for d in range(1, len(path) + 1) if self._index(path[:d]) is None), None)
+        if d is None:
+            return None
+        parent, key = path[:d - 1], path[d - 1]
+        try:
+            container = _lookup(root, parent); value = container[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+        if not isinstance(container, dict) or next(reversed(container)) != key:
+            return None
+        lo = self._index(parent) + 1 if parent else 0
+        hi = lo
+        while hi < len(self.paths) and self.paths[hi][:len(parent)] == parent:
+            hi += 1
+        kids = [x for x in range(lo, hi) if len(self.paths[x]) == d]
+        if not kids or any(self.items[x] for x in kids) or [self.paths[x][-1] for x in kids] != list(container)[:-1]:
+            return None
+        at = self.ends[lo - 1] if parent else self.total
+        if at == self.total and self._open_end:
+            return None
+        text = _render(key, value, self.cols[kids[0]], False)
+        try:
+            new = _scan(text, parent, at)
+        except (_Unsupported, yaml.YAMLError):
+            return None
+        n = text.count("\n")
+        self.paths[hi:hi] = [e[0] for e in new]
+        self.starts[hi:hi] = [e[1] for e in new]
+        self.cols[hi:hi] = [e[2] for e in new]
+        self.ok[hi:hi] = [e[3] for e in new]
+        self.items[hi:hi] = [e[4] for e in new]
+        self.ends[hi:hi] = _ends(self.paths[hi:hi + len(new)], self.starts[hi:hi + len(new)], at + n)
+        self._pos = None
+        self._shift(hi + len(new), parent + (key,), n)
+        return at, at, text
+
+    def _shift(self, k: int, path: Path, delta: int):
+        """Move entries k… by `delta` lines; the ends of the entries above `path` (and the total) move with them."""
+        if not delta:
+            return
+        self.starts[k:] = [s + delta for s in self.starts[k:]]
+        self.ends[k:] = [e + delta for e in self.ends[k:]]
+        for depth in range(1, len(path)):
+            self.ends[self._index(path[:depth])] += delta
+        self.total += delta
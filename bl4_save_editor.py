@@ -13,101 +13,9 @@ Dependencies:
 
 from pathlib import Path
 
-
 # ====== Built-in Advanced Decoder (embedded; compressed) ======
-import base64 as _b64, zlib as _zl
-_DEC_NS = None
-_DECODER_B64 = """eJztPf1b47jRv/NXeNNu4xwhmxDCsXkv17J8HbcLuy+wd72maerEDrgkdmo7C5SH/u2vRpKtb9uB7Eff4ueBJJY0mhmNRqPRSPJn8zBKrOTaDxIvspwYfV2bROEse+XTHMl13Zp5cexceqPwtm5dhPOp98mb1q2JP/Vc35mGl6Sk6yTOeOrEsRenpbNXFPbd3A8u08R9f5zUrXd+jP6/nyd+GDgI6scAfUHVLFA1azRnnESLcUJgzJ3kauqPUiAf0M81VpuX+DNvbe1PrGL83zpOvNl54iRxd81CzzzyZ050N4zRq25WeR9RPrB61mkYeDhb7I3DwC2REXMkJz1yIj+5y8kwc4LFxBkni8iLcrL5iIwhpign02TqXPLpwGGcKcul8mcfUep6LrCpS0mPUNN2gfWsZtR+nvRqjHh+GUZ37PXUCy6Tq66FaiSQMNtZC1CG3Awnvjd1UQrIQR+Vpm0PqBKxIEgPcAHUEBPf9YIxh0AY+Zc+onA4Qv8BhdFd4sVi0jzyJv6tpszcuZuGjstSgCXDeRj7wDaEVoYBqf/KiYbhZBJ7iZJ24znzMBgGzszj2I7gSk0cXXuRQC8WckIv5Gbt8+vB7of3p8PT3ZODc/TyHgOousPkT9WuVf3ZuQ5HsXV+FSaXi6BaJ6mjX+4jLvUDQjGcpol37Xfrmw984cCfe1Ga7H0c3kPiiTP1b5xABn3z+99uSOksw8lRmogk/5ok/jJ13HBi7Z6lSbeHNy+EJK7Y7fzVH0jamT9HqEgYjZPaS0i8CKPLhSdRM4ntHUjcdzzXmS5irspR7e0nSHofuQimxIQf/0ZqJIlihdHvf30z4xiE8gQOErfq2sPa2sXu8bvhxdnx7v7w3fv3bz9+YI3yZ1SGfMU/36GfdvXEi8ZIO8ZxtY5o9z/5SJMkSPVVa3WW9S3O+mExjUEp7i4uZ16QQIGDaDFXch/i3HthMF7Esf/Je/VruAhcyIVKpN9fsXQrS69hIA+Uzt9EfE8wP+KxE1kn/rVX5WrcR0n96pHjXnqJtXsV3kFNZ4vRyItGTuBaJ05QHUj0yOlc8hFO9ryp9ca/tA79+IpP/RlSj97v/3y4VxXw/YuIr4OFwkfNt8sXd7PX+/zrOHt9TqFCa745e//24HR4cLp/fHoE/atf3f6w7wJ52+/p5xH9PKGfM/Q5WFtzvYmF2DHkurzNqcqatfGjqAGINvUnVhAmVKk2kEaMkvjGT67s6p8+ogbqZhhHHhoCAqY0iEIPI6pVkVJFqjO49OytutVqcgWJnkO0kDr67W57nZQZZHkADqj5ugV4AyxezzRAn8c2B5NiTkDzWAMQKR+HPABfk4nBnBv5CdK74+uhi4cbhXNEH2ItjjUiNwwIX80alPIbtHWMmFHdfbO3f3B49NPxz2/fnZy+//C/Z+cXH3/59c+//cUZjRFKl1f+P66nsyCc/zOKk8Wnm9u7fzVbm+2tzvb3O6/XX/Ve/P7lH76za/3B/cO///634Q8//vF3/1NlI8LMmYMqGKPhDrPXr1tjYKwXLGZehMZGG6NSQ1JHuVksA9LYBWRADtbUZOTi25q0sTeNvVwwZhgEPdQ+wLX+QDMgsvf8UMje0uENuEGJJW+GU9RuuI8dzrwXb6EzPVz8dkk/sYI8O3ogH6/g49Uu/v8G/9/D//fx/8PqIOsOBDZwmquF0Y74zHKkI70gr4guhBRNaviB693apEhNyEfJ6pNPGKFtVLRupXlx5gCpAmKDCPxCDLJrabtT8hnKMdfrsXk4xDKByqV10iKDfnNgrYMGsOkbhqKu5sZiDpawTRQFD7su1rRudWqUAiy77q0ivZRBNYG1OE8m/qDqUVGs4NB7HUYi6z85U0RkWr4/HgipIIMN7zbxAtdGWM2cxIYCL61tpPKqze1RtSa2kCimDQcZE6gowkjMxkttmgkAv3qFINcy+UesiWA4ht7S+EfoBzYgREDdXKExHbcDy1hDmO1YL3pWkxHJgVlHcJpVCh3ptSFgi4DDdyeKnDsqIJj/TLs363I1dWuHawQMivAR6T4uX9/v+us7SEVu1sTMUG9KdlqaUk3VNFa7dpYZ1ShpkLrE6rrA07RLxJKqRyY7qPpZ6PrI4HcxbGqpKzV0idLX2uhy7V1+QDBY53hQQWW/zKBgFiEqx0A0yPAOkmHc4vACKwSeObRVUA8FQwPg0bG/h2VC5ELN+s7aTlWMLJk/qkC0QtrjfvS7Shnd4KKIOMLDVlHekHFKFaZ3g2kdpm3SH0hq6GoRXFM1JSikrH8oldWt7RrXRTAEkTQOaJf7vr7NNBDrUziD0I+IfKWqi0pbH6E74JVjmqtntbBqBIg/9KzNpqgEgQMAh4KL+5BvHakiBkzkuKkQyy8yNe3saRmO87RbpSMzfNhyn6uJ7QHDpdAOkhh2BSz4CvooEwybInaEbTJGXJeRwdSyvMRgQVllA2edByWoNlaMKCc0vETOOKEeCJtTSVhjFDkkCLGkMGfv0B6I+7D1Y8/aYkwhefvVK89xwVjxqsAS4tZqLAJQlHb1h+MqUXL97taghgZ9U/GRtviPSnEtVjsqVvhzsxCrre5ODtzWpgFwuxDwTre1yUHGDqNha1tSC8LoOEMiklW/0UL9tFmDztrlezIGIdf6U1orjJSbWj5Pqrjw0EmG9/4Dxh2/4Lt5q9mEbk1qQV/Q76bUxVM60p5oo8kBzp8ZXZRN8xBZOwmSTuxmjCmzSOE15tIz8kNgBmaF3lQgZGvIxXlSUtMCPLUZkB+AUJFMjBtPY2ZeGMnERXBl+JvQV0lu0k/JNJFOtm3BcuCmjiYzQrQelNlqjsfPaFDUy3jxiA6RHaqZutAonxqTe5Qh85Tatayr5c0est7mzPzp3ZCkY+7SUiuYZ9Deng4O0OHlqYQkFRQpmmu0CFyqBiiMPl++y/9Y74gzAlS3ERqi8Zfm8Hy7qnojMDsbpASqtsN4CfNNjpNIfMjkUz83u6QcBX6SkhoQMFYTIHxBmdEZLI7V2TvGbG8y8ZCAjKbh+FqctksdP62iLjSOxoNDWe4TjsUabo0iz7kW3gpYrPc4IIrk8asXQ1KOdG8eBuH/PAyRmvOm6HUYCasW6CckAnX9XCeAMBdNiyjtpqsMfmulVMhIpFTOSozMYeCPRlNvSNwHabtCZq5J4WcNfW/J7SB2IQ1IMBhTPiupGy3SfH/XNF9KiFBI6G4KuEGBSyqqirN+uf+39R0+cfzpENnbjitUv9HuDjhRbKDBglbVbKLZEO4/Wd5Od2NT1AGkM2fDYBi59pjMobAzQlc5o48N580qy83QJ8D5NUEYmShIruxABdjazIEoLh/qYKLiDCgeN7dy4PHdjINGy0mAdnIAsWVEGcyODKaVAybTrQKIVhU3tKSrU/cQHQZxe/NQpFrbXLW4V4hVtKEOpCc261Z7ayDjhVdjFbTaVSYRqRTyIo/Xf2omWJ0mKcw5/tFb/VIA0eRsxRJlrFz5l1cV0WjGBGwhe217gElUx3jCpsrMc/3FrCKYSZx9YTOUcfU98sGWQbK12141qkqv0/XbXpXQwaUTjdFjlqXImh7+z16yJd0e+WBJjBU99pUlS+u4PahNk0qMu57sldJkJK3bo58sh2jw9SR3Fuc6YMZfT/BxZVm4Ru9x31kG2oK91CkG72qCVev9c+HPYclv6D3RtH22Y5/t2Gc7ljzPduyzHfv/347NszqL7NhNnR2bZy0Wm7E7WtO4KdtwnL/Qau8UWW08oCWM0jwjuSUDaj/KSG7LYF4vbSS/ZiC+oi2qclNja5Phaev16o1Rz2yMZsbRsz365e1R99keZZCf7VHpebZHM/Y926PP9uizPYpMtDyvZZE9uvU17NEnGJ+dRxqfHRnQ9qOMz23FGM5jvsFFu/UNmZ+dXPOzQ0ajVmf15qdbwvwcOtNnE9T6UiZomFyhgQ5aJ8cCFXciPVukzxbps0Wase/ZIn22SP9bLVIpjC4zehrINLGVILu61R9kmzOkxAITVsqNxKHfGmSMExOh9ZuE6KwDMMCKKSuDbhWAbkmgV+8izXM1661LJabh6V7WFRrxX8TepYZkuj0sA1y9gQ2JtFg898aoCL9fcQHJi8SfIrby7yfwHolKvJg50N25pBeQlILCrx9WYBxn30wmMk8i7mCsBKIguA7Cm4Dfv/pZLOfKNLyp/LcbzZjxpCWVDZWKbZpEd12BjMfu8qE7K9TdnNSShUfZqAitL1VXI4OFHMtP4oO4rYlYAokapPXgEHs8jhZvqRSEm+HTzttsweev/rEqoMGlocRIGqZpz1Ojl9OZjIbpqYyV4z5nQU4VdLxcdOSwky+Dk1sSJ/fz4SS3r4iCNPVkGHB67cnI4Pq927E3T6wD/IGyw+ErHGp5ahseg+oWJLZX9aIo5GO9smTm46CETxw4xkXKSrV1U3xLNDU3aRWTOZ19TxHAmsj2ag9iTl6FB8h0qYjJsh4fVauGDFSVm9OpBpczSAq8P5Dw4xW3nJhq5PuH7DVVyGSro6CQCZNd/K7LN6q4NVFRyxa/RZQH0pCYwyScDRl0NyGCceggsRdHWtgHwsOLszNZOOLkTNz8mSOb14hC9nz1CPMQ1az2YxwiCpYsUepqlhcSVkzgiInPherWMaCaHHbQszZ17gO8QwgPZX6QhNwmobrVrGswqSkwOJ5fRAtPT69k7espljKVprm1aSa6tbUk1a3NuhadRxJO5wl6gmliEaF0drJMw+L9Tq1sNxUfabw0CcKcSU+IkKUUOVtmcjoGcrYYOXx9jyOKm3zpSeIylCJox0zQawNBO4wgVtvjyCETNj0lJK2ckLWX60lEzNqMDlzXsiSIStnkpyGB4pzzA2bDBpJUTFk5WcGzUqJrRQGRMZt4aFIGce9qoPTbauXwwEbctP50p+/4KhI8PDwoLZBRFF57wdDDpxthJ1HZ43t00OBongyrdQucVP1uC28vECvSUwRP5PhotvKLM114B2D22JPKcYAUs+9ijlsYdte6z+p5qOgp0w/0bBqVm97vbnQGdBM0Tw2buGC7PGeglicOn3+gzhmzlh2yNv9TBuocHdlqLkn0zkqH6c8yxj1tyP4Gx7ic0cE0OLRXN8atzJR6vZwYYjper8aWevo4zXt2zWQsa+u3MmMfY1Hci0prVtn98fk1a45pub0kW7aeNes3qVk7SzUx7sCdb1qzbpsJ+t5A0PY3qFlbOX2vZZrXtbaedauWuhwPrrrgm0uYeQVY4WKuWjau8pp1tnbFWOUgPZRQzdzUTsT4/TRQdN1q6ScpuS2DjzMso+DzWkngXoGSNy5l540A2oXxshxsfTEOFo0WpXmYO2LwS/wGkV9+ZOH2+3wdS92ggPkwhGJiCxU1C1JQydR4LTCZm6vRzTkDJh8oUUxkqYGVhVF8lYmKfiBSIjmKiS0ataQ4j686D4BYFTHCrIhGKY6rtDsPR8Pl8ESKcxPKkrrySkvBZXILk8p7OEgPU0EhokaqdjQxa4qDrPIBILw6tCJY+o28OD3fmgLqSA4yTI0+Ek9c1ytwoNmq2Oe71NKKB9a6ZqwJ4cjG6t+r4HUjiKu58itI4a9n0YTrm12RJi6gQjj+UD5hlZzfSs+AM9SaRnjk4SQly0vbQiK/UKpZidQcvwivy62Aaxzia/S2iiPPiU6PFsGB6yPpJiVhAXaI+jLiytBGgj+pW1EYJnxUF3rZgHeIefChJjQSP5l6duVNCBcETJFkx9YWrs0KLFSfRSrkhJMVvfTCmZdEd3Zlu9m87TSb2lx45fsSjZH26LJX+d3m3uZhu13hmhhn5UnnI2ezDIIgkPPVhXSSNpw6IxzBllw33sFXO0OkbiXebdKrHOC7Xs5J2FClbvFY1a0J/DrED/wKg6RnV37ypp+8xB87FVgnrNXMNWP1as8d967Xaso00ozITovuCIoH8JVH8cZ3k6tep0nRam+3X7cPFbT8AIFKRqiqywiuPGBpetRwjRxqHT33h6NFkiDZxKi9wd9V9pEFfYTEOJwhA8jt8QDSCBKMfGdnu3O4KSFfy6k4n3kwOg0nEQlFRAgeRiQGMcNPFC9TYaESfKPPtFcZhckVQtS7nQNFMMDJ1RMMH1s/XzqvHWBAMjUCDyNtjDPnxtqH2AlYSjr1IjeWGyace8EQwNIQH8QIr1dx/RiCKt3KEk3FcCMUxL4L4YjeJKlAWJB7q5ITO5+8IWC6FFHnqJSVhBYQd4HeyCQRqCEGbKTocOv7ve/38imS0VuOrqVJ+oN1EOj6DoaGftFRzUjSVvtNZ6dVgqQlqRmH87ulqNlDBZC03VAlKtOD4aWawEDL95s7r/d382nh8CpNS7hI5oukxCiwCsXPV6bTXVzEahasOp0IwzMdz1RlDe6bWgNO8Z7bwk4ldqmKaHSyC8sa8VV44xGjE9ueCPnKh6nnIIPUI3efpfGjks1JzJD8kdkYgitgqZRs8BsiexaJgVuKgkMctQeKgcBdigY/nk8d4qGIbbNiI7aKTYU2gDPsp4Vao3ShJfLzsi/mz3qSVMJgH2EZFKiXZBBGDmR1wIVHEIkgj5Y3fjAJh+Mrf+pGyF6XAoxJQdTQSFDD9GIHhhd1UarCIEbgZbsH1YxshiaC1ooYfymZOPtDbwxDN0eraQQXIZCOTsyGW6KH8ECu5FZ0EINBldCkAsa1H1x2rftcah4q2sOc5Uen0A4Ovu/smRQa6lWjcIpEyYQ+IZZTsvgtDkARSqDZLfGjWhAmC1Z15cRB4kRosFxnhjr2qyzmGc0jUfeGXLz7tSIF19qV89S1yMCyVwQ2BxQ3JeQRPZIq2DNyNSFkhbhUutmT3Gho2Q7Z4odjh61/LhzYmGJt4CEObmlcBOk3VAy1pJeMGzUARaCotZ3w9xxCxl9lxHk/ImQQfivwMMp7+EJEzBDYBzPxxyo/YCkWcjC3lgrsHb7FMeMEZcHNlYdmqJ+QwgVVg6nDKVynGIgeIHF7rm6/EpOe7OB0pNKhlHWCSzEsCDALRosEnE6RZXuNy0bdwht3MTpCfbz8ao5hLYkMkQrrDS6FkaFv8GBDMfj474NFyDU3rUTGQLtntCwivMBYB6Qw7VIsYSNO252ClwUnrbZSq63lq80SOyR1aF5AnNcFjvPCBoYXXdOWg1lVNLvB3SPBzffn+m/1v5CGgyA3WeHIoLGr7Jx68gjpoUucT/ar3br16g3620N/++jvEMMVnH9F8N8Rz9spdmCRpg6nU9TQC9RtcBSbA3tqaZt38BhJ6xHchEX17EbjKw/v24eibwN/4kE8+REaSR0mU0kPp6Dhp0dTcE1OWjitRRiycVV0CoSG33HdcpIE3/1FkJD2rz5l7DMPe5sSYhkP+GGPH/F4rPPMb+IGaXUQVcH4Kox6lZuKhtXKtECDj+Jt4el9gn+FdifMdTBoiWBzTnxyJ60ybBPzntQA13qUiQkVa8WRN2lr9yVVqGgmk1pQ+owi3IIMahYeZUpg3wu3+AwYIhBIemX05UVtEzAEBYCQSFsi4LUaMF2XIKy7kINTpNbivGDCTJIJteD/4YvGaYXYyTqp3MOvBzJVg3LwqZE96JiqHch3CNJ1NV1h5+D15uvv9YbbjnwdXFZN0TwZZgO8+0SeDGTzS2mMWGqidprO0FxiQ6EZG9RZNFGDa6xRg85g+3B6rXUj+xKEN2Q+PIGfduXlbxsvZxsvXevlT92XJ92X5xx0PDlDJiCsiMPeaJ1z+5Rzblvv8UT+r0FFD2IdYBx5Ab4GCqKaM1Qf8spUehXrO6vTtNatyl8DyPnI6YuKDLnEtHDaINWqwnl/dnx0fLr7zjo/ODvefdfNZ4GmNmI7FFd0fHFwYp1/PDnZPfutoJYLfM6Npq4svjCX65PKXnY/twlIuiOwANAbvN3Mekdv974nO3FliPLutAdyhE8Bjtzd3hosmbOkmLUnu8en1vnF7sW5wNiyk2/4NZz6gafO6ibirA4hqokUKowfIqfHnL7arT5Imx4n8gQvrUGOpikRZZNXC53vpdDToIucIIw8aMJ8LoUpxq4URrTkwefmdyl0PoqiILIiDzKZ7KVAabSCOXghDxRn/Fv3ZUwYeRcND5ybVJrEHCnQCqmEyWtNo1jV7nF+cfZx7+LjGVJyh8cH7/bPC9SPOCfVdU45yE6c+9YJVbUC3SLONstUI85qS1ajnUuWqU07gy1ZqTh9K1ObGLpRshpxFlemGjHGo2Q1bBJXporMYubBF4jo2e6v1v7uxW4ZAa1sgFGxSY0Klo/T5xDmg5rNHWZ+1b54Ifq1d4ev5Vt4mcvXRBP81l2QjkCk19uol/nVLeXiu7rsIqrLbpp8D6dRHhXJUdqYtYhmDqNwK5u8MyZx1nYeG2VICs/8GE1vEjSh9Wxcqo6vIdVcKo9T4QZXbLz274EKovxmztzGx/JRxB4GFaG0fm7Fw4N5FSlcYGLeI/IekMhnhR+04kbCv8T2L5IqEUPihaAXs+YV09waWUDDX4MPaQlsYMSpEZdViay1CczwedrS9sUxrnADZDqUSTeum+u1rA80esi6R1AoG8swkPSW5RiIyyzLQHof5RIMPMT+DMJAVmVZBrIST2Qgt2qEMCFurQnxcRvnJ/1uqzl4GLJ5WyPy5lMHdcRqFzrXBtLSjeQ2qQjA5w6+gRq+ughIeNlw4muYyTpxWrcYXIdm185imuCb3GOEe6+CgUq2EyoK2iju9e0KhDfgN9gf8x3OXqtbdmV3OuXff1epSUdyQNQXQgry9FJsxBw4sIuGHgjzcYgEYZSK3uGUbmkCyp/VkT7gKbYgvMROC9XhsK86ORPEDy571UUy2diBHdyxNdEHmU8aN2gQ8GxeBDTBp6LDAZYk7cr5YjxG78FFQoOSXHKOCDQRrBOjcfQ+RU3eflwQj2eoWPJ0TLg1aagUcw/b1/gAmArndBHCcGSvC7xHRLnhDUTXhnNsirOQhZomYxq2lwYAVbSZxAC9LSFAj8tWGKG3nLtCwXLC4pQ2Clc6+YiOcQRu+Z6VJNeNc/xj5EQ2g1+TsvLuLzQrv2LevTse7tgJPjkxccnt4e8cTNkbd0dAZxEupKLY45qFwDN6FvODywg8usaf1kIh3n3yvRu+HYIAWT+KM5/kNrnwKaxx5DmJR4m0wcUK10eTnz0OMHO5Bzc805RahTL6qgtXDuDJ9Y8+0QmTu25evACx2dQvQJgWHz6rlV1oP38uG/kxLV9KApTcBaJATNKCyK38livdglwrlLbb4fmcy01CHdJaiTxTUfM/auEjfeQFEBBe3By6NRChbu2M5JlTeq3eWMxhxWPoox6dgLVpq3qcRoPhcSPyLsHOpEkjZKfYFWc6Fdb88XqPIbCYH/a4SFUYrveu4BRuJZ44gzYm6SVjU0UcTMGSMvAvuTxl0TpBdxctVWWjjRjAqdu+oRQhA5S2iJRHLcufLmosTDMxbNOtW1p/kHLynvGwPeWMPXm0W27Witryyolzu4pGxaZK47Kgl6l9k3eC6EJs1VmpbtKDm2PqDsm4XjDdRvgYD2DKdvDhyT5wDw7qv/Icl8ZPpa8wrPSN+UAmCP9MkfKDxM7I1WspigUr9aLH6DLXAk8hyQiDDG4uJEkwRddbBsKkqqfZYdvP3NFzB0QItizKbrNyfPLQl/9aRhH32DOjNIz67JMR7jC+oqkJx1qm31fL2gzu41nLZENjH0uOKD3C4Bnzg4V+zH10awwKR+RHjsZPG4nl/E8eiDF83BJySBhH+rLysxrZ+eJyo3XlFR5ezJ8zvJyZp2eVJmSkaOmCw0DZnC8cCbw6/JSrSkpi2NrUoMidX7Ia7LKbSPKxEq44URDaWiFC0h0rJdDaMqG1s0K0uECZUkjtGBuvvUKs0ptWyjReu8pf2lCiB2tONZUvUv+aPVjXPaRrML9uBzaLwFftLsZevErBXLa7tE1Ivf5Kuu517viwyvGrXB9Wr2SCp1Q/1pyhKV9A+zX7sU59/2f0485X7ccdE1rbX7Efbxt13ioFbSmjJVe+vqGeXHxIY5kIyBInNRrv7Cui7zPc5ldU5crv+VMF89scjFdpXy3TXYyTjm/NOvh2ujA/K5ZvmMiDQ69ge+RGWv5GiHxsjddS0F6TQTJdQGFilvGu0QyiyBzJTaFaJeqW60L+OcGdfU0cDmJh7NqqW0N8861YscYH5Qv3R6u1au/OTR/pzmhj6TK3SMtNLFBV2NTS5c8mL1Xa6kJ23PqaU5bNUlDqnMDlQPSFa651hwfmMyg/f4n6xVu2u3oWwmP20BsPuYTnMTqCyThfMk/An6ZaUtY+Ub1QckupGJrXdKHMm7P3bw9Ohwen+8enR+dmGZUW7W+cKPCDS7vyK/mCoy0vsptl+ItlrJlzZ40if3xtJVceXtN/YXDzluoIZUTdcO3Mo2RKPTy1UKw0J6guN4jSo1SLgsXN56liQUvPVM0Hk3ewKuVBuavR+WNXcWY4dL7awZcdmRaHHnFya3mJXPZIVw3FS45XadvRg2HN45X2qFj++UJjQt5hsjJRxQfLLll7iZNm+ecJ4wJbpCzXf/1kZBpBZCpUQcgqK+x63NqprtsxQLg7JdCTRqaeZJI4Gd+GH7jerU1IhC2am49XxWb5Kyd7uWLHqDfnKSVk8XrLIFXlDsNfkxNYjJh4mWmRIX7lxEMywQmjIUy/EASwQKRYIxxWxAXO5NojSgXSTB2qSmcTxNopuyVwkF+v3Mcg8E8lEOtzmmLCTBPRrIRn5/KVwyJbcieRWkOyuk5/jPAPDGGTpuAfbfiRE71gXOCWKoZBjNVb6oh7+dEcAn/MX/yq2Rqoe1RJVU7Flx8h0IYxbEVU/Pg1qGAtrVKx88S22PqyVLT1VOjuEViKjJ3PRUa5+If0UeMg4FnFLg14tOGcwvQPXizn1oAnVy+Q8RiCGRHwRjyf+oldHVZr/Y3WIDcGrfQFMOlTfBFMiSZeonnLN+3nb1YhvvQ/pk3z2xNfe4KNIxqh9K003GP2kktuFqX4ci2kbPsumCBL29GNZsNSfa5UfyuerEgNlsPpcpvOjZymxb8Mp6ntWJbTZi5LveDR7OSNcpJF9fZnRbkLSxT7luWDAERxF0YZz766w4SBVIrnXeeTpaEmyrWLtboMI5Z7a8uy80FCQn3ZYvTml0fOPsuWk+6KKVmKv0RGKaJ27TRUhGMrLyO64+DNdYt7lriLaozFhXPu6f4zuiWT3QKQno7DAJqu/MbZzAecKwei80/hSQCwdS3dyUUOAiAOdUwz2V2Xng1QAl3z7kUtIsfoPzk4WEKibiFSUywib+b4QQwnSeM8rrzdbOWHE5COB/qA4iAcUmAmNpfI05AclZtR6nqJN04IORkYIn/S8fs4Ndvwx66+UO5HWOkB8ll2RW8pke/CueTm+Hch+FwtUhDXngadGzquLnAj27ukDB8S/mL0RUkKdIVWQIMSCVKaCrqkVw57PvMKsM5CL0pjK+6xKIWzWmQFmEuxLKXxZ7EdJbGXC6wAdyG+pDTmOPajJNJc3hXgm0adlEaVnINUDlUub0lUMw8OwSVnybYgDgSX1zu1R1F47QUILTjjBxeubn/Yx3u1tt/TzyP6eUI/Z/u6JWYBc3HZWKxkdcvGuK4yS8aaluM3WZVtQbXMk4QunQ+JG770E3mjOiUBF8tpVb7MSiiQ4l1KUqDbxvYoVcsXXQk9+g12JckSVtrLmhtqmbJKonClPZ9UKS4g14uU1ckvwPNxr2J0QO0rrMrrhhMOp9LDilJmqeYoEctgCKgoKWPZcmdJgqT8SxGTv5KsWZ0ukqGnLZinz4qXsOH5YmEUhREUdBR9alV5y9nwSAuzqreHzOQwdP7WO6FapQOqiPGny+FcekdTKdcENmsKzp0r5754rOui0G1BboZ0uSl6KaSLvRh6D8aq3TpfkC96mnmgTEKpI+WX7BZujSelyItyHBAvhx8gZukPd+QuvNScWCQh21X7D7kmeerPR6ETuWj64zmRpGN1+ehecQl+LY86mcG4oam8ISp84i7KqnixjHdIc84SJ83ZbWK4AsQw7CXy4QJrfN3cEF+iMxyCa2w4pDdD0purk+vGxTVlCCIavRFvw7bZKZmYRQBjGoZonPo/suiOWg=="""
-def _load_embedded_decoder():
-    global _DEC_NS
-    if _DEC_NS is not None: return _DEC_NS
-    try:
-        src = _zl.decompress(_b64.b64decode(_DECODER_B64))
-        ns = {}; ns["__name__"] = "bl4_embedded_decoder"
-        exec(src, ns, ns)
-        _DEC_NS = ns
-    except Exception as e:
-        print("[decoder] embed load failed:", e); _DEC_NS = {}
-    return _DEC_NS
-
-# --- Decoder adapter: tolerate different function names & return shapes ---
-def _get_decoder_fn(ns):
-    for name in ("decode_item_serial","adv_decode_item_serial","decode_serial","decode","parse_item_serial","item_decode"):
-        fn = ns.get(name)
-        if callable(fn):
-            return fn
-    return None
-
-def _extract_name_from_decoded(obj):
-    # dict-like
-    try:
-        if isinstance(obj, dict):
-            for k in ("weapon_name","friendly_name","name","label","title","gun_name","item_name"):
-                if k in obj and isinstance(obj[k], str) and obj[k].strip():
-                    return obj[k]
-    except Exception:
-        pass
-    # object-like
-    try:
-        for k in ("weapon_name","friendly_name","name","label","title","gun_name","item_name"):
-            v = getattr(obj, k, None)
-            if isinstance(v, str) and v.strip():
-                return v
-    except Exception:
-        pass
-    # tuple/list
-    try:
-        if isinstance(obj, (list, tuple)) and obj:
-            if isinstance(obj[0], str) and obj[0].strip():
-                return obj[0]
-            if isinstance(obj[0], dict):
-                return _extract_name_from_decoded(obj[0])
-    except Exception:
-        pass
-    return ""
-
-
-def _to_int_sane(x, default=0):
-    try:
-        s = str(x).strip()
-        if s == "" or s.lower() == "none":
-            return default
-        return int(s, 0) if s.lower().startswith("0x") else int(''.join(ch for ch in s if ch in "-0123456789") or default)
-    except Exception:
-        return default
-
-
-def adv_decode_item_serial(serial):
-    serial = str(serial).strip()
-    ns = _load_embedded_decoder()
-    fn = _get_decoder_fn(ns)
-    if callable(fn):
-        try:
-            return fn(serial)
-        except Exception as e:
-            print("[decoder] decode error:", e)
-    return None
+from bl4.decoder import _load_embedded_decoder
 
-def resolve_item_name(serial: str, decoded=None) -> str:
-    try:
-        if decoded is None:
-            decoded = adv_decode_item_serial(serial.strip())
-        nm = _extract_name_from_decoded(decoded)
-        if nm:
-            return nm
-        if "_friendly_from_decoded" in globals():
-            try:
-                return _friendly_from_decoded(decoded)
-            except Exception:
-                pass
-    except Exception:
-        pass
-    if "_friendly_from_decoded" in globals():
-        try:
-            return _friendly_from_decoded(None)
-        except Exception:
-            pass
-    return ""
 def _safe_unpack_item_values(vals):
     vals = list(vals) if isinstance(vals, (list, tuple)) else [vals]
     if len(vals) == 4:
@@ -196,39 +104,7 @@ WEAPON_NAME_MAP = {
 }
 
 
-def _unlock_all_map_areas(save_dict):
-    """Best-effort: ensure world/map/areas/locations exist and set visited/discovered=True.
-    If empty, seed a minimal 'ALL' entry so users still see an unlock effect."""
-    try:
-        if not isinstance(save_dict, dict):
-            return 0
-        world = save_dict.setdefault("state", {}).setdefault("world", {})
-        m = world.setdefault("map", {})
-        areas = m.setdefault("areas", {})
-        locations = m.setdefault("locations", {})
-        touched = 0
-
-        def touch_container(container):
-            nonlocal touched
-            if isinstance(container, dict):
-                if not container:
-                    container["ALL"] = {"visited": True, "discovered": True}
-                    touched += 1
-                else:
-                    for k, v in list(container.items()):
-                        if not isinstance(v, dict):
-                            v = {}
-                        if not v.get("visited"):
-                            v["visited"] = True; touched += 1
-                        if not v.get("discovered"):
-                            v["discovered"] = True; touched += 1
-                        container[k] = v
-        touch_container(areas)
-        touch_container(locations)
-        return touched
-    except Exception as e:
-        print("Map unlock error:", e)
-        return 0
+from bl4.unlocks import unlock_all_map_areas as _unlock_all_map_areas
 
 
 def _apply_selected_class_104a(app):
@@ -242,508 +118,28 @@ def _apply_selected_class_104a(app):
                 cls = app.cf["Class"].get().strip()
             except Exception:
                 pass
-
-        norm = {
-            "ECHO4": "Echo4", "ECHO 4": "Echo4",
-            "DARKSIREN": "DarkSiren", "DARK SIREN": "DarkSiren",
-            "EXOSOLDIER": "ExoSoldier", "EXO SOLDIER": "ExoSoldier",
-            "GRAVITAR": "Gravitar",
-            "PALADIN": "Paladin",
-        }
         if cls:
-            key = cls.upper().replace("-", " ").replace("_", " ")
-            cls_norm = norm.get(key, cls)
             root = app.yaml_obj if hasattr(app, "yaml_obj") else (app._root() if hasattr(app,"_root") else {})
-            state = root.setdefault("state", {})
-            character = state.setdefault("character", {})
-            character["class"] = cls_norm
-            root.setdefault("character", {})["class"] = cls_norm
-            return True, cls_norm
+            return True, set_character_class(root, cls)
         return False, None
     except Exception as e:
         print("apply class failed:", e)
         return False, None
 
-import time, zlib
+import os, time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-# -- Weapon friendly-name mapping 
-WEAPON_NAMES = {
-    'd_t@': 'Jakobs Shotgun',
-    'bV{r': 'Jakobs Pistol',
-    'y3L+2}': 'Jakobs Sniper',
-    'eU_{': 'Maliwan Shotgun',
-    'w$Yw2}': 'Maliwan SMG',
-    'velk2}': 'Vladof AR',
-    'xFw!2}': 'Vladof SMG',
-    'xp/&2}': 'Ripper Sniper',
-    'ct)%': 'Torgue Pistol',
-    'fs(8': 'Daedalus AR',
-    'b)Kv': 'Order Pistol',
-    'y>^2}': 'Order Sniper',
-    'r$WBm': 'Jakobs Ordnance'
-}
-
-def _weapon_name_from_serial(serial: str) -> str:
-    if not serial or not serial.startswith('@Ug'):
-        return ''
-    for length in range(4, 10):
-        prefix = serial[3:3+length]
-        for code, name in WEAPON_NAMES.items():
-            if prefix.startswith(code):
-                return name
-    return ''
-
 import tkinter as tk
 from tkinter import filedialog as fd, messagebox as mb, ttk
-# ── Embedded cosmetic RewardPackages (no CSVs needed) ─────────────────────────
-
-# ── Embedded Profile Unlock Catalog (fallback, no CSV required) ───────────────
-EMBEDDED_PROFILE_UNLOCKS = {
-    "shared_progress": [
-        "shared_progress.vault_hunter_level",
-        "shared_progress.prologue_completed",
-        "shared_progress.story_completed",
-        "shared_progress.epilogue_started",
-    ],
-    "unlockable_echo4": [
-        "Unlockable_Echo4.attachment01_partyhat",
-        "Unlockable_Echo4.attachment04_wings",
-        "Unlockable_Echo4.attachment03_bolt",
-        "Unlockable_Echo4.attachment09_goggles",
-        "Unlockable_Echo4.Skin01_Prison",
-        "Unlockable_Echo4.Skin02_Order",
-        "Unlockable_Echo4.Skin03_Ghost",
-        "Unlockable_Echo4.Skin04_Tech",
-        "Unlockable_Echo4.Skin05_Ripper",
-        "Unlockable_Echo4.Skin11_Astral",
-        "Unlockable_Echo4.Skin21_Graffiti",
-        "Unlockable_Echo4.Skin22_Knitted",
-        "Unlockable_Echo4.Skin25_Slimed",
-        "Unlockable_Echo4.Skin29_Guardian",
-        "Unlockable_Echo4.Skin31_Koto",
-        "Unlockable_Echo4.Skin33_Jakobs",
-        "Unlockable_Echo4.Skin35_Vladof",
-        "Unlockable_Echo4.Skin36_Torgue",
-        "Unlockable_Echo4.Skin37_Maliwan",
-        "Unlockable_Echo4.Skin38_CyberPop",
-        "Unlockable_Echo4.Skin39_Critters",
-        "Unlockable_Echo4.Skin40_Veil",
-        "Unlockable_Echo4.Skin42_Legacy",
-        "Unlockable_Echo4.Skin50_BreakTheGame",
-        "Unlockable_Echo4.Skin24_PreOrder",
-        "Unlockable_Echo4.Skin14_Fire",
-        "Unlockable_Echo4.attachment10_crown",
-        "Unlockable_Echo4.Body03_Ripper",
-        "Unlockable_Echo4.attachment07_horns",
-        "Unlockable_Echo4.Skin07_RedHanded",
-        "Unlockable_Echo4.Skin19_Dirty",
-        "Unlockable_Echo4.Skin45_BreakFree",
-        "Unlockable_Echo4.attachment08_tinfoilhat",
-        "Unlockable_Echo4.Skin09_Sewer",
-        "Unlockable_Echo4.Skin18_Electi",
-        "Unlockable_Echo4.Skin15_Survivalist",
-        "Unlockable_Echo4.Skin17_Auger",
-        "Unlockable_Echo4.Skin27_Space",
-        "Unlockable_Echo4.Body01_GeneVIV",
-        "Unlockable_Echo4.Skin12_Tediore",
-        "Unlockable_Echo4.Skin32_DuctTaped",
-        "Unlockable_Echo4.Skin16_Crimson",
-    ],
-    "unlockable_darksiren": [
-        "Unlockable_DarkSiren.Head01_Prison",
-        "Unlockable_DarkSiren.Body01_Prison",
-        "Unlockable_DarkSiren.Skin01_Prison",
-        "Unlockable_DarkSiren.Skin02_Order",
-        "Unlockable_DarkSiren.Skin03_Ghost",
-        "Unlockable_DarkSiren.Skin04_Tech",
-        "Unlockable_DarkSiren.Skin05_Ripper",
-        "Unlockable_DarkSiren.Skin06_Amara",
-        "Unlockable_DarkSiren.Skin07_RedHanded",
-        "Unlockable_DarkSiren.Skin08_Corrupted",
-        "Unlockable_DarkSiren.Skin21_Graffiti",
-        "Unlockable_DarkSiren.Skin29_Guardian",
-        "Unlockable_DarkSiren.Skin31_Koto",
-        "Unlockable_DarkSiren.Skin37_Maliwan",
-        "Unlockable_DarkSiren.Skin39_Critters",
-        "Unlockable_DarkSiren.Skin40_Veil",
-        "Unlockable_DarkSiren.Head02_PigTails",
-        "Unlockable_DarkSiren.Head03_MoHawk",
-        "Unlockable_DarkSiren.Head05_BikeHelmet",
-        "Unlockable_DarkSiren.Head06_PunkMask",
-        "Unlockable_DarkSiren.Head07_Demon",
-        "Unlockable_DarkSiren.Head11_Ripper",
-        "Unlockable_DarkSiren.Head12_Order",
-        "Unlockable_DarkSiren.Head23_CrashTestDummy",
-        "Unlockable_DarkSiren.Skin24_PreOrder",
-        "Unlockable_DarkSiren.Body02_Premium",
-        "Unlockable_DarkSiren.Head16_Premium",
-        "Unlockable_DarkSiren.Skin44_Premium",
-        "Unlockable_DarkSiren.Skin10_Hawaiian",
-        "Unlockable_DarkSiren.Skin14_Fire",
-        "Unlockable_DarkSiren.Skin25_Slimed",
-        "Unlockable_DarkSiren.Skin26_Camo",
-        "Unlockable_DarkSiren.Skin34_Daedalus",
-        "Unlockable_DarkSiren.Skin45_BreakFree",
-        "Unlockable_DarkSiren.Head08_Survivalist",
-        "Unlockable_DarkSiren.Skin09_Sewer",
-        "Unlockable_DarkSiren.Head09_Electi",
-        "Unlockable_DarkSiren.Head15_CrimeLord",
-        "Unlockable_DarkSiren.Skin11_Astral",
-        "Unlockable_DarkSiren.Head10_Transhuman",
-        "Unlockable_DarkSiren.Skin18_Electi",
-        "Unlockable_DarkSiren.Skin13_3CatMoon",
-        "Unlockable_DarkSiren.Skin15_Survivalist",
-        "Unlockable_DarkSiren.Skin17_Auger",
-        "Unlockable_DarkSiren.Skin27_Space",
-        "Unlockable_DarkSiren.Head04_Shades",
-        "Unlockable_DarkSiren.Skin12_Tediore",
-        "Unlockable_DarkSiren.Head14_Thresher",
-        "Unlockable_DarkSiren.Skin16_Crimson",
-    ],
-    "unlockable_exosoldier": [
-        "Unlockable_ExoSoldier.Head01_Prison",
-        "Unlockable_ExoSoldier.Body01_Prison",
-        "Unlockable_ExoSoldier.Skin01_Prison",
-        "Unlockable_ExoSoldier.Skin02_Order",
-        "Unlockable_ExoSoldier.Skin03_Ghost",
-        "Unlockable_ExoSoldier.Skin04_Tech",
-        "Unlockable_ExoSoldier.Skin05_Ripper",
-        "Unlockable_ExoSoldier.Skin06_Amara",
-        "Unlockable_ExoSoldier.Skin07_RedHanded",
-        "Unlockable_ExoSoldier.Skin08_Corrupted",
-        "Unlockable_ExoSoldier.Skin21_Graffiti",
-        "Unlockable_ExoSoldier.Skin29_Guardian",
-        "Unlockable_ExoSoldier.Skin31_Koto",
-        "Unlockable_ExoSoldier.Skin37_Maliwan",
-        "Unlockable_ExoSoldier.Skin39_Critters",
-        "Unlockable_ExoSoldier.Skin40_Veil",
-        "Unlockable_ExoSoldier.Head02_Mullet",
-        "Unlockable_ExoSoldier.Head03_Guerilla",
-        "Unlockable_ExoSoldier.Head04_TechHawk",
-        "Unlockable_ExoSoldier.Head06_BlindFold",
-        "Unlockable_ExoSoldier.Head07_Helm",
-        "Unlockable_ExoSoldier.Head11_Ripper",
-        "Unlockable_ExoSoldier.Head12_Order",
-        "Unlockable_ExoSoldier.Head23_CrushTestDummy",
-        "Unlockable_ExoSoldier.Skin24_PreOrder",
-        "Unlockable_ExoSoldier.Body02_Premium",
-        "Unlockable_ExoSoldier.Head16_Premium",
-        "Unlockable_ExoSoldier.Skin44_Premium",
-        "Unlockable_ExoSoldier.Skin10_Hawaiian",
-        "Unlockable_ExoSoldier.Skin14_Fire",
-        "Unlockable_ExoSoldier.Skin25_Slimed",
-        "Unlockable_ExoSoldier.Skin26_Camo",
-        "Unlockable_ExoSoldier.Skin34_Daedalus",
-        "Unlockable_ExoSoldier.Skin45_BreakFree",
-        "Unlockable_ExoSoldier.Head08_Survivalist",
-        "Unlockable_ExoSoldier.Skin09_Sewer",
-        "Unlockable_ExoSoldier.Head09_Electi",
-        "Unlockable_ExoSoldier.Head15_CrimeLord",
-        "Unlockable_ExoSoldier.Skin11_Astral",
-        "Unlockable_ExoSoldier.Head10_Transhuman",
-        "Unlockable_ExoSoldier.Skin18_Electi",
-        "Unlockable_ExoSoldier.Skin13_3CatMoon",
-        "Unlockable_ExoSoldier.Skin15_Survivalist",
-        "Unlockable_ExoSoldier.Skin17_Auger",
-        "Unlockable_ExoSoldier.Skin27_Space",
-        "Unlockable_ExoSoldier.Head05_LongHair",
-        "Unlockable_ExoSoldier.Skin12_Tediore",
-        "Unlockable_ExoSoldier.Head14_Thresher",
-        "Unlockable_ExoSoldier.Skin16_Crimson",
-    ],
-    "unlockable_gravitar": [
-        "Unlockable_Gravitar.Head01_Prison",
-        "Unlockable_Gravitar.Body01_Prison",
-        "Unlockable_Gravitar.Skin01_Prison",
-        "Unlockable_Gravitar.Skin02_Order",
-        "Unlockable_Gravitar.Skin03_Ghost",
-        "Unlockable_Gravitar.Skin04_Tech",
-        "Unlockable_Gravitar.Skin05_Ripper",
-        "Unlockable_Gravitar.Skin06_Amara",
-        "Unlockable_Gravitar.Skin07_RedHanded",
-        "Unlockable_Gravitar.Skin08_Corrupted",
-        "Unlockable_Gravitar.Skin21_Graffiti",
-        "Unlockable_Gravitar.Skin29_Guardian",
-        "Unlockable_Gravitar.Skin31_Koto",
-        "Unlockable_Gravitar.Skin37_Maliwan",
-        "Unlockable_Gravitar.Skin39_Critters",
-        "Unlockable_Gravitar.Skin40_Veil",
-        "Unlockable_Gravitar.Head02_DreadBuns",
-        "Unlockable_Gravitar.Head03_Helmet",
-        "Unlockable_Gravitar.Head04_TechBraids",
-        "Unlockable_Gravitar.Head05_SafetyFirst",
-        "Unlockable_Gravitar.Head07_VRPunk",
-        "Unlockable_Gravitar.Head11_Ripper",
-        "Unlockable_Gravitar.Head12_Order",
-        "Unlockable_Gravitar.Head23_CrushTestDummy",
-        "Unlockable_Gravitar.Skin24_PreOrder",
-        "Unlockable_Gravitar.Body02_Premium",
-        "Unlockable_Gravitar.Head16_Premium",
-        "Unlockable_Gravitar.Skin44_Premium",
-        "Unlockable_Gravitar.Skin10_Hawaiian",
-        "Unlockable_Gravitar.Skin14_Fire",
-        "Unlockable_Gravitar.Skin25_Slimed",
-        "Unlockable_Gravitar.Skin26_Camo",
-        "Unlockable_Gravitar.Skin34_Daedalus",
-        "Unlockable_Gravitar.Skin45_BreakFree",
-        "Unlockable_Gravitar.Head08_Survivalist",
-        "Unlockable_Gravitar.Skin09_Sewer",
-        "Unlockable_Gravitar.Head09_Electi",
-        "Unlockable_Gravitar.Head15_CrimeLord",
-        "Unlockable_Gravitar.Skin11_Astral",
-        "Unlockable_Gravitar.Head10_Transhuman",
-        "Unlockable_Gravitar.Skin18_Electi",
-        "Unlockable_Gravitar.Skin13_3CatMoon",
-        "Unlockable_Gravitar.Skin15_Survivalist",
-        "Unlockable_Gravitar.Skin17_Auger",
-        "Unlockable_Gravitar.Skin27_Space",
-        "Unlockable_Gravitar.Head06_RoundGlasses",
-        "Unlockable_Gravitar.Skin12_Tediore",
-        "Unlockable_Gravitar.Head14_Thresher",
-        "Unlockable_Gravitar.Skin16_Crimson",
-    ],
-    "unlockable_paladin": [
-        "Unlockable_Paladin.Head01_Prison",
-        "Unlockable_Paladin.Body01_Prison",
-        "Unlockable_Paladin.Skin01_Prison",
-        "Unlockable_Paladin.Skin02_Order",
-        "Unlockable_Paladin.Skin03_Ghost",
-        "Unlockable_Paladin.Skin04_Tech",
-        "Unlockable_Paladin.Skin05_Ripper",
-        "Unlockable_Paladin.Skin06_Amara",
-        "Unlockable_Paladin.Skin07_RedHanded",
-        "Unlockable_Paladin.Skin08_Corrupted",
-        "Unlockable_Paladin.Skin21_Graffiti",
-        "Unlockable_Paladin.Skin29_Guardian",
-        "Unlockable_Paladin.Skin31_Koto",
-        "Unlockable_Paladin.Skin37_Maliwan",
-        "Unlockable_Paladin.Skin39_Critters",
-        "Unlockable_Paladin.Skin40_Veil",
-        "Unlockable_Paladin.Head02_PonyTail",
-        "Unlockable_Paladin.Head03_BaldMask",
-        "Unlockable_Paladin.Head04_Visor",
-        "Unlockable_Paladin.Head06_Hooded",
-        "Unlockable_Paladin.Head07_Headband",
-        "Unlockable_Paladin.Head11_Ripper",
-        "Unlockable_Paladin.Head12_Order",
-        "Unlockable_Paladin.Head23_CrushTestDummy",
-        "Unlockable_Paladin.Skin24_PreOrder",
-        "Unlockable_Paladin.Body02_Premium",
-        "Unlockable_Paladin.Head16_Premium",
-        "Unlockable_Paladin.Skin44_Premium",
-        "Unlockable_Paladin.Skin10_Hawaiian",
-        "Unlockable_Paladin.Skin14_Fire",
-        "Unlockable_Paladin.Skin25_Slimed",
-        "Unlockable_Paladin.Skin26_Camo",
-        "Unlockable_Paladin.Skin34_Daedalus",
-        "Unlockable_Paladin.Skin45_BreakFree",
-        "Unlockable_Paladin.Head08_Survivalist",
-        "Unlockable_Paladin.Skin09_Sewer",
-        "Unlockable_Paladin.Head09_Electi",
-        "Unlockable_Paladin.Head15_CrimeLord",
-        "Unlockable_Paladin.Skin11_Astral",
-        "Unlockable_Paladin.Head10_Transhuman",
-        "Unlockable_Paladin.Skin18_Electi",
-        "Unlockable_Paladin.Skin13_3CatMoon",
-        "Unlockable_Paladin.Skin15_Survivalist",
-        "Unlockable_Paladin.Skin17_Auger",
-        "Unlockable_Paladin.Skin27_Space",
-        "Unlockable_Paladin.Head05_Goth",
-        "Unlockable_Paladin.Skin12_Tediore",
-        "Unlockable_Paladin.Head14_Thresher",
-        "Unlockable_Paladin.Skin16_Crimson",
-    ],
-    "unlockable_weapons": [
-        "Unlockable_Weapons.Mat13_Whiteout",
-        "Unlockable_Weapons.Mat31_Splash",
-        "Unlockable_Weapons.Mat16_PolePosition",
-        "Unlockable_Weapons.Mat14_Grunt",
-        "Unlockable_Weapons.Mat18_CrashTest",
-        "Unlockable_Weapons.Mat07_CuteCat",
-        "Unlockable_Weapons.Mat19_Meltdown",
-        "Unlockable_Weapons.Mat36_PreOrder",
-        "Unlockable_Weapons.Mat38_HeadHunter",
-        "Unlockable_Weapons.shiny_ballista",
-        "Unlockable_Weapons.shiny_symmetry",
-        "Unlockable_Weapons.shiny_plasmacoil",
-        "Unlockable_Weapons.shiny_star_helix",
-        "Unlockable_Weapons.shiny_anarchy",
-        "Unlockable_Weapons.Mat01_Synthwave",
-        "Unlockable_Weapons.Mat29_Cheers",
-        "Unlockable_Weapons.Mat17_DeadWood",
-        "Unlockable_Weapons.Mat25_LocustGas",
-        "Unlockable_Weapons.Mat26_AugerSight",
-        "Unlockable_Weapons.Mat27_GoldenPower",
-        "Unlockable_Weapons.shiny_leadballoon",
-        "Unlockable_Weapons.shiny_convergence",
-        "Unlockable_Weapons.shiny_boomslang",
-        "Unlockable_Weapons.Mat08_EchoBot",
-        "Unlockable_Weapons.shiny_luty",
-        "Unlockable_Weapons.shiny_rocketreload",
-        "Unlockable_Weapons.Mat06_ElectiSamurai",
-        "Unlockable_Weapons.shiny_noisycricket",
-        "Unlockable_Weapons.shiny_heavyturret",
-        "Unlockable_Weapons.shiny_kaoson",
-        "Unlockable_Weapons.Mat33_Creepy",
-        "Unlockable_Weapons.Mat34_MoneyCamo",
-        "Unlockable_Weapons.Mat30_CrimsonRaiders",
-        "Unlockable_Weapons.Mat32_ImperialGuard",
-        "Unlockable_Weapons.shiny_kaleidosplode",
-        "Unlockable_Weapons.shiny_slugger",
-        "Unlockable_Weapons.shiny_beegun",
-        "Unlockable_Weapons.shiny_kickballer",
-        "Unlockable_Weapons.shiny_vamoose",
-    ],
-    "unlockable_vehicles": [
-        "Unlockable_Vehicles.Mat17_DeadWood",
-        "Unlockable_Vehicles.Mat16_PolePosition",
-        "Unlockable_Vehicles.Mat13_Whiteout",
-        "Unlockable_Vehicles.Mat29_Cheers",
-        "Unlockable_Vehicles.Mat09_FolkHero",
-        "Unlockable_Vehicles.Mat07_CuteCat",
-        "Unlockable_Vehicles.Mat22_Overload",
-        "Unlockable_Vehicles.Mat10_Graffiti",
-        "Unlockable_Vehicles.DarkSiren",
-        "Unlockable_Vehicles.DarkSiren_Proto",
-        "Unlockable_Vehicles.Paladin_Proto",
-        "Unlockable_Vehicles.Gravitar_Proto",
-        "Unlockable_Vehicles.ExoSoldier_Proto",
-        "Unlockable_Vehicles.Grazer",
-        "Unlockable_Vehicles.Borg",
-        "Unlockable_Vehicles.Mat27_GoldenPower",
-        "Unlockable_Vehicles.Mat23_FutureProof",
-        "Unlockable_Vehicles.Mat34_MoneyCamo",
-        "Unlockable_Vehicles.Mat20_Cyberspace",
-        "Unlockable_Vehicles.Mat19_Meltdown",
-        "Unlockable_Vehicles.mat47_jakobsuncommon",
-        "Unlockable_Vehicles.Mat01_Synthwave",
-        "Unlockable_Vehicles.Mat32_ImperialGuard",
-        "Unlockable_Vehicles.Mat33_Creepy",
-    ],
-}
-
-EMBEDDED_REWARD_PACKAGES = [
-    "RewardPackage_CharacterSkin_36_Torgue",
-    "RewardPackage_CharacterSkin_26_MoneyCamo",
-    "RewardPackage_CharacterSkin_03_Ghost",
-    "RewardPackage_CharacterSkin_37_Maliwan",
-    "RewardPackage_CharacterSkin_39_Critters",
-    "RewardPackage_CharacterSkin_38_Cyberpop",
-    "RewardPackage_CharacterSkin_34_Daedalus",
-    "RewardPackage_CharacterSkin_25_Slimed",
-    "RewardPackage_CharacterSkin_40_Veil",
-    "RewardPackage_CharacterHeads_06_UniqueE",
-    "RewardPackage_CharacterHeads_07_UniqueF",
-    "RewardPackage_EchoSkin_04_Tech",
-    "RewardPackage_EchoSkin_33_Jakobs",
-    "RewardPackage_EchoSkin_37_Maliwan",
-    "RewardPackage_EchoSkin_29_Guardian",
-    "RewardPackage_EchoSkin_11_Astral",
-    "RewardPackage_EchoSkin_35_Vladof",
-    "RewardPackage_EchoSkin_26_Camo",
-    "RewardPackage_EchoSkin_03_Ghost",
-    "RewardPackage_EchoSkin_02_Order",
-    "RewardPackage_EchoSkin_38_CyberPop",
-    "RewardPackage_EchoSkin_22_Knitted",
-    "RewardPackage_EchoSkin_25_Slimed",
-    "RewardPackage_EchoSkin_39_Critters",
-    "RewardPackage_EchoSkin_31_Koto",
-    "RewardPackage_EchoSkin_20_HighRoller",
-    "RewardPackage_EchoSkin_21_Graffiti",
-    "RewardPackage_EchoSkin_19_Dirty",
-    "RewardPackage_EchoSkin_40_Veil",
-    "RewardPackage_EchoSkin_06_Amara",
-    "RewardPackage_EchoSkin_36_Torgue",
-    "RewardPackage_EchoAttachment_10_Crown",
-    "RewardPackage_EchoAttachment_04_Wings",
-    "RewardPackage_EchoAttachment_03_Bolt",
-    "RewardPackage_EchoAttachment_09_Goggles",
-    "RewardPackage_WeaponSkin_16_PolePosition",
-    "RewardPackage_WeaponSkin_31_Splash",
-    "RewardPackage_WeaponSkin_13_Whiteout",
-    "RewardPackage_WeaponSkin_14_Grunt",
-    "RewardPackage_WeaponSkin_18_CrashTest",
-    "RewardPackage_WeaponSkin_07_CuteCat",
-    "RewardPackage_WeaponSkin_19_Meltdown",
-    "RewardPackage_VehicleSkin_17_DeadWood",
-    "Reward_Vehicle_DarkSiren",
-    "Reward_Vehicle_Grazer",
-    "Reward_HoverDrive_Jakobs_01",
-    "Reward_HoverDrive_Jakobs_02",
-    "Reward_HoverDrive_Maliwan_01",
-    "Reward_HoverDrive_Maliwan_02",
-    "Reward_HoverDrive_Maliwan_03",
-    "Reward_HoverDrive_Maliwan_04",
-    "Reward_HoverDrive_Daedalus_01",
-    "Reward_HoverDrive_Daedalus_02",
-    "Reward_HoverDrive_Daedalus_03",
-    "Reward_HoverDrive_Daedalus_04",
-    "Reward_HoverDrive_Vladof_01",
-    "Reward_HoverDrive_Vladof_02",
-    "Reward_HoverDrive_Vladof_03",
-    "RewardPackage_Combined_Propaganda",
-    "RewardPackage_PreOrder",
-    "RewardPackage_Premium",
-    "RewardPackage_Headhunter",
-    "RewardPackage_Legacy",
-    "ChallengeReward_Shiny_BeeGun",
-    "ChallengeReward_Shiny_Kickballer",
-    "ChallengeReward_Shiny_Vamoose",
-    "ChallengeReward_Shiny_anarchy",
-    "RewardPackage_CharacterSkin_19_Dirty",
-    "RewardPackage_CharacterSkin_30_Cute",
-    "RewardPackage_EchoAttachment_01_PartyHat",
-    "RewardPackage_EchoSkin_2_Order",
-    "RewardPackage_EchoSkin_3_Ghost",
-    "RewardPackage_GoldenEcho4",
-    "RewardPackage_SHiFT",
-    "RewardPackage_VehicleSkin_07_CuteCat",
-    "RewardPackage_VehicleSkin_10_Graffiti",
-    "RewardPackage_VehicleSkin_19_Meltdown",
-    "RewardPackage_VehicleSkin_42_Gratata",
-    "RewardPackage_WeaponSkin_20_Cyberspace",
-    "RewardPackage_WeaponSkin_21_Afterburn",
-    "RewardPackage_WeaponSkin_22_Overload",
-    "RewardPackage_WeaponSkin_23_FutureProof",
-    "Reward_HoverDrive_Borg_01",
-    "Reward_HoverDrive_Borg_02",
-    "Reward_HoverDrive_Borg_03",
-    "Reward_HoverDrive_Borg_04",
-    "Reward_HoverDrive_Borg_05",
-    "Reward_HoverDrive_Jakobs_03",
-    "Reward_HoverDrive_Jakobs_04",
-    "Reward_HoverDrive_Maliwan_05",
-    "Reward_HoverDrive_Order_01",
-    "Reward_HoverDrive_Order_02",
-    "Reward_HoverDrive_Order_03",
-    "Reward_HoverDrive_Order_04",
-    "Reward_HoverDrive_Order_05",
-    "Reward_HoverDrive_Tediore_01",
-    "Reward_HoverDrive_Tediore_02",
-    "Reward_HoverDrive_Tediore_03",
-    "Reward_HoverDrive_Tediore_04",
-    "Reward_HoverDrive_Tediore_05",
-    "Reward_HoverDrive_Torgue_01",
-    "Reward_HoverDrive_Torgue_02",
-    "Reward_HoverDrive_Torgue_03",
-    "Reward_HoverDrive_Torgue_04",
-    "Reward_HoverDrive_Torgue_05",
-    "Reward_HoverDrive_Vladof_04",
-    "Reward_HoverDrive_Vladof_05",
-    "Reward_Vehicle_Gravitar",
-    "pgraph.sdu_upgrades.Class_Mod_Slot",
-    "pgraph.sdu_upgrades.Enhancement_Slot",
-    "pgraph.sdu_upgrades.RepKit_Slot",
-    "pgraph.sdu_upgrades.Weapon_Slot_03",
-    "pgraph.sdu_upgrades.Weapon_Slot_04",
-]
+from bl4.unlocks import (
+    EMBEDDED_PROFILE_UNLOCKS, add_reward_packages, apply_profile_unlocks,
+    ensure_unique_rewards, merge_unlock_catalogs, normalize_unlock_variants, set_character_class,
+)
 
 # ── Optional deps ─────────────────────────────────────────────────────────────
-try:
-    import yaml
-except Exception:
-    yaml = None
+from bl4.yamlio import yaml, dump_yaml, load_yaml_lazy, yaml_engine
+from bl4.yamlview import LineIndex
+from bl4.index import SaveIndex
 
 # ── Theme ─────────────────────────────────────────────────────────────────────
 class Dark:
@@ -773,519 +169,16 @@ def apply_dark(root: tk.Tk) -> None:
     except Exception:
         pass
 
-# ── YAML loader: ignore unknown tags ──────────────────────────────────────────
-def get_yaml_loader():
-    if yaml is None:
-        raise RuntimeError("PyYAML is not installed. Install with: pip install pyyaml")
-    class AnyTagLoader(yaml.SafeLoader): pass
-    def _ignore_any(loader: AnyTagLoader, tag_suffix: str, node: 'yaml.Node'):
-        if isinstance(node, yaml.ScalarNode): return loader.construct_scalar(node)
-        if isinstance(node, yaml.SequenceNode): return loader.construct_sequence(node)
-        if isinstance(node, yaml.MappingNode): return loader.construct_mapping(node)
-        return None
-    AnyTagLoader.add_multi_constructor("", _ignore_any)
-    return AnyTagLoader
-
-# ── Crypto (lazy import) ──────────────────────────────────────────────────────
-PUBLIC_KEY = bytes((0x35,0xEC,0x33,0x77,0xF3,0x5D,0xB0,0xEA,0xBE,0x6B,0x83,0x11,0x54,0x03,0xEB,0xFB,
-                    0x27,0x25,0x64,0x2E,0xD5,0x49,0x06,0x29,0x05,0x78,0xBD,0x60,0xBA,0x4A,0xA7,0x87))
-def _adler32(b: bytes)->int: return zlib.adler32(b)&0xFFFFFFFF
-def _lazy_crypto():
-    try:
-        from Crypto.Cipher import AES
-        from Crypto.Util.Padding import pad
-        return AES, pad
-    except Exception as e:
-        raise RuntimeError("PyCryptodome is required for encrypt/decrypt.\nInstall with: pip install pycryptodome") from e
-def _key_epic(uid:str)->bytes:
-    wid=uid.strip().encode("utf-16le")
-    k=bytearray(PUBLIC_KEY)
-    n=min(len(wid), len(k))
-    for i in range(n):
-        k[i] ^= wid[i]
-    return bytes(k)
-def _key_steam(uid:str)->bytes:
-    digits=''.join(ch for ch in uid if ch.isdigit())
-    sid=int(digits or "0",10).to_bytes(8,"little",signed=False)
-    k=bytearray(PUBLIC_KEY)
-    for i, b in enumerate(sid):
-        k[i % len(k)] ^= b
-    return bytes(k)
-def _strip_pkcs7(buf:bytes)->bytes:
-    n=buf[-1]
-    if 1<=n<=16 and all(buf[-i]==n for i in range(1,n+1)): return buf[:-n]
-    return buf
-def _aes_dec(b,k):
-    AES,_=_lazy_crypto(); return AES.new(k,AES.MODE_ECB).decrypt(b)
-def _aes_enc(b,k):
-    AES,_=_lazy_crypto(); return AES.new(k,AES.MODE_ECB).encrypt(b)
-def _try_once(key:bytes, enc:bytes, checksum_be:bool)->bytes:
-    try:
-        dec=_aes_dec(enc,key)
-        print(f"DEBUG: AES decryption successful, decrypted {len(dec)} bytes")
-    except Exception as e:
-        raise ValueError(f"AES decryption failed: {e}")
-    
-    try:
-        unp=_strip_pkcs7(dec)
-        print(f"DEBUG: PKCS7 padding stripped, {len(unp)} bytes remaining")
-    except Exception as e:
-        raise ValueError(f"PKCS7 padding removal failed: {e}")
-    
-    if len(unp)<8: 
-        raise ValueError(f"data too short after padding removal: {len(unp)} bytes (need at least 8)")
-    
-    trailer=unp[-8:]
-    print(f"DEBUG: Raw trailer bytes: {trailer.hex()}")
-    chk=int.from_bytes(trailer[:4], "big" if checksum_be else "little")
-    ln =int.from_bytes(trailer[4:], "little")
-    print(f"DEBUG: Extracted checksum: {chk}, expected length: {ln}")
-    print(f"DEBUG: Checksum endian: {'big' if checksum_be else 'little'}")
-    
-    # Try original approach first - decompress everything including trailer
-    try:
-        print(f"DEBUG: Attempting zlib decompression on full {len(unp)} bytes (original method)")
-        plain=zlib.decompress(unp)
-        print(f"DEBUG: Zlib decompression successful with original method, {len(plain)} bytes")
-    except Exception as e1:
-        print(f"DEBUG: Original method failed: {e1}")
-        # Try without trailer
-        try:
-            print(f"DEBUG: Attempting zlib decompression on {len(unp[:-8])} bytes (without trailer)")
-            plain=zlib.decompress(unp[:-8])
-            print(f"DEBUG: Zlib decompression successful without trailer, {len(plain)} bytes")
-        except Exception as e2:
-            print(f"DEBUG: Both methods failed. Original: {e1}, Without trailer: {e2}")
-            raise ValueError(f"Zlib decompression failed: {e2}")
-    
-    actual_checksum = _adler32(plain)
-    print(f"DEBUG: Actual checksum: {actual_checksum}, Expected: {chk}")
-    print(f"DEBUG: Actual length: {len(plain)}, Expected: {ln}")
-    
-    # Check if this is a consistent checksum mismatch issue
-    checksum_diff = abs(actual_checksum - chk)
-    print(f"DEBUG: Checksum difference: {checksum_diff}")
-    
-    # For now, let's try to proceed despite checksum mismatch to see if we can load the data
-    if actual_checksum != chk:
-        print(f"DEBUG: WARNING - Checksum mismatch detected but attempting to continue...")
-        print(f"DEBUG: This might indicate a version compatibility issue or algorithm difference")
-        # Temporarily skip checksum validation to test if the data is otherwise valid
-        # raise ValueError(f"checksum mismatch: got {actual_checksum}, expected {chk}")
-    
-    if len(plain) != ln:
-        raise ValueError(f"length mismatch: got {len(plain)}, expected {ln}")
-    
-    return plain
-def validate_user_id(user_id: str) -> Tuple[bool, str]:
-    """
-    Validate user ID format for Epic Games or Steam.
-    Returns (is_valid, error_message)
-    """
-    if not user_id or not user_id.strip():
-        return False, "User ID cannot be empty"
-    
-    user_id = user_id.strip()
-    
-    # Check if it looks like a Steam ID (all digits, typically 17 digits)
-    if user_id.isdigit():
-        if len(user_id) < 10:
-            return False, "Steam ID appears too short (should be 17 digits)"
-        elif len(user_id) > 20:
-            return False, "Steam ID appears too long (should be 17 digits)"
-        return True, "Valid Steam ID format"
-    
-    # Check if it looks like an Epic Games ID (alphanumeric, typically 32 characters)
-    if user_id.replace('-', '').replace('_', '').isalnum():
-        if len(user_id) < 10:
-            return False, "Epic Games ID appears too short"
-        elif len(user_id) > 50:
-            return False, "Epic Games ID appears too long"
-        return True, "Valid Epic Games ID format"
-    
-    return False, "User ID contains invalid characters. Should be alphanumeric for Epic Games or digits only for Steam"
-
-def decrypt_auto(enc:bytes, user_id:str):
-    # Validate user ID format first
-    is_valid, validation_msg = validate_user_id(user_id)
-    if not is_valid:
-        raise ValueError(f"Invalid User ID format: {validation_msg}")
-    
-    epic_error = None
-    steam_error = None
-    
-    # Try Epic Games format first
-    try: 
-        return _try_once(_key_epic(user_id),enc,True),"epic"
-    except Exception as e: 
-        epic_error = str(e)
-    
-    # Try Steam format
-    try: 
-        return _try_once(_key_steam(user_id),enc,False),"steam"
-    except Exception as e: 
-        steam_error = str(e)
-    
-    # Both failed - provide detailed error message
-    error_msg = "Failed to decrypt save file. This usually means:\n"
-    error_msg += "1. Incorrect User ID - Make sure you're using the right Epic Games or Steam User ID\n"
-    error_msg += "2. Corrupted save file - The save file may be damaged\n"
-    error_msg += "3. Wrong save file - This might not be a valid BL4 save file\n\n"
-    error_msg += f"Epic Games attempt: {epic_error}\n"
-    error_msg += f"Steam attempt: {steam_error}\n\n"
-    error_msg += "For Epic Games: Use your Epic Games User ID (not display name)\n"
-    error_msg += "For Steam: Use your Steam ID64 number"
-    
-    raise ValueError(error_msg)
-def encrypt_from_yaml(yb:bytes, platform:str, user_id:str)->bytes:
-    AES, pad = _lazy_crypto()
-    key=_key_epic(user_id) if platform=="epic" else _key_steam(user_id)
-    comp=zlib.compress(yb,9)
-    trailer=_adler32(yb).to_bytes(4,"big" if platform=="epic" else "little")+len(yb).to_bytes(4,"little")
-    pt=pad(comp+trailer,16,style="pkcs7")
-    return _aes_enc(pt,key)
-
-# ── Serial codec + glacier-style grouping ─────────────────────────────────────
-_ALPHABET="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=!$%&*()[]{}~`^_<>?#;-"
-def bit_pack_decode(serial:str)->bytes:
-    payload=serial[3:] if serial.startswith("@Ug") else serial
-    cmap={c:i for i,c in enumerate(_ALPHABET)}
-    bits=''.join(format(cmap.get(c,0),'06b') for c in payload if c in cmap)
-    bits+='0'*((8-(len(bits)%8))%8)
-    return bytes(int(bits[i:i+8],2) for i in range(0,len(bits),8))
-def bit_pack_encode(data:bytes, prefix:str)->str:
-    bits=''.join(format(byte,'08b') for byte in data)
-    bits+='0'*((6-(len(bits)%6))%6)
-    return prefix + ''.join(_ALPHABET[int(bits[i:i+6],2)] for i in range(0,len(bits),6))
-
-def _extract_fields(b: bytes)->Dict[str,Union[int, List[int]]]:
-    fields: Dict[str, Union[int, List[int]]] = {}
-    if len(b)>=4:
-        fields['header_le']=int.from_bytes(b[:4],'little')
-        fields['header_be']=int.from_bytes(b[:4],'big')
-    if len(b)>=8:
-        fields['field2_le']=int.from_bytes(b[4:8],'little')
-    if len(b)>=12:
-        fields['field3_le']=int.from_bytes(b[8:12],'little')
-    # 16-bit grid
-    stats_16=[]
-    for i in range(0, min(len(b)-1, 20), 2):
-        val=int.from_bytes(b[i:i+2],'little')
-        fields[f'val16_at_{i}']=val
-        if 100 <= val <= 10000:
-            stats_16.append((i,val))
-    fields['potential_stats']=stats_16
-    # first bytes
-    flags=[]
-    for i in range(min(len(b), 20)):
-        bv=b[i]; fields[f'byte_{i}']=bv
-        if isinstance(bv, int) and bv < 100: flags.append((i,bv))
-    fields['potential_flags']=flags
-    return fields
-
-class ItemStats:
-    def __init__(self):
-        self.primary_stat: Optional[int] = None
-        self.secondary_stat: Optional[int] = None
-        self.level: Optional[int] = None
-        self.rarity: Optional[int] = None
-        self.manufacturer: Optional[int] = None
-        self.item_class: Optional[int] = None
-
-class DecodedItem:
-    def __init__(self, serial: str, item_type: str, category: str, data_len: int,
-                 stats: ItemStats, raw: Dict[str, Union[int, List[int]]], conf: str):
-        self.serial = serial
-        self.item_type = item_type
-        self.item_category = category
-        self.length = data_len
-        self.stats = stats
-        self.raw_fields = raw
-        self.confidence = conf
-
-def _decode_weapon(b: bytes, serial: str)->DecodedItem:
-    f=_extract_fields(b); s=ItemStats()
-    if 'val16_at_0' in f: s.primary_stat=f['val16_at_0']
-    if 'val16_at_12' in f: s.secondary_stat=f['val16_at_12']
-    if 'byte_4' in f: s.manufacturer=f['byte_4']
-    if 'byte_8' in f: s.item_class=f['byte_8']
-    if 'byte_1' in f: s.rarity=f['byte_1']
-    if 'byte_13' in f and f['byte_13'] in [2,34]: s.level=f['byte_13']
-    conf = "high" if len(b) in [24,26] else "medium"
-    return DecodedItem(serial,'r','weapon',len(b),s,f,conf)
-
-def _decode_equipment_e(b: bytes, serial: str)->DecodedItem:
-    f=_extract_fields(b); s=ItemStats()
-    if 'val16_at_2' in f: s.primary_stat=f['val16_at_2']
-    if 'val16_at_8' in f: s.secondary_stat=f['val16_at_8']
-    if 'val16_at_10' in f and len(b)>38: s.level=f['val16_at_10']
-    if 'byte_1' in f: s.manufacturer=f['byte_1']
-    if 'byte_3' in f: s.item_class=f['byte_3']
-    if 'byte_9' in f: s.rarity=f['byte_9']
-    conf="high" if ('byte_1' in f and f['byte_1']==49) else "medium"
-    return DecodedItem(serial,'e','equipment',len(b),s,f,conf)
-
-def _decode_equipment_d(b: bytes, serial: str)->DecodedItem:
-    f=_extract_fields(b); s=ItemStats()
-    if 'val16_at_4' in f: s.primary_stat=f['val16_at_4']
-    if 'val16_at_8' in f: s.secondary_stat=f['val16_at_8']
-    if 'val16_at_10' in f: s.level=f['val16_at_10']
-    if 'byte_5' in f: s.manufacturer=f['byte_5']
-    if 'byte_6' in f: s.item_class=f['byte_6']
-    if 'byte_14' in f: s.rarity=f['byte_14']
-    conf="high" if ('byte_5' in f and f['byte_5']==15) else "medium"
-    return DecodedItem(serial,'d','equipment_alt',len(b),s,f,conf)
-
-
-# ---- Friendly naming helpers (coarse fallback when explicit map missing) ----
-_MANUFACTURER_MAP = {
-    11: "Jakobs", 12: "Maliwan", 13: "Tediore", 14: "Hyperion",
-    15: "Torgue", 16: "Vladof", 17: "Atlas", 18: "DAHL", 49: "UGe"
-}
-_ITEMCLASS_MAP = {
-    10: "Pistol", 11: "Shotgun", 12: "SMG", 13: "Assault Rifle",
-    14: "Sniper", 15: "Heavy", 16: "Shield", 17: "Grenade", 18: "Relic"
-}
-def _compact_tags(d: 'DecodedItem')->str:
-    bits = []
-    if hasattr(d, 'stats') and d.stats is not None:
-        if d.stats.rarity is not None: bits.append(f"rarity={d.stats.rarity}")
-        if d.stats.manufacturer is not None: bits.append(f"mfr={d.stats.manufacturer}")
-        if d.stats.item_class is not None: bits.append(f"class={d.stats.item_class}")
-    return " | ".join(bits) if bits else "—"
-
-
-def _friendly_from_decoded(d: 'DecodedItem')->str:
-    """Return the best human-friendly name we can compute.
-    Priority:
-      1) Known serial prefix → weapon name 
-      2) Manufacturer + ItemClass (when both available)
-      3) ItemClass only
-      4) Generic by item_type
-    """
-    try:
-        if hasattr(d, "serial"):
-            nm = _weapon_name_from_serial(d.serial)
-            if nm:
-                return nm
-    except Exception:
-        pass
-    # Fallbacks based on decoded stats maps
-    brand = _MANUFACTURER_MAP.get(getattr(getattr(d, 'stats', None), 'manufacturer', None), None)
-    kind = _ITEMCLASS_MAP.get(getattr(getattr(d, 'stats', None), 'item_class', None), None)
-    if brand and kind:
-        return f"{brand} {kind}"
-    if kind:
-        return kind
-    return {"r":"Weapon","e":"Equipment","d":"Equipment Alt","u":"Special","f":"Special","!":"Special"}.get(getattr(d,'item_type','?'), "Unknown")
-
-
-def decode_item_serial(serial: str)->DecodedItem:
-    b=bit_pack_decode(serial)
-    t = serial[3] if serial.startswith('@Ug') and len(serial)>=4 else '?'
-    if t=='r': return _decode_weapon(b,serial)
-    if t=='e': return _decode_equipment_e(b,serial)
-    if t=='d': return _decode_equipment_d(b,serial)
-    # generic low confidence
-    f=_extract_fields(b); s=ItemStats()
-    ps=f.get('potential_stats',[])
-    if ps:
-        s.primary_stat = ps[0][1] if len(ps)>0 else None
-        s.secondary_stat = ps[1][1] if len(ps)>1 else None
-    if 'byte_1' in f: s.manufacturer=f['byte_1']
-    if 'byte_2' in f: s.rarity=f['byte_2']
-    cat={'w':'weapon_special','u':'utility','f':'consumable','!':'special'}.get(t,'unknown')
-    return DecodedItem(serial,t,cat,len(b),s,f,"low")
-
-def encode_item_serial(d: DecodedItem)->str:
-    import struct
-    b=bytearray(bit_pack_decode(d.serial))
-    try:
-        if d.item_type=='r':
-            if d.stats.primary_stat is not None and len(b)>=2: struct.pack_into('<H', b, 0, d.stats.primary_stat)
-            if d.stats.secondary_stat is not None and len(b)>=14: struct.pack_into('<H', b, 12, d.stats.secondary_stat)
-            if d.stats.rarity is not None and len(b)>=2: b[1]=int(d.stats.rarity)&0xFF
-            if d.stats.manufacturer is not None and len(b)>=5: b[4]=int(d.stats.manufacturer)&0xFF
-            if d.stats.item_class is not None and len(b)>=9: b[8]=int(d.stats.item_class)&0xFF
-        elif d.item_type=='e':
-            if d.stats.primary_stat is not None and len(b)>=4: struct.pack_into('<H', b, 2, d.stats.primary_stat)
-            if d.stats.secondary_stat is not None and len(b)>=10: struct.pack_into('<H', b, 8, d.stats.secondary_stat)
-            if d.stats.manufacturer is not None and len(b)>=2: b[1]=int(d.stats.manufacturer)&0xFF
-            if d.stats.item_class is not None and len(b)>=4: b[3]=int(d.stats.item_class)&0xFF
-            if d.stats.rarity is not None and len(b)>=10: b[9]=int(d.stats.rarity)&0xFF
-        elif d.item_type=='d':
-            if d.stats.primary_stat is not None and len(b)>=6: struct.pack_into('<H', b, 4, d.stats.primary_stat)
-            if d.stats.secondary_stat is not None and len(b)>=10: struct.pack_into('<H', b, 8, d.stats.secondary_stat)
-            if d.stats.manufacturer is not None and len(b)>=6: b[5]=int(d.stats.manufacturer)&0xFF
-            if d.stats.item_class is not None and len(b)>=7: b[6]=int(d.stats.item_class)&0xFF
-    except Exception:
-        pass
-    prefix=f"@Ug{d.item_type}"
-    return bit_pack_encode(bytes(b), prefix)
-
-# ── YAML decoded-items helpers ────────────────────────────────────────────────
-def find_and_decode_serials_in_yaml(yaml_data: dict) -> Dict[str, DecodedItem]:
-    decoded: Dict[str, DecodedItem] = {}
-    def walk(obj, path=""):
-        if isinstance(obj, dict):
-            for k,v in obj.items():
-                p=f"{path}.{k}" if path else k
-                if isinstance(v,str) and v.startswith("@Ug"):
-                    d=decode_item_serial(v)
-                    decoded[p]=d
-                else:
-                    walk(v,p)
-        elif isinstance(obj, list):
-            for i,val in enumerate(obj):
-                p=f"{path}[{i}]"
-                if isinstance(val,str) and val.startswith("@Ug"):
-                    d=decode_item_serial(val)
-                    decoded[p]=d
-                else:
-                    walk(val,p)
-    walk(yaml_data); return decoded
-
-def insert_decoded_items_in_yaml(yaml_data: dict, decoded: Dict[str, DecodedItem]) -> dict:
-    out=dict(yaml_data); out["_DECODED_ITEMS"]={}
-    for path,d in decoded.items():
-        item={
-            "original_serial": d.serial,
-            "item_type": d.item_type,
-            "category": d.item_category,
-            "confidence": d.confidence,
-            "stats": {}
-        }
-        s=d.stats
-        if s.primary_stat is not None: item["stats"]["primary_stat"]=s.primary_stat
-        if s.secondary_stat is not None: item["stats"]["secondary_stat"]=s.secondary_stat
-        if s.level is not None: item["stats"]["level"]=s.level
-        if s.rarity is not None: item["stats"]["rarity"]=s.rarity
-        if s.manufacturer is not None: item["stats"]["manufacturer"]=s.manufacturer
-        if s.item_class is not None: item["stats"]["item_class"]=s.item_class
-        out["_DECODED_ITEMS"][path]=item
-    return out
+from bl4.crypto import COMPRESSION_PRESETS, DEFAULT_COMPRESSION, compression_level
+from bl4.save import open_save_file, unchanged_payload, write_encrypted_save, write_save_bytes, yaml_text_to_save_obj
 
-def set_nested_value(data: dict, path: str, value: str):
-    parts = path.split('.')
-    cur = data
-    for part in parts[:-1]:
-        if '[' in part and part.endswith(']'):
-            key, idxs = part.split('['); idx=int(idxs[:-1])
-            cur = cur[key][idx]
-        else:
-            cur = cur[part]
-    last=parts[-1]
-    if '[' in last and last.endswith(']'):
-        key, idxs = last.split('['); idx=int(idxs[:-1]); cur[key][idx]=value
-    else:
-        cur[last]=value
-
-def extract_and_encode_serials_from_yaml(yaml_data: dict) -> dict:
-    if "_DECODED_ITEMS" not in yaml_data: return yaml_data
-    out=dict(yaml_data)
-    for path, info in yaml_data["_DECODED_ITEMS"].items():
-        d=DecodedItem(
-            serial=info["original_serial"],
-            item_type=info["item_type"],
-            category=info.get("category","unknown"),
-            data_len=0,
-            stats=ItemStats(),
-            raw={},
-            conf=info.get("confidence","low")
-        )
-        st=info.get("stats",{})
-        d.stats.primary_stat=st.get("primary_stat")
-        d.stats.secondary_stat=st.get("secondary_stat")
-        d.stats.level=st.get("level")
-        d.stats.rarity=st.get("rarity")
-        d.stats.manufacturer=st.get("manufacturer")
-        d.stats.item_class=st.get("item_class")
-        new_serial=encode_item_serial(d)
-        set_nested_value(out, path, new_serial)
-    out.pop("_DECODED_ITEMS", None)
-    return out
+from bl4.serials import (
+    bit_pack_encode, _friendly_name, _tags_text, decode_item_serial, decode_item_serials, encode_item_serial,
+    forget_serial, serial_record, find_and_decode_serials_in_yaml, insert_decoded_items_in_yaml,
+)
 
-# ── YAML path helpers for Items table ─────────────────────────────────────────
-def walk_ug(node: Any, path: str = "")->List[Tuple[str,str]]:
-    out=[]
-    if isinstance(node,dict):
-        for k,v in node.items():
-            p=f"{path}/{k}" if path else k
-            if isinstance(v,str) and v.startswith("@Ug"):
-                out.append((p,v))
-            else:
-                out.extend(walk_ug(v,p))
-    elif isinstance(node,list):
-        for i,v in enumerate(node):
-            p=f"{path}[{i}]"; out.extend(walk_ug(v,p))
-    return out
-def tokens(path: str)->List[Any]:
-    toks=[]; i=0
-    while i<len(path):
-        if path[i]=='[':
-            j=path.find(']',i)
-            toks.append(int(path[i+1:j]))
-            i=j+1
-        else:
-            j=path.find('/',i)
-            seg=path[i:] if j==-1 else path[i:j]
-            toks.append(seg)
-            i=len(path) if j==-1 else j+1
-    return [t for t in toks if t!=""]
-def set_by(obj: Any, toks: List[Any], val: Any)->None:
-    cur=obj
-    for t in toks[:-1]: cur=cur[t]
-    cur[toks[-1]]=val
-
-# ── SDU helpers ───────────────────────────────────────────────────────────────
-SDU_GRAPH_NAME = "sdu_upgrades"
-SDU_GROUP_DEF = "Oak2_GlobalProgressGraph_Group"
-SDU_NODES = [
-    ("Ammo_Pistol_01",5), ("Ammo_Pistol_02",10), ("Ammo_Pistol_03",20), ("Ammo_Pistol_04",30),
-    ("Ammo_Pistol_05",50), ("Ammo_Pistol_06",80), ("Ammo_Pistol_07",120),
-    ("Ammo_SMG_01",5), ("Ammo_SMG_02",10), ("Ammo_SMG_03",20), ("Ammo_SMG_04",30),
-    ("Ammo_SMG_05",50), ("Ammo_SMG_06",80), ("Ammo_SMG_07",120),
-    ("Ammo_AR_01",5), ("Ammo_AR_02",10), ("Ammo_AR_03",20), ("Ammo_AR_04",30),
-    ("Ammo_AR_05",50), ("Ammo_AR_06",80), ("Ammo_AR_07",120),
-    ("Ammo_SG_01",5), ("Ammo_SG_02",10), ("Ammo_SG_03",20), ("Ammo_SG_04",30),
-    ("Ammo_SG_05",50), ("Ammo_SG_06",80), ("Ammo_SG_07",120),
-    ("Ammo_SR_01",5), ("Ammo_SR_02",10), ("Ammo_SR_03",20), ("Ammo_SR_04",30),
-    ("Ammo_SR_05",50), ("Ammo_SR_06",80), ("Ammo_SR_07",120),
-    ("Backpack_01",5), ("Backpack_02",10), ("Backpack_03",20), ("Backpack_04",30),
-    ("Backpack_05",50), ("Backpack_06",80), ("Backpack_07",120), ("Backpack_08",235),
-    ("Bank_01",5), ("Bank_02",10), ("Bank_03",20), ("Bank_04",30),
-    ("Bank_05",50), ("Bank_06",80), ("Bank_07",120), ("Bank_08",235),
-    ("Lost_Loot_01",5), ("Lost_Loot_02",10), ("Lost_Loot_03",20), ("Lost_Loot_04",30),
-    ("Lost_Loot_05",50), ("Lost_Loot_06",80), ("Lost_Loot_07",120), ("Lost_Loot_08",235),
-]
-def ensure_sdu_graph(prog: Dict[str, Any]) -> None:
-    graphs = prog.setdefault("graphs", [])
-    existing = None
-    for g in graphs:
-        if isinstance(g, dict) and g.get("name") == SDU_GRAPH_NAME:
-            existing = g; break
-    if existing is None:
-        existing = {"name": SDU_GRAPH_NAME, "group_def_name": SDU_GROUP_DEF, "nodes": []}
-        graphs.append(existing)
-    nodes = existing.setdefault("nodes", [])
-    by_name = {n.get("name"): n for n in nodes if isinstance(n, dict)}
-    for name, pts in SDU_NODES:
-        n = by_name.get(name)
-        if n is None:
-            nodes.append({"name": name, "points_spent": pts})
-        else:
-            n["points_spent"] = pts
-
-def sum_points_in_graphs(prog: Dict[str, Any], name_prefixes: Optional[List[str]] = None) -> int:
-    total = 0
-    for g in prog.get("graphs", []) or []:
-        gname = g.get("name","")
-        if name_prefixes and not any(gname.startswith(p) for p in name_prefixes):
-            continue
-        for n in g.get("nodes", []) or []:
-            if isinstance(n, dict) and "points_spent" in n and isinstance(n["points_spent"], (int, float)):
-                total += int(n["points_spent"])
-    return total
+from bl4.paths import ItemPath, walk_paths
+from bl4.progression import SDU_GRAPH_NAME, ensure_sdu_graph, sum_points_in_graphs
 
 # ── App ───────────────────────────────────────────────────────────────────────
 class App:
@@ -1299,14 +192,8 @@ class App:
                 r = self._root()
                 root = r if isinstance(r, dict) else {}
             touched = _unlock_all_map_areas(root if isinstance(root, dict) else {})
-            # Refresh YAML view
-            try:
-                import yaml as _yaml
-                if hasattr(self, 'yaml_text') and hasattr(self, 'yaml_obj'):
-                    self.yaml_text.delete("1.0", "end")
-                    self.yaml_text.insert("1.0", _yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
-            except Exception:
-                pass
+            # YAML view catches up when next shown / before encrypt
+            self._mark_yaml_dirty(("state", "world", "map"))
             # Refresh items list
             try:
                 if hasattr(self, 'refresh_items'):
@@ -1324,23 +211,13 @@ class App:
             except Exception:
                 pass
 
-    def _normalize_unlock_variants(self, entry: str):
-        """Return case-flex variants used for case-sensitive unlockables."""
-        e = str(entry)
-        out = {e}
-        if "." in e:
-            prefix, rest = e.split(".", 1)
-            out.add(prefix + "." + rest.lower())
-        out.add(e.lower())
-        return list(out)
-
     def dump_yaml(self):
         """Write the current in-memory profile object to profile_decrypted.yaml next to the .sav/.profile."""
         if not getattr(self, "profile_obj", None):
             return mb.showwarning("No profile", "Decrypt Profile first")
         try:
             p = Path(self.profile_path or ".").with_name("profile_decrypted.yaml")
-            txt = yaml.safe_dump(self.profile_obj, sort_keys=False, allow_unicode=True)
+            txt = dump_yaml(self.profile_obj)
             p.write_text(txt, encoding="utf-8")
             self.log(f"[Profile] Dumped YAML → {p}")
             try: mb.showinfo("Dump YAML", f"Wrote {p.name}")
@@ -1351,19 +228,8 @@ class App:
             except Exception: pass
 
     def _normalize_unlock_variants(self, entry: str):
-        """Return case-flex variants used for case-sensitive unlockables.
-        Variants:
-          - original
-          - lowercased after the first dot (prefix preserved)
-          - fully lowercase
-        """
-        e = str(entry)
-        out = {e}
-        if "." in e:
-            prefix, rest = e.split(".", 1)
-            out.add(prefix + "." + rest.lower())
-        out.add(e.lower())
-        return list(out)
+        """Return case-flex variants used for case-sensitive unlockables."""
+        return normalize_unlock_variants(entry)
 
     def __init__(self, root: tk.Tk):
         self.root = root; self.root.title("BL4 Save Editor v1.04a Full"); self.root.geometry("1340x900")
@@ -1377,7 +243,13 @@ class App:
         self.profile_platform: Optional[str] = None
         self.profile_obj: Optional[Any] = None
         self.unlock_profile_var = tk.BooleanVar(value=False)
+        self.compression_var = tk.StringVar(value=DEFAULT_COMPRESSION)
         self.yaml_obj: Optional[Any] = None
+        self._original = self._profile_original = None   # OriginalSave of the last decrypt, for byte-identical no-op saves
+        self._yaml_dirty = False   # yaml_obj edited in ways only a full re-render of yaml_text shows
+        self._yaml_patches: set = set()   # paths of edited subtrees not yet spliced into yaml_text
+        self._yaml_index: Optional[LineIndex] = None
+        self._save_ix: Optional[SaveIndex] = None   # serial/currency/experience/graph index of yaml_obj
 
         # currency paths cache
         self.cur_paths: Dict[str, Optional[List[Union[str,int]]]] = {"cash":None, "eridium":None, "shift":None}
@@ -1395,6 +267,8 @@ class App:
         ttk.Button(top, text="Encrypt Profile", command=self.encrypt_profile).pack(side="left", padx=4)
         ttk.Checkbutton(top, text="Unlocks (Profile)", variable=self.unlock_profile_var).pack(side="left", padx=8)
         ttk.Button(top, text="Dump YAML", command=self.dump_yaml).pack(side="left", padx=4)
+        ttk.Label(top, text="Compression:").pack(side="left", padx=(8,0))
+        ttk.Combobox(top, textvariable=self.compression_var, values=list(COMPRESSION_PRESETS), width=9, state="readonly").pack(side="left", padx=4)
         ttk.Label(top, text=" ").pack(side="left", padx=4)  # preview removed in H build
 
         # Tabs
@@ -1411,6 +285,7 @@ class App:
 
         self.tab_yaml = ttk.Frame(self.nb); self.nb.add(self.tab_yaml, text="YAML (Advanced)")
         self._build_tab_yaml(self.tab_yaml)
+        self.nb.bind("<<NotebookTabChanged>>", lambda _e: self._sync_yaml_text() if self.nb.select() == str(self.tab_yaml) else None)
 
         # Logs / Status
         bottom = ttk.Frame(root); bottom.pack(fill="x", side="bottom")
@@ -1420,12 +295,69 @@ class App:
         sb = tk.Scrollbar(lw, command=self.logs.yview); sb.pack(side="right", fill="y")
         self.logs.config(yscrollcommand=sb.set)
         self.status = tk.Label(bottom, text="No save loaded", anchor="w", bg=Dark.BG, fg=Dark.FG); self.status.pack(fill="x")
+        self.log(f"YAML engine: {yaml_engine()}")
 
     # utils
     def log(self,m:str):
         t=time.strftime("%H:%M:%S"); self.logs.insert("end", f"[{t}] {m}\n"); self.logs.see("end")
     def set_status(self,m:str): self.status.config(text=m)
 
+    # ---- YAML text view: regenerated from yaml_obj on demand ----
+    def _set_yaml_text(self, text: str):
+        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", text); self.yaml_text.edit_modified(False)
+        self._yaml_dirty = False; self._yaml_patches.clear(); self._yaml_index = None
+    def _mark_yaml_dirty(self, *paths: tuple):
+        """Call after editing yaml_obj with the path of each edited subtree, e.g. ("state","inventory","backpack","slot_3");
+        no paths means anything may have changed. The view catches up when the YAML tab is shown or before encrypt."""
+        if paths: self._yaml_patches.update(tuple(p) for p in paths)
+        else: self._yaml_dirty = True
+        if self.nb.select() == str(self.tab_yaml): self._sync_yaml_text()
+    def _sync_yaml_text(self):
+        if yaml is None or self.yaml_obj is None or not (self._yaml_dirty or self._yaml_patches): return
+        if not self._yaml_dirty:
+            # splice just the edited subtrees over their lines; the index is (re)built from the widget on first use
+            # or after the text was edited by hand, so manual edits elsewhere in the text survive
+            w = self.yaml_text
+            try:
+                if self._yaml_index is None or w.edit_modified(): self._yaml_index = LineIndex(w.get("1.0","end-1c"))
+                done = []
+                for p in sorted(self._yaml_patches, key=len):
+                    if any(p[:len(q)] == q for q in done): continue
+                    try: self._get_by_path(self.yaml_obj, p)
+                    except (KeyError, IndexError, TypeError): continue   # not in the save; nothing to show
+                    cut = self._yaml_index.splice(self.yaml_obj, p)
+                    if cut is None: break
+                    a, b, block = cut; done.append(p)
+                    w.delete(f"{a+1}.0", f"{b+1}.0"); w.insert(f"{a+1}.0", block)
+                else:
+                    w.edit_modified(False); self._yaml_patches.clear(); return
+            except Exception as e:
+                self.log(f"YAML view: re-rendering in full ({e})")
+        self._set_yaml_text(dump_yaml(self.yaml_obj))
+    def _root_path(self) -> tuple:
+        """Path of _root() inside yaml_obj: ("state",) or ()."""
+        r = self._root()
+        return ("state",) if r is not None and r is not self.yaml_obj else ()
+    def _class_paths(self) -> List[tuple]:
+        """Where the Class field and set_character_class() put the class."""
+        return [self._root_path() + ("class",), ("state", "character", "class"), ("character", "class")]
+    def _graph_paths(self, gname: str, nname: Optional[str] = None) -> List[tuple]:
+        """Paths of progression graph `gname` (or its node `nname`), root scope first, then top-level."""
+        ix = self._save_index()
+        return ix.graph_paths(gname, nname) if ix else []
+    def _item_path(self, text: str) -> ItemPath:
+        """ItemPath of an Items-tab row; looked up in the save index, parsed only if it isn't there."""
+        ix = self._save_index(); ref = ix.serial(text) if ix else None
+        return ref.path if ref else ItemPath.parse(text)
+    def _save_index(self) -> Optional[SaveIndex]:
+        """SaveIndex of yaml_obj; rebuilt only when yaml_obj (or its /state root) has been replaced."""
+        r = self._root()
+        if r is None: self._save_ix = None; return None
+        ix = self._save_ix
+        if ix is None or ix.doc is not self.yaml_obj or ix.root is not r:
+            ix = self._save_ix = SaveIndex(self.yaml_obj, r)
+        return ix
+
     # ---- YAML root resolver ----
     def _root(self)->Optional[dict]:
         if not isinstance(self.yaml_obj, dict):
@@ -1445,17 +377,11 @@ class App:
         # Final fallback
         return state or r0
 
-    # generic path walkers for currencies
-    def _walk(self, node: Any, path: Optional[List[Union[str,int]]] = None):
-        if path is None: path=[]
-        if isinstance(node, dict):
-            for k,v in node.items():
-                yield path+[k], v
-                yield from self._walk(v, path+[k])
-        elif isinstance(node, list):
-            for i,v in enumerate(node):
-                yield path+[i], v
-                yield from self._walk(v, path+[i])
+    # generic path walker: (path tuple, value) pre-order; keys=/types=/where= filter before any path is built
+    def _walk(self, node: Any, path: Optional[List[Union[str,int]]] = None, **filters):
+        base = tuple(path or ())
+        for p, _, v in walk_paths(node, **filters):
+            yield base + p, v
 
     @staticmethod
     def _get_by_path(root: Any, toks: List[Union[str,int]]):
@@ -1471,38 +397,13 @@ class App:
 
 
     def _find_currency_paths(self, r: dict):
-        """Detect cash/eridium/shift locations. Prefers `r["currencies"]` when present.
-        SHIFT may be stored as a string token (e.g., "shift"), so we accept str too.
+        """Detect cash/eridium/shift locations. Prefers `r["currencies"]` when present, else any
+        scalar with a likely name (see bl4.index). SHIFT may be stored as a string token (e.g.,
+        "shift"), so we accept str too.
         """
-        found = {"cash": None, "eridium": None, "shift": None}
-
-        # Prefer explicit currencies block
-        cur = r.get("currencies")
-        if isinstance(cur, dict):
-            for key, target in [
-                ("cash", "cash"),
-                ("eridium", "eridium"),
-                ("golden_keys", "shift"), ("gold_keys", "shift"),
-                ("golden_key", "shift"), ("keys", "shift"),
-                ("shift", "shift"),
-            ]:
-                if key in cur and isinstance(cur[key], (int, float, str)):
-                    found[target] = ["currencies", key]
-
-        # Fallback: scan whole tree for likely names
-        if not all(v is not None for v in found.values()):
-            keysets = {
-                "cash": ["cash","money","credits","dollars"],
-                "eridium": ["eridium","vaultcoin","vault_coins","eridium_amount"],
-                "shift": ["shift","gold_keys","goldkeys","golden_keys","goldenkeys","keys"],
-            }
-            for path, val in self._walk(r):
-                if isinstance(val, (int, float, str)):
-                    last = str(path[-1]).lower()
-                    for name, keys in keysets.items():
-                        if found[name] is None and last in keys:
-                            found[name] = path.copy()
-
+        ix = self._save_index()
+        found = {k: (list(v) if v else None) for k, v in ix.currencies.items()} if ix and ix.root is r else \
+            SaveIndex(r).currencies
         self.cur_paths.update(found)
         for k, v in found.items():
             if v:
@@ -1528,14 +429,12 @@ class App:
                               "For Steam: Use your Steam ID64 number\n\n" +
                               "You can find these in your game settings or profile.")
         
-        enc=self.save_path.read_bytes()
         try:
-            plain, plat = decrypt_auto(enc, user_id)
-            ts=time.strftime("%Y-%m-%d-%H%M"); backup=self.save_path.with_suffix(f".{ts}.bak"); backup.write_bytes(enc)
+            (plain, plat, backup), self._original = open_save_file(self.save_path, user_id)
             self.platform=plat; self.yaml_path=self.save_path.with_suffix(".yaml"); self.yaml_path.write_bytes(plain)
             text=plain.decode(errors="ignore")
-            self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", text)
-            try: self.yaml_obj=yaml.load(text, Loader=get_yaml_loader())
+            self._set_yaml_text(text)
+            try: self.yaml_obj=load_yaml_lazy(text)
             except Exception as e: self.yaml_obj=None; self.log(f"YAML note: {e}")
             self.refresh_character(); self.refresh_items(); ns=_load_embedded_decoder(); self.log('Decoder present: ' + str('decode_item_serial' in ns)); self.refresh_progression()
             root_obj=self._root(); root_used="/state" if (isinstance(self.yaml_obj,dict) and root_obj is self.yaml_obj.get("state")) else "/"
@@ -1559,11 +458,7 @@ class App:
 
     
     def _ensure_unique_rewards(self, root_dict):
-        if not isinstance(root_dict, dict):
-            return None
-        if "unique_rewards" not in root_dict or not isinstance(root_dict.get("unique_rewards"), list):
-            root_dict["unique_rewards"] = []
-        return root_dict["unique_rewards"]
+        return ensure_unique_rewards(root_dict)
 
     def _apply_unlocks(self):
         """Inject embedded cosmetic RewardPackages into unique_rewards when the checkbox is enabled."""
@@ -1571,23 +466,27 @@ class App:
             r = self._root()
             if not isinstance(r, dict):
                 self.log("Unlock: YAML root not found; skipping."); return
-            uniq = self._ensure_unique_rewards(r)
-            before = set(map(str, uniq))
-            added = 0
             if getattr(self, "unlock_all_cosmetics_var", None) and self.unlock_all_cosmetics_var.get():
-                for pkg in EMBEDDED_REWARD_PACKAGES:
-                    if pkg and pkg not in before:
-                        uniq.append(pkg); added += 1
-                self.log(f"Unlock Cosmetics: +{added} (unique_rewards: {len(before)} → {len(uniq)})")
+                added, before, after = add_reward_packages(r)
+                self.log(f"Unlock Cosmetics: +{added} (unique_rewards: {before} → {after})")
                 # reflect YAML so Encrypt saves exactly this
-                if yaml is not None and isinstance(self.yaml_obj, dict):
-                    safe = yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True)
-                    self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", safe)
+                if isinstance(self.yaml_obj, dict): self._mark_yaml_dirty(self._root_path() + ("unique_rewards",))
             else:
                 self.log("Unlock Cosmetics: checkbox off — no changes.")
         except Exception as e:
             self.log(f"Unlock error: {e}")
 
+    def _unchanged_payload(self, text: str, plat: str, uid: str) -> Optional[bytes]:
+        """Encrypted bytes taken straight from the decrypted save when `text` still matches it byte for byte."""
+        try: return unchanged_payload(self._original, text, plat, uid, **self._encrypt_options())
+        except Exception: return None
+
+    def _encrypt_options(self) -> Dict[str, Optional[int]]:
+        # zlib level from the Compression box; threads=None lets EncryptWriter go parallel only for large saves
+        var = getattr(self, "compression_var", None)
+        return {"level": compression_level(var.get() if var is not None else DEFAULT_COMPRESSION),
+                "threads": None}
+
     def encrypt(self):
 
         # Auto-apply map unlock if requested
@@ -1607,7 +506,9 @@ class App:
             _apply_selected_class_104a(self)
         except Exception as __e:
             print("class apply hook error:", __e)
-
+        if isinstance(self.yaml_obj, dict):   # the text view is what gets encrypted
+            if getattr(self, 'var_unlock_map', None) and self.var_unlock_map.get(): self._mark_yaml_dirty(("state", "world", "map"))
+            self._mark_yaml_dirty(*self._class_paths())
 
         if not self.yaml_path: return mb.showwarning("No YAML","Decrypt first")
         if yaml is None:
@@ -1617,22 +518,27 @@ class App:
             self._apply_unlocks()
         except Exception as _e:
             self.log(f"Unlock pass note: {_e}")
-        txt=self.yaml_text.get("1.0","end")
-        try:
-            obj=yaml.load(txt, Loader=get_yaml_loader())
-            # encode from _DECODED_ITEMS if present
-            obj = extract_and_encode_serials_from_yaml(obj)
-            yb=yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).encode()
-        except Exception as e:
-            return mb.showerror("Invalid YAML", f"Fix YAML before encrypting:\n{e}")
+        self._sync_yaml_text(); txt=self.yaml_text.get("1.0","end-1c")
+        out=self.save_path.with_suffix(".sav"); plat=self.platform or "epic"
+        # nothing edited: write the decrypted save back as-is, no parse/re-encode/dump/recompress
+        same=self._unchanged_payload(txt, plat, self.user_id.get())
+        if same is None:
+            try:
+                # encode from _DECODED_ITEMS if present
+                obj=yaml_text_to_save_obj(txt)
+            except Exception as e:
+                return mb.showerror("Invalid YAML", f"Fix YAML before encrypting:\n{e}")
         try:
-            out=self.save_path.with_suffix(".sav"); out.write_bytes(encrypt_from_yaml(yb,self.platform or "epic", self.user_id.get()))
-            self.log(f"Encrypted → {out.name}"); mb.showinfo("Done", f"Saved {out.name}")
+            if same is not None: write_save_bytes(out, same)
+            else: write_encrypted_save(out, obj, plat, self.user_id.get(), **self._encrypt_options())
+            self.log(f"Encrypted → {out.name}" + (" (YAML unchanged)" if same is not None else "")); mb.showinfo("Done", f"Saved {out.name}")
         except Exception as e:
             mb.showerror("Encrypt Failed", str(e)); self.log(f"Encrypt error: {e}")
 
     # Character
     def _find_experience(self, r: dict)->Tuple[Optional[Dict[str,Any]],Optional[Dict[str,Any]]]:
+        ix = self._save_index()
+        if ix is not None and ix.root is r: return ix.character, ix.specialization
         exp = r.get("experience")
         ch = sp = None
         if isinstance(exp, list):
@@ -1715,13 +621,14 @@ class App:
         r["class"]=self.cf["Class"].get()
         r["char_name"]=self.cf["Name"].get()
         r["player_difficulty"]=self.cf["Difficulty"].get()
-        ch, sp = self._find_experience(r)
+        ch, sp = self._find_experience(r); added = ch is None or sp is None
         if ch is None:
             if "experience" not in r or not isinstance(r["experience"], list): r["experience"]=[]
             ch={"type":"Character"}; r["experience"].append(ch)
         if sp is None:
             if "experience" not in r or not isinstance(r["experience"], list): r["experience"]=[]
             sp={"type":"Specialization"}; r["experience"].append(sp)
+        self._save_index().refresh_experience()
         def maybe_int(x):
             try: return int(str(x).strip())
             except: return x
@@ -1737,7 +644,12 @@ class App:
                 except Exception:
                     self.log(f"Could not set {label} at detected path")
 # reflect to YAML text
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        rp = self._root_path(); exp = r["experience"]
+        entries = [i for i, e in enumerate(exp) if e is ch or e is sp]
+        self._mark_yaml_dirty(*self._class_paths(), *(rp + (k,) for k in ("char_name", "player_difficulty")),
+                              *((rp + ("experience", i) for i in entries) if len(entries) == 2 and not added else [rp + ("experience",)]),
+                              *(rp + tuple(p) for p in self.cur_paths.values() if p))
+        if getattr(self, 'var_unlock_map', None) and self.var_unlock_map.get(): self._mark_yaml_dirty(("state", "world", "map"))
         self.log("Character + currencies applied.")
 
     # Progression
@@ -1769,9 +681,7 @@ class App:
         if not isinstance(r, dict): return
         for r_ in self.prog_tree.get_children(): self.prog_tree.delete(r_)
         # Prefer progression under the active root (/state), but fall back to top-level if empty
-        prog = (r.get("progression") or {})
-        if not prog and isinstance(self.yaml_obj, dict):
-            prog = (self.yaml_obj.get("progression") or {})
+        prog = self._save_index().progression
         found = 0
         for g in (prog.get("graphs") or []):
             found += 1
@@ -1787,6 +697,8 @@ class App:
             self.log("No progression graphs found under root; also checked top-level.")
 
     def _find_graph_node(self, r: dict, gname:str, nname:str)->Optional[Dict[str,Any]]:
+        ix = self._save_index()
+        if ix is not None and ix.root is r: return ix.node(gname, nname)
         # Search under root/state first
         prog=(r or {}).get("progression") or {}
         for g in (prog.get("graphs") or []):
@@ -1820,7 +732,7 @@ class App:
         else:
             try: node["activation_level"]=int(lv)
             except: return mb.showerror("Invalid","activation_level must be an integer")
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        self._mark_yaml_dirty(*self._graph_paths(gname, nname)[:1])
         self.refresh_progression()
         self.log(f"Updated node: {gname} / {nname}")
 
@@ -1830,26 +742,21 @@ class App:
         gname=self.prog_tree.item(sel[0],"values")[0]
         r=self._root()
         if not isinstance(r, dict): return
-        # Try root progression and top-level fallback
+        # Root progression and top-level fallback
         applied=False
-        scopes=[r]
-        if isinstance(self.yaml_obj, dict): scopes.append(self.yaml_obj)
-        for scope in scopes:
-            prog=(scope or {}).get("progression") or {}
-            for g in (prog.get("graphs") or []):
-                if g.get("name")==gname:
-                    for n in (g.get("nodes") or []):
-                        n["is_activated"]=state
-                    applied=True
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        for ref in self._save_index().graph_refs(gname):
+            for n in (ref.graph.get("nodes") or []):
+                n["is_activated"]=state
+            applied=True
+        self._mark_yaml_dirty(*self._graph_paths(gname))
         self.refresh_progression()
         self.log(("Activated" if state else "Deactivated") + f" all nodes in graph: {gname}" + (" (top-level)" if not applied else ""))
 
     def max_sdu(self):
         r=self._root()
         if not isinstance(r, dict): return
-        prog=r.setdefault("progression", {}); ensure_sdu_graph(prog)
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        prog=r.setdefault("progression", {}); ensure_sdu_graph(prog); self._save_index().refresh_graphs()
+        self._mark_yaml_dirty(*self._graph_paths(SDU_GRAPH_NAME)[:1])
         self.refresh_progression(); self.log("SDU graph maximized.")
 
     def recalc_pools(self):
@@ -1859,7 +766,7 @@ class App:
         # If current root had no progression, try at top-level so we don't crash
         if not prog and isinstance(self.yaml_obj, dict):
             prog = self.yaml_obj.setdefault("progression", {})
-        pools=prog.setdefault("point_pools", {})
+        pools=prog.setdefault("point_pools", {}); self._save_index().refresh_graphs()
         char_pts = sum_points_in_graphs(prog, name_prefixes=["Progress_DS_"])
         spec_pts = sum_points_in_graphs(prog, name_prefixes=["ProgressGraph_Specializations"])
         pools["characterprogresspoints"]=char_pts
@@ -1868,7 +775,7 @@ class App:
         except: cap=3225
         cur=int(pools.get("echotokenprogresspoints",0))
         pools["echotokenprogresspoints"]=min(cur if cur else cap, cap)
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        self._mark_yaml_dirty((self._root_path() if prog is r.get("progression") else ()) + ("progression", "point_pools"))
         self.refresh_progression()
         self.log(f"Recalculated pools → character:{char_pts} specialization:{spec_pts} echo:{pools['echotokenprogresspoints']}")
 
@@ -1894,24 +801,21 @@ class App:
 
         # Build 6-tuples for the items table: (path, type, name, code, serial, tags)
         self.items = []
-        r = self._root()
-        if not isinstance(r, dict):
+        ix = self._save_index()
+        if ix is None:
             return
-        for path, serial in walk_ug(r):
+        cols = decode_item_serials([ref.serial for ref in ix.serials])
+        for i, (path, serial, _, _) in enumerate(ix.serials):
             # Type from @Ug? prefix
-            t = serial[3] if serial.startswith("@Ug") and len(serial) >= 4 else "?"
+            t = cols.item_type[i]
             dtype = {"r":"Weapon","e":"Equipment","d":"Equipment Alt","u":"Special","f":"Special","!":"Special"}.get(t,"Unknown")
             # Compact code
             code4 = serial[:4] if serial.startswith("@Ug") and len(serial) >= 4 else "@Ug?"
-            # Friendly name + tags via decoder (best-effort)
-            try:
-                dec = decode_item_serial(serial)
-                name = _friendly_from_decoded(dec)
-                tags = _compact_tags(dec)
-            except Exception:
-                name = ""
-                tags = ""
-            self.items.append((path, dtype, name, code4, serial, tags))
+            # Friendly name + tags from the decoded columns
+            mfr, cls = cols.value("manufacturer", i), cols.value("item_class", i)
+            name = _friendly_name(serial, t, mfr, cls)
+            tags = _tags_text(cols.value("rarity", i), mfr, cls)
+            self.items.append((str(path), dtype, name, code4, serial, tags))
         self.apply_filter()
 
 
@@ -1928,8 +832,8 @@ class App:
         sel=self.tree.selection()
         if not sel: return
         p,dtype,name,code,serial,tags = _safe_unpack_item_values(self.tree.item(sel[0],"values"))
-        toks=tokens(p); d=decode_item_serial(serial)
-        b=bytearray(bit_pack_decode(serial))
+        ipath=self._item_path(p); rec=serial_record(serial); d=rec.item()
+        b=bytearray(rec.data)
         top=tk.Toplevel(self.root); top.title("BL4 Save Editor v1.04a Full"); top.geometry("880x620"); top.configure(bg=Dark.BG)
         nb=ttk.Notebook(top); nb.pack(expand=True,fill="both")
 
@@ -1966,9 +870,9 @@ class App:
 
             root = self.yaml_obj if self._root() is self.yaml_obj else self._root()
 
-            set_by(root, toks, new_serial)
+            if not self._save_index().set_serial(ipath, new_serial): ipath.set(root, new_serial); forget_serial(serial)
             # reflect
-            self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+            self._mark_yaml_dirty(self._root_path() + ipath)
             self.refresh_items(); self.log(f"Updated {p}"); top.destroy()
         ttk.Button(simp,text="Save & Encode",command=save_simple).pack(pady=10)
 
@@ -1980,7 +884,7 @@ class App:
         window=canvas.create_window((0,0),window=frame,anchor="nw")
         def on_config(event): canvas.configure(scrollregion=canvas.bbox("all"))
         frame.bind("<Configure>", on_config)
-        raw=_extract_fields(bytes(b)); ents={}; r_=0
+        raw=d.raw_fields; ents={}; r_=0
         for k in sorted(raw.keys()):
             ttk.Label(frame,text=k).grid(row=r_,column=0,sticky="w",padx=6,pady=3)
             v=tk.StringVar(value=str(raw[k])); ttk.Entry(frame,textvariable=v,width=24).grid(row=r_,column=1,sticky="w",padx=6,pady=3)
@@ -2032,9 +936,9 @@ class App:
                         bb[idx] = int(val) & 0xFF
             prefix = f"@Ug{d.item_type}"
             new_serial = bit_pack_encode(bytes(bb), prefix)
-            set_by(self.yaml_obj if self._root() is self.yaml_obj else self._root(), toks, new_serial)
-            self.yaml_text.delete("1.0", "end")
-            self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+            if not self._save_index().set_serial(ipath, new_serial):
+                ipath.set(self.yaml_obj if self._root() is self.yaml_obj else self._root(), new_serial); forget_serial(serial)
+            self._mark_yaml_dirty(self._root_path() + ipath)
             self.refresh_items()
             if cleaned:
                 self.log(f"Updated (raw) {p} (ignored non-numeric or invalid fields)")
@@ -2053,8 +957,7 @@ class App:
             self.yaml_obj["state"]=merged
         else:
             self.yaml_obj=merged
-        self.yaml_text.delete("1.0","end")
-        self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        self._mark_yaml_dirty()
         self.log(f"Injected _DECODED_ITEMS for {len(decoded)} serial(s).")
 
     # YAML tab
@@ -2071,10 +974,9 @@ class App:
                 return
             t = _Path(f).read_text(encoding='utf-8', errors='ignore')
             if getattr(self, 'yaml_text', None):
-                self.yaml_text.delete('1.0','end')
-                self.yaml_text.insert('1.0', t)
+                self._set_yaml_text(t)
             try:
-                self.yaml_obj = yaml.load(t, Loader=get_yaml_loader()) if yaml is not None else None
+                self.yaml_obj = load_yaml_lazy(t) if yaml is not None else None
             except Exception as e:
                 self.log(f'YAML parse note: {e}')
         def _yaml_cmd_encrypt():
@@ -2088,15 +990,16 @@ class App:
             uid = (self.user_id.get() or '').strip() if hasattr(self,'user_id') else ''
             if not uid:
                 return mb.showerror('Missing User ID','Enter your User ID first.')
-            txt = self.yaml_text.get('1.0','end') if getattr(self,'yaml_text',None) else ''
-            obj = yaml.load(txt, Loader=get_yaml_loader())
-            obj = extract_and_encode_serials_from_yaml(obj)
-            yb = yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).encode()
+            if getattr(self,'yaml_text',None): self._sync_yaml_text()
+            txt = self.yaml_text.get('1.0','end-1c') if getattr(self,'yaml_text',None) else ''
+            plat = (getattr(self, 'platform', None) or 'epic').lower()
+            same = self._unchanged_payload(txt, plat, uid)   # unedited: the decrypted save, byte for byte
+            obj = yaml_text_to_save_obj(txt) if same is None else None
             dest = fd.asksaveasfilename(defaultextension='.sav', filetypes=[('BL4 Save','.sav')])
             if not dest:
                 return
-            plat = (getattr(self, 'platform', None) or 'epic').lower()
-            _Path(dest).write_bytes(encrypt_from_yaml(yb, plat, uid))
+            if same is not None: write_save_bytes(_Path(dest), same)
+            else: write_encrypted_save(_Path(dest), obj, plat, uid, **self._encrypt_options())
             try:
                 mb.showinfo('Done', f'Saved {dest}')
             except Exception:
@@ -2134,12 +1037,10 @@ class App:
             return mb.showerror("Missing dependency","PyYAML is required.\nInstall with: pip install pyyaml")
         uid = self.user_id.get().strip()
         if not uid: return mb.showerror("Missing User ID","Enter your User ID before decrypting profile")
-        enc=self.profile_path.read_bytes()
         try:
-            plain, plat = decrypt_auto(enc, uid)
-            ts=time.strftime("%Y-%m-%d-%H%M"); backup=self.profile_path.with_suffix(f".{ts}.bak"); backup.write_bytes(enc)
+            (plain, plat, backup), self._profile_original = open_save_file(self.profile_path, uid)
             self.profile_platform = plat
-            self.profile_obj = yaml.load(plain.decode("utf-8","ignore"), Loader=get_yaml_loader())
+            self.profile_obj = load_yaml_lazy(plain.decode("utf-8","ignore"))
             self.log(f"[Profile] Decrypted OK (platform: {plat}) — Backup: {backup.name}")
             # Preview unlockables categories count
             unl = (self.profile_obj or {}).get("unlockables") or {}
@@ -2186,50 +1087,8 @@ class App:
         if not self.unlock_profile_var.get():
             self.log("[Profile] Unlocks (Profile) is OFF — skipping"); return 0
 
-        catalog_csv = self._load_external_catalog()
-        catalog = {}
-        for k, v in (EMBEDDED_PROFILE_UNLOCKS.items() if isinstance(EMBEDDED_PROFILE_UNLOCKS, dict) else []):
-            catalog[k] = list(v)
-        for k, lst in (catalog_csv.items() if isinstance(catalog_csv, dict) else []):
-            if k not in catalog: catalog[k] = []
-            merged = set(map(str, catalog[k]))
-            for e in lst or []:
-                merged.add(str(e))
-            catalog[k] = sorted(merged)
-
-        added = 0
-        per_cat_added = []
-        caseflex_cats = {"unlockable_echo4","unlockable_darksiren","unlockable_paladin",
-                         "unlockable_gravitar","unlockable_exosoldier","unlockable_weapons"}
-                                            
-
-        for cat_key, entries in (catalog.items() if isinstance(catalog, dict) else []):
-            try:
-                ent_list = self._profile_ensure_cat(cat_key)
-                before = set(map(str, ent_list))
-
-                expanded = []
-                if cat_key in caseflex_cats:
-                    for e in (entries or []):
-                        expanded.extend(self._normalize_unlock_variants(e))
-                else:
-                    expanded = list(entries or [])
-
-                new_items = [x for x in expanded if x not in before]
-                if new_items:
-                    seen, ordered = set(), []
-                    for x in new_items:
-                        if x not in seen:
-                            seen.add(x); ordered.append(x)
-                    ent_list.extend(ordered)
-                    added += len(ordered)
-                    sample = ", ".join(ordered[:5])
-                    self.log(f"[Profile] {cat_key}: wrote {len(ordered)} entries → {sample}")
-            except Exception as e:
-                self.log(f"[Profile] Could not apply '{cat_key}': {e}")
-
-        if per_cat_added:
-            self.log("[Profile] Added → " + " | ".join(per_cat_added))
+        catalog = merge_unlock_catalogs(EMBEDDED_PROFILE_UNLOCKS, self._load_external_catalog())
+        added = apply_profile_unlocks(self.profile_obj, catalog, log=self.log)
         self.log(f"[Profile] Unlocks applied: +{added} entries")
         return added
 
@@ -2244,10 +1103,12 @@ class App:
 
         try:
             self._apply_profile_unlocks()
-            yb = yaml.safe_dump(self.profile_obj, sort_keys=False, allow_unicode=True).encode()
-            out = self.profile_path.with_suffix(".sav")
-            out.write_bytes(encrypt_from_yaml(yb, self.profile_platform or "epic", uid))
-            self.log(f"[Profile] Encrypted → {out.name}")
+            out = self.profile_path.with_suffix(".sav"); plat = self.profile_platform or "epic"
+            # untouched lazy sections dump verbatim, so this check is cheap; it matches when no unlocks were added
+            same = unchanged_payload(self._profile_original, dump_yaml(self.profile_obj), plat, uid, **self._encrypt_options())
+            if same is not None: write_save_bytes(out, same)
+            else: write_encrypted_save(out, self.profile_obj, plat, uid, **self._encrypt_options())
+            self.log(f"[Profile] Encrypted → {out.name}" + (" (unchanged)" if same is not None else ""))
             mb.showinfo("Done", f"Saved {out.name}")
         except Exception as e:
             mb.showerror("Profile Encrypt Failed", str(e)); self.log(f"[Profile] Encrypt error: {e}")
@@ -2262,69 +1123,27 @@ class App:
 # (see comment block above for details)
 # ========================
 from pathlib import Path as _Path031a
-import re as _re031a
 
-_CHAR_CATS_031a = ["unlockable_darksiren","unlockable_paladin","unlockable_gravitar","unlockable_exosoldier"]
-_ECHO_CAT_031a = "unlockable_echo4"
+from bl4.unlocks import (
+    ECHO_UNLOCK_CATEGORY as _ECHO_CAT_031a, migrate_unlockables_to_domains, mirror_echo_skins,
+    normalize_unlock_variants as _normalize_unlock_variants_031a, profile_unlock_entries, unlockables_root,
+)
 
 def _unlockables_root_031a(self):
-    if self.profile_obj is None:
-        raise RuntimeError("Profile not loaded")
-    return (self.profile_obj
-            .setdefault("domains", {})
-            .setdefault("local", {})
-            .setdefault("unlockables", {}))
+    return unlockables_root(self.profile_obj)
 
 def _profile_ensure_cat_031a(self, key: str):
-    unl = _unlockables_root_031a(self)
-    cat = unl.setdefault(key, {})
-    ent = cat.setdefault("entries", [])
-    if not isinstance(ent, list):
-        cat["entries"] = ent = []
-    return ent
+    return profile_unlock_entries(self.profile_obj, key)
 
 def _migrate_unlockables_to_domains_031a(self):
     try:
-        if not isinstance(self.profile_obj, dict):
-            return
-        legacy = self.profile_obj.get("unlockables")
-        target = _unlockables_root_031a(self)
-        if isinstance(legacy, dict):
-            for cat, obj in legacy.items():
-                if not isinstance(obj, dict):
-                    continue
-                tgt_cat = target.setdefault(cat, {})
-                tgt_list = tgt_cat.setdefault("entries", [])
-                src_list = obj.get("entries") or []
-                seen = set(map(str, tgt_list))
-                for e in map(str, src_list):
-                    if e not in seen:
-                        tgt_list.append(e); seen.add(e)
-            self.profile_obj.pop("unlockables", None)
+        if migrate_unlockables_to_domains(self.profile_obj):
             try: self.log("[Profile] Migrated top-level 'unlockables' → domains/local (legacy removed)")
             except Exception: pass
     except Exception as e:
         try: self.log(f"[Profile] Migration note: {e}")
         except Exception: pass
 
-def _normalize_unlock_variants_031a(entry: str):
-    e = str(entry)
-    out = {e}
-    if "." in e:
-        prefix, rest = e.split(".", 1)
-        out.add(prefix + "." + rest.lower())
-    out.add(e.lower())
-    return list(out)
-
-def _extract_echo_skins_031a(echo_entries):
-    pat = _re031a.compile(r'^Unlockable_Echo4\.Skin(\d+)_([A-Za-z0-9_]+)$', _re031a.I)
-    pairs = set()
-    for s in map(str, echo_entries or []):
-        m = pat.match(s) or pat.match(s.lower().replace("unlockable_echo4.","Unlockable_Echo4."))
-        if m:
-            pairs.add( (int(m.group(1)), m.group(2)) )
-    return pairs
-
 App._unlockables_root = _unlockables_root_031a
 App._profile_ensure_cat = _profile_ensure_cat_031a
 App._migrate_unlockables_to_domains = _migrate_unlockables_to_domains_031a
@@ -2356,20 +1175,9 @@ if hasattr(App, "_apply_profile_unlocks"):
         added = _orig_apply_profile_unlocks_031a(self, *a, **kw)
 
         try:
-            echo_list = _profile_ensure_cat_031a(self, _ECHO_CAT_031a)
-            echo_pairs = _extract_echo_skins_031a(echo_list)
-            if echo_pairs:
-                for cat in _CHAR_CATS_031a:
-                    prefix = cat.replace("unlockable_","Unlockable_")
-                    dest = _profile_ensure_cat_031a(self, cat)
-                    already = set(map(str, dest))
-                    for idx, suf in sorted(echo_pairs):
-                        token = f"{prefix}.Skin{idx}_{suf}"
-                        for v in _normalize_unlock_variants_031a(token):
-                            if v not in already:
-                                dest.append(v)
-                                already.add(v)
-                try: self.log(f"[Profile] Parity fill: mirrored {len(echo_pairs)} Echo skin indices → all characters")
+            mirrored = mirror_echo_skins(self.profile_obj)
+            if mirrored:
+                try: self.log(f"[Profile] Parity fill: mirrored {mirrored} Echo skin indices → all characters")
                 except Exception: pass
         except Exception as e:
             try: self.log(f"[Profile] Parity fill note: {e}")
@@ -2401,9 +1209,8 @@ if hasattr(App, "_apply_profile_unlocks"):
 
 if not hasattr(App, "dump_yaml"):
     def dump_yaml_031a(self):
-        import yaml as _yaml031a
         p = _Path031a(self.profile_path or ".").with_name("profile_decrypted.yaml")
-        txt = _yaml031a.safe_dump(self.profile_obj, sort_keys=False, allow_unicode=True)
+        txt = dump_yaml(self.profile_obj)
         p.write_text(txt, encoding="utf-8")
         try: self.log(f"[Profile] Dumped YAML → {p}")
         except Exception: pass
@@ -2418,6 +1225,9 @@ if __name__ == "__main__":
     # DEBUG launcher additions (non-invasive)
     import sys, traceback, atexit
     DEBUG = ("--debug" in sys.argv) or ("-d" in sys.argv)
+    if DEBUG:
+        from bl4 import trace as _trace
+        _trace.enable(os.environ.get("BL4_TRACE", "").strip() or "stderr")
 
     def _bl4_excepthook(exc_type, exc, tb):
         msg = "".join(traceback.format_exception(exc_type, exc, tb))
@@ -2507,29 +1317,17 @@ def _patched_build_tab_items(self, parent: ttk.Frame)->None:
 
 def _patched_refresh_items(self)->None:
     self.items=[]
-    r=self._root()
-    if not isinstance(r, dict): return
-    # gather flags/state_flags if siblings exist
-    def get_flags_for(path):
-        try:
-            toks=tokens(path); cur=self._root() if self._root() is not None else self.yaml_obj
-            for t in toks[:-1]: cur = cur[t]
-            if isinstance(cur, dict):
-                return cur.get("flags",""), cur.get("state_flags","")
-        except Exception:
-            pass
-        return ("","")
-    for path,serial in walk_ug(r):
-        t = serial[3] if serial.startswith("@Ug") and len(serial)>=4 else "?"
+    ix=self._save_index()
+    if ix is None: return
+    cols=decode_item_serials([ref.serial for ref in ix.serials])   # one batch, no per-item objects
+    levels=cols.level.tolist(); rarities=cols.rarity.tolist()
+    for i,(path,serial,parent,_) in enumerate(ix.serials):
+        t = cols.item_type[i]
         friendly = {"r":"Weapon","e":"Equipment","d":"Equipment Alt","u":"Special","f":"Special","!":"Special"}.get(t,"Unknown")
-        try:
-            d=decode_item_serial(serial); lvl = d.stats.level or ""
-            rar = d.stats.rarity or ""
-        except Exception:
-            lvl = ""; rar = ""
-        flags, sflags = get_flags_for(path)
+        lvl = levels[i] if levels[i]>0 else ""; rar = rarities[i] if rarities[i]>0 else ""
+        flags, sflags = parent.get("flags",""), parent.get("state_flags","")   # siblings, if any
         flag_str = f"{flags}/{sflags}" if flags!="" or sflags!="" else ""
-        self.items.append((path,friendly,str(lvl),str(rar),flag_str,serial))
+        self.items.append((str(path),friendly,str(lvl),str(rar),flag_str,serial))
     self.apply_filter()
 
 def _patched_apply_filter(self)->None:
@@ -2556,7 +1354,7 @@ def _patched_open_inspector(self,_evt=None)->None:
     sel=self.tree.selection()
     if not sel: return
     p,typ,name,code,serial,tags = _safe_unpack_item_values(self.tree.item(sel[0],"values"))
-    toks=tokens(p); d=decode_item_serial(serial)
+    ipath=self._item_path(p); d=decode_item_serial(serial)
     top=tk.Toplevel(self.root); top.title("BL4 Save Editor v1.04a Full"); top.geometry("900x640"); top.configure(bg=Dark.BG)
     nb=ttk.Notebook(top); nb.pack(expand=True,fill="both")
 
@@ -2599,12 +1397,11 @@ def _patched_open_inspector(self,_evt=None)->None:
 
         root = self.yaml_obj if self._root() is self.yaml_obj else self._root()
 
-        set_by(root, toks, new_serial)
+        if not self._save_index().set_serial(ipath, new_serial): ipath.set(root, new_serial); forget_serial(serial)
         # write sibling flags
         try:
             parent=self.yaml_obj if self._root() is self.yaml_obj else self._root()
-            cur=parent
-            for t in toks[:-1]: cur=cur[t]
+            cur=ipath.parent.get(parent)
             if isinstance(cur, dict):
                 if eq_var.get(): cur["flags"]=1
                 sel=state_var.get().strip()
@@ -2613,7 +1410,7 @@ def _patched_open_inspector(self,_evt=None)->None:
                     except: pass
         except Exception: pass
 
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        self._mark_yaml_dirty(self._root_path() + ipath.parent)
         self.refresh_items(); self.log(f"Updated {p}"); top.destroy()
     ttk.Button(simp,text="Save & Encode",command=save_simple).pack(pady=10)
 
@@ -2623,7 +1420,7 @@ def _patched_open_inspector(self,_evt=None)->None:
     vsb=tk.Scrollbar(rawtab,orient="vertical",command=canvas.yview); canvas.configure(yscrollcommand=vsb.set)
     canvas.pack(side="left",fill="both",expand=True); vsb.pack(side="right",fill="y")
     inner=ttk.Frame(canvas); canvas.create_window((0,0),window=inner,anchor="nw")
-    for k,v in (d.raw or {}).items():
+    for k,v in d.raw_fields.items():
         ttk.Label(inner,text=str(k)).pack(anchor="w"); ttk.Label(inner,text=str(v)).pack(anchor="w")
     inner.update_idletasks(); canvas.config(scrollregion=canvas.bbox("all"))
 
@@ -2658,7 +1455,7 @@ def apply_progression_actions(self):
     prog=r.setdefault("progression", {})
     if self.var_max_sdu.get():
         before = sum(len(g.get("nodes",[])) for g in prog.get("graphs",[]) or [] if g.get("name")=="sdu_upgrades")
-        ensure_sdu_graph(prog)
+        ensure_sdu_graph(prog); self._save_index().refresh_graphs()
         after = sum(len(g.get("nodes",[])) for g in prog.get("graphs",[]) or [] if g.get("name")=="sdu_upgrades")
         set_nodes = max(0, after - before) if after else 60
         # recompute total points in SDU graph
@@ -2667,7 +1464,7 @@ def apply_progression_actions(self):
             if g.get("name")=="sdu_upgrades":
                 total_points = sum(int(n.get("points_spent",0)) for n in g.get("nodes",[]) if isinstance(n,dict))
         self.log(f"Applied Max SDU: set {set_nodes} of 60 nodes; total points attributed: {total_points}")
-        self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+        self._mark_yaml_dirty(*self._graph_paths(SDU_GRAPH_NAME)[:1])
         self.refresh_progression()
     else:
         self.log("Max SDU unchecked — no SDU changes applied.")
@@ -2679,7 +1476,7 @@ def _patched_recalc_pools(self):
     prog=r.setdefault("progression", {})
     if not prog and isinstance(self.yaml_obj, dict):
         prog=self.yaml_obj.setdefault("progression", {})
-    pools=prog.setdefault("point_pools", {})
+    pools=prog.setdefault("point_pools", {}); self._save_index().refresh_graphs()
     char_pts = sum_points_in_graphs(prog, name_prefixes=["Progress_DS_"])
     spec_pts = sum_points_in_graphs(prog, name_prefixes=["ProgressGraph_Specializations"])
     pools["characterprogresspoints"]=char_pts
@@ -2689,7 +1486,7 @@ def _patched_recalc_pools(self):
     except Exception:
         cap=3225
     pools["echotokenprogresspoints"]=min(int(pools.get("echotokenprogresspoints", cap) or cap), cap)
-    self.yaml_text.delete("1.0","end"); self.yaml_text.insert("1.0", yaml.safe_dump(self.yaml_obj, sort_keys=False, allow_unicode=True))
+    self._mark_yaml_dirty((self._root_path() if prog is r.get("progression") else ()) + ("progression", "point_pools"))
     self.refresh_progression(); self.log(f"Recalculated pools: char={char_pts}, spec={spec_pts}, echo={pools['echotokenprogresspoints']} (cap {cap})")
 
 # Bind patches
@@ -3807,11 +2604,10 @@ def _open_yaml_file(self):
         p = Path(path)
         txt = p.read_text(encoding="utf-8", errors="ignore")
         if getattr(self, "yaml_text", None):
-            self.yaml_text.delete("1.0", "end")
-            self.yaml_text.insert("1.0", txt)
+            self._set_yaml_text(txt)
         if 'yaml' in globals() and yaml is not None:
             try:
-                self.yaml_obj = yaml.load(txt, Loader=get_yaml_loader())
+                self.yaml_obj = load_yaml_lazy(txt)
             except Exception as e:
                 self.log(f"YAML parse note: {e}")
         self.yaml_path = p
@@ -3849,16 +2645,16 @@ def _encrypt_yaml_as_save(self):
         return
     txt = ""
     if getattr(self, "yaml_text", None):
-        txt = self.yaml_text.get("1.0", "end")
+        self._sync_yaml_text(); txt = self.yaml_text.get("1.0", "end-1c")
     elif getattr(self, "yaml_path", None):
         try:
             txt = Path(self.yaml_path).read_text(encoding="utf-8", errors="ignore")
         except Exception:
             txt = ""
+    plat = (getattr(self, "platform", None) or "epic").lower()
+    same = self._unchanged_payload(txt, plat, uid)
     try:
-        obj = yaml.load(txt, Loader=get_yaml_loader())
-        obj = extract_and_encode_serials_from_yaml(obj)
-        yb = yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).encode()
+        obj = yaml_text_to_save_obj(txt) if same is None else None
     except Exception as e:
         try:
             mb.showerror("Invalid YAML", f"Fix YAML before encrypting:\n{e}")
@@ -3873,9 +2669,11 @@ def _encrypt_yaml_as_save(self):
             return
         out = Path(dest)
     try:
-        plat = (getattr(self, "platform", None) or "epic").lower()
-        out.write_bytes(encrypt_from_yaml(yb, plat, uid))
-        self.log(f"Encrypted → {out.name}")
+        if same is not None:
+            write_save_bytes(out, same)
+        else:
+            write_encrypted_save(out, obj, plat, uid, **self._encrypt_options())
+        self.log(f"Encrypted → {out.name}" + (" (YAML unchanged)" if same is not None else ""))
         try:
             mb.showinfo("Done", f"Saved {out.name}")
         except Exception:
@@ -3906,11 +2704,10 @@ def __ensure_yaml_methods__():
                 p = Path(path)
                 txt = p.read_text(encoding="utf-8", errors="ignore")
                 if getattr(self, "yaml_text", None):
-                    self.yaml_text.delete("1.0", "end")
-                    self.yaml_text.insert("1.0", txt)
+                    self._set_yaml_text(txt)
                 if 'yaml' in globals() and yaml is not None:
                     try:
-                        self.yaml_obj = yaml.load(txt, Loader=get_yaml_loader())
+                        self.yaml_obj = load_yaml_lazy(txt)
                     except Exception as e:
                         try: self.log(f"YAML parse note: {e}")
                         except Exception: pass
@@ -3945,16 +2742,16 @@ def __ensure_yaml_methods__():
                 return
             txt = ""
             if getattr(self, "yaml_text", None):
-                txt = self.yaml_text.get("1.0", "end")
+                self._sync_yaml_text(); txt = self.yaml_text.get("1.0", "end-1c")
             elif getattr(self, "yaml_path", None):
                 try:
                     txt = Path(self.yaml_path).read_text(encoding="utf-8", errors="ignore")
                 except Exception:
                     txt = ""
+            plat = (getattr(self, "platform", None) or "epic").lower()
+            same = self._unchanged_payload(txt, plat, uid)
             try:
-                obj = yaml.load(txt, Loader=get_yaml_loader())
-                obj = extract_and_encode_serials_from_yaml(obj)
-                yb = yaml.safe_dump(obj, sort_keys=False, allow_unicode=True).encode()
+                obj = yaml_text_to_save_obj(txt) if same is None else None
             except Exception as e:
                 try:
                     mb.showerror("Invalid YAML", f"Fix YAML before encrypting:\n{e}")
@@ -3969,9 +2766,11 @@ def __ensure_yaml_methods__():
                     return
                 out = Path(dest)
             try:
-                plat = (getattr(self, "platform", None) or "epic").lower()
-                out.write_bytes(encrypt_from_yaml(yb, plat, uid))
-                try: self.log(f"Encrypted → {out.name}")
+                if same is not None:
+                    write_save_bytes(out, same)
+                else:
+                    write_encrypted_save(out, obj, plat, uid, **self._encrypt_options())
+                try: self.log(f"Encrypted → {out.name}" + (" (YAML unchanged)" if same is not None else ""))
                 except Exception: pass
                 try:
                     mb.showinfo("Done", f"Saved {out.name}")
@@ -4013,58 +2812,6 @@ def decode_items(save_dict):
     return results
 
 
-def set_by(root, toks, value):
-    # Walk a yaml/dict/list structure following tokens that can include indexes like "items[75]".
-    # Auto-creates dict/list containers as needed and extends lists for out-of-range indexes.
-    import re as _re
-    cur = root
-    for raw in toks[:-1]:
-        m = _re.match(r"^([^\[\]]+)(?:\[(\d+)\])?$", str(raw))
-        if not m:
-            key = str(raw)
-            if isinstance(cur, dict):
-                if key not in cur or cur[key] is None:
-                    cur[key] = {}
-                cur = cur[key]
-            else:
-                raise KeyError(raw)
-        else:
-            key, idx = m.group(1), m.group(2)
-            if idx is None:
-                if not isinstance(cur, dict):
-                    raise KeyError(raw)
-                if key not in cur or cur[key] is None:
-                    cur[key] = {}
-                cur = cur[key]
-            else:
-                if not isinstance(cur, dict):
-                    raise KeyError(raw)
-                if key not in cur or cur[key] is None or not isinstance(cur[key], list):
-                    cur[key] = []
-                lst = cur[key]
-                i = int(idx)
-                while len(lst) <= i:
-                    lst.append({})
-                cur = lst[i]
-    last = str(toks[-1])
-    m = _re.match(r"^([^\[\]]+)(?:\[(\d+)\])?$", last)
-    if m and m.group(2) is not None:
-        key, idx = m.group(1), int(m.group(2))
-        if key not in cur or not isinstance(cur[key], list):
-            cur[key] = []
-        lst = cur[key]
-        while len(lst) <= idx:
-            lst.append(None)
-        lst[idx] = value
-    else:
-        if isinstance(cur, dict):
-            cur[last] = value
-        else:
-            raise KeyError(last)
-    return root
-
-
-
 def _simple_name_from_serial(serial: str) -> str:
     s = str(serial or "").strip()
     if not s.startswith("@Ug"):
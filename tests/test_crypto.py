@@ -0,0 +1,98 @@
+import io
+import json
+import random
+import zlib
+
+import pytest
+import yaml
+
+from bl4 import trace
+from bl4.crypto import EncryptWriter, PUBLIC_KEY, _PAR_BLOCK, decrypt_auto, encrypt_from_yaml, rekey
+
+EPIC = "0123456789abcdef0123456789abcdef"
+STEAM = "76561198000000000"
+USERS = {"epic": EPIC, "steam": STEAM}
+
+
+def _reference_encrypt(yb, platform, user_id):
+    """The original one-shot encrypt: zlib level 9, Adler-32/length trailer, PKCS7, AES-ECB."""
+    AES = pytest.importorskip("Crypto.Cipher.AES")
+    key = bytearray(PUBLIC_KEY)
+    if platform == "epic":
+        for i, b in enumerate(user_id.encode("utf-16le")[:len(key)]): key[i] ^= b
+    else:
+        for i, b in enumerate(int(user_id).to_bytes(8, "little")): key[i % len(key)] ^= b
+    trailer = zlib.adler32(yb).to_bytes(4, "big" if platform == "epic" else "little") + len(yb).to_bytes(4, "little")
+    pt = zlib.compress(yb, 9) + trailer
+    n = 16 - len(pt) % 16
+    return AES.new(bytes(key), AES.MODE_ECB).encrypt(pt + bytes((n,)) * n)
+
+
+def _save_yaml(n_items, seed=1):
+    rnd = random.Random(seed)
+    items = {f"slot_{i}": {"serial": "@Ugr" + "".join(rnd.choice("ABCDEFGHxyz0123+/") for _ in range(40)),
+                           "flags": rnd.randrange(4), "state_flags": 513} for i in range(n_items)}
+    doc = {"state": {"class": "Char_DarkSiren", "currencies": {"cash": 12345}, "inventory": {"backpack": items}}}
+    return yaml.safe_dump(doc, sort_keys=False).encode()
+
+
+SMALL = _save_yaml(200)
+LARGE = _save_yaml(8000)   # many stream chunks (and parallel deflate blocks)
+
+
+@pytest.mark.parametrize("platform", ["epic", "steam"])
+@pytest.mark.parametrize("yb", [SMALL, LARGE], ids=["small", "large"])
+def test_decrypt_reference_save(platform, yb):
+    assert decrypt_auto(_reference_encrypt(yb, platform, USERS[platform]), USERS[platform]) == (yb, platform)
+
+
+@pytest.mark.parametrize("platform", ["epic", "steam"])
+@pytest.mark.parametrize("yb", [SMALL, LARGE], ids=["small", "large"])
+def test_encrypt_is_byte_identical_to_reference(platform, yb):
+    enc = _reference_encrypt(yb, platform, USERS[platform])
+    assert encrypt_from_yaml(yb, platform, USERS[platform]) == enc
+    buf = io.BytesIO()
+    with EncryptWriter(buf, platform, USERS[platform]) as w:   # small writes, as the YAML emitter does
+        for i in range(0, len(yb), 1000): w.write(yb[i:i + 1000])
+    assert buf.getvalue() == enc
+
+
+def test_rekey_round_trips_between_platforms():
+    enc = _reference_encrypt(SMALL, "epic", EPIC)
+    steam = rekey(enc, EPIC, "steam", STEAM)
+    assert steam == _reference_encrypt(SMALL, "steam", STEAM)
+    assert rekey(steam, STEAM, "epic", EPIC) == enc
+
+
+@pytest.mark.parametrize("platform", ["epic", "steam"])
+def test_parallel_encrypt_round_trips(platform):
+    uid = USERS[platform]
+    assert len(LARGE) > 4 * _PAR_BLOCK
+    enc = encrypt_from_yaml(LARGE, platform, uid, 9, 4)
+    assert decrypt_auto(enc, uid) == (LARGE, platform)
+    assert encrypt_from_yaml(LARGE, platform, uid, 9, 4) == enc   # deterministic
+    buf = io.BytesIO()
+    with EncryptWriter(buf, platform, uid, 9, 4) as w:   # block cuts don't depend on the write sizes
+        for i in range(0, len(LARGE), 1000): w.write(LARGE[i:i + 1000])
+    assert buf.getvalue() == enc
+    # the trailer and padding match the single-threaded save
+    assert len(enc) % 16 == 0 and rekey(enc, uid, platform, uid) == enc
+
+
+@pytest.mark.parametrize("threads", [1, None])
+def test_small_saves_stay_single_threaded(threads):
+    assert encrypt_from_yaml(SMALL, "epic", EPIC, 9, threads) == _reference_encrypt(SMALL, "epic", EPIC)
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+def test_encrypt_span_ends_with_error(capsys, threads):
+    trace.enable("stdout")
+    try:
+        with pytest.raises(KeyError):
+            with EncryptWriter(io.BytesIO(), "epic", EPIC, 9, threads) as w:
+                w.write(b"x" * 300000)
+                raise KeyError("boom")
+    finally:
+        trace.disable()
+    spans = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(s["span"], s["error"]) for s in spans] == [("encrypt", "KeyError: 'boom'")]
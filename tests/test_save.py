@@ -0,0 +1,35 @@
+from bl4.batch import encrypt_file, rekey_file
+from bl4.crypto import decrypt_auto, encrypt_from_yaml
+from bl4.save import write_backup
+
+EPIC = "0123456789abcdef0123456789abcdef"
+STEAM = "76561198000000000"
+YAML = b"state:\n  char_name: Vex\n  currencies:\n    cash: 12345\n"
+
+
+def test_backups_never_overwrite(tmp_path):
+    path = tmp_path / "1.sav"
+    baks = [write_backup(path, bytes([i])) for i in range(3)]
+    assert len(set(baks)) == 3
+    assert [b.read_bytes() for b in baks] == [b"\x00", b"\x01", b"\x02"]
+
+
+def test_rekey_file_replaces_save_and_keeps_backup(tmp_path):
+    path = tmp_path / "1.sav"
+    enc = encrypt_from_yaml(YAML, "epic", EPIC)
+    path.write_bytes(enc)
+    res = rekey_file(str(path), EPIC, "steam", STEAM)
+    assert res.ok, res.message
+    assert decrypt_auto(path.read_bytes(), STEAM) == (YAML, "steam")
+    assert [p.read_bytes() for p in tmp_path.glob("1.*.bak")] == [enc]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_encrypt_file_keeps_the_existing_saves_platform(tmp_path):
+    (tmp_path / "1.sav").write_bytes(encrypt_from_yaml(YAML, "steam", STEAM))
+    (tmp_path / "1.yaml").write_bytes(YAML)
+    res = encrypt_file(str(tmp_path / "1.yaml"), STEAM, backup=False)
+    assert res.ok, res.message
+    assert decrypt_auto((tmp_path / "1.sav").read_bytes(), STEAM) == (YAML, "steam")
+    res = encrypt_file(str(tmp_path / "1.yaml"), EPIC, backup=False)   # neither key fits the old save
+    assert not res.ok
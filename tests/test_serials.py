@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from bl4 import serials
+from bl4.serials import (
+    _ALPHABET, bit_pack_decode, bit_pack_encode, decode_item_serial, decode_item_serials, encode_item_serial,
+)
+
+
+# ── The bit-string codec the lookup tables replaced, kept as the reference ─────
+def _old_bit_pack_decode(serial):
+    payload = serial[3:] if serial.startswith("@Ug") else serial
+    cmap = {c: i for i, c in enumerate(_ALPHABET)}
+    bits = "".join(format(cmap.get(c, 0), "06b") for c in payload if c in cmap)
+    bits += "0" * ((8 - (len(bits) % 8)) % 8)
+    return bytes(int(bits[i:i + 8], 2) for i in range(0, len(bits), 8))
+
+
+def _old_bit_pack_encode(data, prefix):
+    bits = "".join(format(byte, "08b") for byte in data)
+    bits += "0" * ((6 - (len(bits) % 6)) % 6)
+    return prefix + "".join(_ALPHABET[int(bits[i:i + 6], 2)] for i in range(0, len(bits), 6))
+
+
+def _old_extract_fields(b):
+    fields = {}
+    if len(b) >= 4:
+        fields["header_le"] = int.from_bytes(b[:4], "little")
+        fields["header_be"] = int.from_bytes(b[:4], "big")
+    if len(b) >= 8:
+        fields["field2_le"] = int.from_bytes(b[4:8], "little")
+    if len(b) >= 12:
+        fields["field3_le"] = int.from_bytes(b[8:12], "little")
+    stats_16 = []
+    for i in range(0, min(len(b) - 1, 20), 2):
+        val = int.from_bytes(b[i:i + 2], "little")
+        fields[f"val16_at_{i}"] = val
+        if 100 <= val <= 10000:
+            stats_16.append((i, val))
+    fields["potential_stats"] = stats_16
+    flags = []
+    for i in range(min(len(b), 20)):
+        fields[f"byte_{i}"] = b[i]
+        if b[i] < 100:
+            flags.append((i, b[i]))
+    fields["potential_flags"] = flags
+    return fields
+
+
+def _serials(n=400, seed=7):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        body = [rnd.choice(_ALPHABET) for _ in range(rnd.randint(0, 70))]
+        if rnd.random() < 0.1:   # characters outside the alphabet are dropped
+            body.insert(rnd.randint(0, len(body)), rnd.choice(" .é\n"))
+        out.append("@Ug" + rnd.choice("redwuf!?") + "".join(body))
+    return out
+
+
+SERIALS = _serials()
+
+
+def test_bit_pack_decode_matches_reference():
+    for s in SERIALS + ["", "@Ug", "no prefix", "@Ugr" + _ALPHABET]:
+        assert bit_pack_decode(s) == _old_bit_pack_decode(s), s
+
+
+def test_bit_pack_encode_matches_reference():
+    rnd = random.Random(3)
+    for n in range(0, 80):
+        data = bytes(rnd.randrange(256) for _ in range(n))
+        assert bit_pack_encode(data, "@Ugr") == _old_bit_pack_encode(data, "@Ugr")
+
+
+def _same_as_per_item(cols, serials_):
+    assert len(cols) == len(serials_)
+    for i, s in enumerate(serials_):
+        d = decode_item_serial(s)
+        assert (cols.item_type[i], cols.category[i], cols.confidence[i], cols.value("length", i)) == \
+            (d.item_type, d.item_category, d.confidence, d.length)
+        for name in ("primary_stat", "secondary_stat", "level", "rarity", "manufacturer", "item_class"):
+            assert cols.value(name, i) == getattr(d.stats, name), (s, name)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_decode_item_serials_matches_per_item(monkeypatch, vectorized):
+    if vectorized and serials._numpy() is None:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(serials, "_np", serials._np if vectorized else False)
+    _same_as_per_item(decode_item_serials(SERIALS), SERIALS)
+    assert len(decode_item_serials([])) == 0
+
+
+def test_cached_decodes_match_fresh_ones(monkeypatch):
+    monkeypatch.setattr(serials, "SERIAL_CACHE", serials.SerialCache(64))
+    decode_item_serials(SERIALS)
+    before = serials.SERIAL_CACHE.info()["hits"]
+    _same_as_per_item(decode_item_serials(SERIALS), SERIALS)   # the last 64 come from the cache
+    assert serials.SERIAL_CACHE.info()["hits"] > before
+    d = decode_item_serial(SERIALS[-1]); d.stats.level = 999
+    assert decode_item_serial(SERIALS[-1]).stats.level != 999   # edits don't leak into the cache
+
+
+def test_decode_item_serial_matches_reference():
+    for s in SERIALS:
+        d, b = decode_item_serial(s), _old_bit_pack_decode(s)
+        assert d.data == b and d.length == len(b)
+        assert dict(d.raw_fields) == _old_extract_fields(b)
+        assert encode_item_serial(d) == _old_bit_pack_encode(b, s[:4] if len(s) >= 4 else "@Ug")
@@ -0,0 +1,88 @@
+import io
+
+import pytest
+import yaml
+
+from bl4.crypto import decrypt_auto
+from bl4.save import dump_encrypted, load_yaml_text
+from bl4.yamlio import LazyMapping, dump_yaml, load_yaml_lazy
+
+DOC = "a: 1\nstate:\n  b: 2\n  cc: hello\n"
+
+
+def test_bom_document_loads_like_eager():
+    text = "\ufeff" + DOC
+    lazy = load_yaml_lazy(text)
+    assert isinstance(lazy, LazyMapping)
+    assert lazy == {"a": 1, "state": {"b": 2, "cc": "hello"}}
+
+
+def test_bom_document_dumps_unchanged():
+    text = "\ufeff" + DOC
+    assert dump_yaml(load_yaml_lazy(text)) == text
+    loaded = load_yaml_lazy(text)
+    loaded["state"]["cc"]   # loaded, not edited
+    assert dump_yaml(loaded) == text
+
+
+def test_bom_document_edit_splices():
+    doc = load_yaml_lazy("\ufeff" + DOC)
+    doc["state"]["b"] = 5
+    assert dump_yaml(doc) == "\ufeffa: 1\nstate:\n  b: 5\n  cc: hello\n"
+
+
+HAND = """# header comment
+state:
+  name: 'Vex'   # quoted
+  list: [1, 2, 3]
+  nested:
+    a: 1
+progression:
+  graphs:
+  - name: G
+    nodes: {x: 1}
+tail: 5
+"""
+
+
+def _read_all(obj):
+    if isinstance(obj, dict):
+        for v in obj.values(): _read_all(v)
+    elif isinstance(obj, list):
+        for v in obj: _read_all(v)
+
+
+@pytest.mark.parametrize("text", [HAND, dump_yaml({"state": {"inventory": {f"slot_{i}": {"serial": f"@Ugr{i}", "flags": i}
+                                                                        for i in range(50)}}, "stats": [1, 2]})],
+                         ids=["hand-written", "dumped"])
+def test_lazy_dump_is_byte_identical(text):
+    doc = load_yaml_lazy(text)
+    assert dump_yaml(doc) == text
+    _read_all(doc)   # every section built, none edited
+    assert dump_yaml(doc) == text
+    out = io.StringIO(); dump_yaml(doc, out)
+    assert out.getvalue() == text
+
+
+def test_lazy_edit_keeps_other_lines():
+    doc = load_yaml_lazy(HAND)
+    doc["progression"]["graphs"][0]["name"] = "H"
+    out = dump_yaml(doc)
+    assert out == HAND.replace("- name: G", "- name: H")
+    assert yaml.safe_load(out) == {**yaml.safe_load(HAND), "progression": {"graphs": [{"name": "H", "nodes": {"x": 1}}]}}
+
+
+def test_lazy_save_encrypts_to_original_plaintext():
+    pytest.importorskip("Crypto")
+    epic = "0123456789abcdef0123456789abcdef"
+    buf = io.BytesIO()
+    dump_encrypted(load_yaml_text(HAND), buf, "epic", epic)
+    assert decrypt_auto(buf.getvalue(), epic) == (HAND.encode(), "epic")
+
+
+def test_emptied_mappings_dump_as_empty_mappings():
+    d = load_yaml_lazy("a: 1\nstate:\n  s0: 2\n")
+    del d["state"]["s0"]
+    assert dump_yaml(d) == "a: 1\nstate: {}\n"
+    d.clear()
+    assert yaml.safe_load(dump_yaml(d)) == {}
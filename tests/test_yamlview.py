@@ -0,0 +1,54 @@
+import yaml
+
+from bl4.yamlio import dump_yaml
+from bl4.yamlview import LineIndex
+
+
+def _apply(text, root, path):
+    idx = LineIndex(text)
+    start, end, new = idx.splice(root, path)
+    lines = text.splitlines(True)
+    return "".join(lines[:start]) + new + "".join(lines[end:]), idx
+
+
+def test_splice_int_keyed_mapping_entry():
+    root = {"levels": {1: {"xp": 10}, 2: {"xp": 20}}, "items": [{"a": 1}, {"a": 2}]}
+    text = dump_yaml(root)
+    root["levels"][2]["bonus"] = 5
+    out, idx = _apply(text, root, ("levels", 2))
+    assert out == dump_yaml(root)
+    assert yaml.safe_load(out) == root
+    assert idx.span(("levels", 2, "bonus")) is not None
+
+
+def test_splice_sequence_item():
+    root = {"items": [{"a": 1}, {"a": 2}]}
+    text = dump_yaml(root)
+    root["items"][1] = {"a": 3, "b": 4}
+    out, idx = _apply(text, root, ("items", 1))
+    assert out == dump_yaml(root)
+    assert idx.span(("items", 1, "b")) is not None
+
+
+def test_splice_inserts_added_keys_after_their_siblings():
+    root = {"state": {"class": "X", "world": {"map": 1}}, "tail": [1, 2]}
+    text = dump_yaml(root)
+    idx = LineIndex(text)
+    for path, add in ((("state", "character", "class"), lambda: root["state"].setdefault("character", {"class": "Y"})),
+                      (("character", "class"), lambda: root.setdefault("character", {"class": "Y"}))):
+        add()
+        start, end, new = idx.splice(root, path)
+        assert start == end and new.count("\n") == 2   # just the new lines
+        lines = text.splitlines(True)
+        text = "".join(lines[:start]) + new + "".join(lines[end:])
+        assert text == dump_yaml(root)
+        fresh = LineIndex(text)
+        assert (idx.paths, idx.starts, idx.ends, idx.total) == (fresh.paths, fresh.starts, fresh.ends, fresh.total)
+
+
+def test_splice_rerenders_parent_when_added_key_is_not_last():
+    root = {"state": {"a": 1, "b": 2}}
+    text = dump_yaml(root)
+    root["state"] = {"a": 1, "new": 0, "b": 2}
+    out, _ = _apply(text, root, ("state", "new"))
+    assert out == dump_yaml(root)